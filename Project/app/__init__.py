@@ -1,20 +1,52 @@
+import logging
+import click
 from flask import Flask
+from flask.cli import with_appcontext
 from flask_wtf import CSRFProtect
 from flask_sqlalchemy import SQLAlchemy
 
-app = Flask(__name__)
-app.config['SECRET_KEY'] = '12345'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///draft.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['MAX_PLAYERS'] = 32
-app.config['MAX_MATCHES'] = 10
+# The extensions are created once and bound to each app in create_app(), so modules can keep using `from app import db`.
+db = SQLAlchemy()
+csrf = CSRFProtect()
 
-db = SQLAlchemy(app)
-csrf = CSRFProtect(app)
 
-from app import routes, models
+def create_app(config=None):
+    """Build the app. config is a config name, class or dictionary of settings (see app/config.py).
 
-# create db tables
-with app.app_context():
+    Nothing here opens the database or touches the schema, so starting a
+    worker (or a test app) is cheap. Run `flask init-db` once to create or
+    upgrade the tables.
+    """
+    from app import config as settings, database, instrumentation, ratings, archive
+    from app.routes import bp
+
+    app = Flask(__name__)
+    settings.load(app.config, config)
+    app.logger.setLevel(logging.INFO) # Show the structured timing records (logger 'app.metrics').
+
+    db.init_app(app)
+    csrf.init_app(app)
+    app.register_blueprint(bp)
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(ratings.recompute_ratings_command)
+    app.cli.add_command(archive.export_archive_command)
+
+    with app.app_context():
+        database.configure_engine(app, db.engine)
+        instrumentation.install(app, db.engine)
+    return app
+
+
+def init_db():
+    """Create any missing tables and bring an existing database up to date. Safe to run again."""
+    from app import models, migrations
     db.create_all()
-    
\ No newline at end of file
+    migrations.upgrade()
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create the database tables, or upgrade an existing database."""
+    init_db()
+    click.echo("Database is up to date.")
@@ -0,0 +1,339 @@
+"""Compressed, append-only archive of the matches pruned from the history.
+
+prune_history() deletes the oldest matches in batches so the match, court
+and court_player tables stay small. With ARCHIVE_ENABLED each batch is
+written here first, as one gzip member appended to the current segment file
+(segment-000001.jsonl.gz, ...) holding one JSON line per match. A segment is
+closed once it is ARCHIVE_SEGMENT_MAX_BYTES long. Every batch also gets one
+line in index.jsonl with where it is stored, its first and last match date
+and the ids of the players in it, so a query only decompresses the batches
+that can match.
+
+Writing happens in two steps around the database transaction, so no file
+I/O is done while the database write lock is held: stage_matches() appends
+the block and records its index line in a pending-*.json file, then once
+the DELETE is committed publish() moves that line into index.jsonl (or
+discard() drops it if the DELETE was rolled back). A block without an index
+line is never read. The DELETE's transaction also records the batch in the
+archive_batch table, which tells a later prune what to do with a pending
+line whose prune stopped halfway.
+
+Nothing is ever rewritten, and a segment is an ordinary gzip file
+(`zcat segment-*.jsonl.gz` prints every archived match). Reading goes through
+generators that hold one batch at a time, so years of results can be scanned
+in constant memory without touching the ORM.
+"""
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from app import db
+from app.roster import unpack_match_roster, unpack_player_ids
+
+INDEX_NAME = 'index.jsonl'
+SEGMENT_PATTERN = 'segment-{:06d}.jsonl.gz'
+# gzip's default of 9 takes about three times as long as 6 for a few percent smaller blocks.
+COMPRESS_LEVEL = 6
+
+# Columns of one row from iter_results() and the CSV export.
+RESULT_FIELDS = ['match_id', 'created_at', 'match_type', 'court_number', 'team', 'player_id', 'player_name', 'won']
+
+try:
+    import fcntl
+except ImportError: # Windows: writers are only kept apart within one process.
+    fcntl = None
+
+LOCK_NAME = '.lock'
+PENDING_PREFIX = 'pending-'
+# A pending line this old belongs to a prune that stopped before publish() or discard(); see pending_entries().
+PENDING_MAX_AGE = 60
+
+_write_lock = threading.Lock()
+
+
+def archive_dir():
+    """The ARCHIVE_DIR setting, or an `archive` folder next to the SQLite database file."""
+    configured = current_app.config.get('ARCHIVE_DIR')
+    if configured:
+        return configured
+    database = db.engine.url.database if db.engine.dialect.name == 'sqlite' else None
+    if database and database != ':memory:':
+        return os.path.join(os.path.dirname(os.path.abspath(database)), 'archive')
+    return os.path.join(current_app.instance_path, 'archive')
+
+
+def match_record(match_row, courts):
+    """One archived match as a plain dictionary (the JSON line written to the segment).
+
+    match_row has id, created_at, match_type, num_courts, seed,
+    seat_priority, replaced_by and roster_snapshot. courts holds a (court_number, winning_team,
+    rating_delta, players) tuple per court, where players are
+    [player_id, player_name] pairs with team 1 first.
+    """
+    roster_ids, resting_ids = unpack_match_roster(match_row.roster_snapshot)
+    return {
+        'id': match_row.id,
+        'created_at': match_row.created_at.isoformat() if match_row.created_at else None,
+        'match_type': match_row.match_type,
+        'num_courts': match_row.num_courts,
+        'seed': match_row.seed,
+        'priority': unpack_player_ids(match_row.seat_priority),
+        'roster': roster_ids,
+        'resting': resting_ids,
+        'replaced_by': match_row.replaced_by,
+        'courts': [
+            {'court_number': number, 'winning_team': winner, 'rating_delta': delta,
+             'team1': players[:2], 'team2': players[2:]}
+            for number, winner, delta, players in sorted(courts, key=lambda court: court[0])
+        ],
+    }
+
+
+def _record_player_ids(record):
+    return {p[0] for court in record['courts'] for p in court['team1'] + court['team2'] if p[0] is not None}
+
+
+def _iter_index(directory):
+    # One dictionary per archived batch, read a line at a time.
+    path = os.path.join(directory, INDEX_NAME)
+    if not os.path.exists(path):
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+@contextmanager
+def _locked(directory):
+    # One writer at a time: threads through _write_lock, worker processes through a lock file.
+    with _write_lock:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, LOCK_NAME), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+
+def _current_segment(directory, max_bytes):
+    # The newest segment, or the next number once it is full (or if there is none yet).
+    numbers = [int(name[8:14]) for name in os.listdir(directory)
+               if name.startswith('segment-') and name.endswith('.jsonl.gz')]
+    number = max(numbers, default=1)
+    path = os.path.join(directory, SEGMENT_PATTERN.format(number))
+    if os.path.exists(path) and os.path.getsize(path) >= max_bytes:
+        number += 1
+    return SEGMENT_PATTERN.format(number)
+
+
+def _append(path, data):
+    # Append and flush to disk before returning, so a prune never deletes rows the archive does not hold yet.
+    with open(path, 'ab') as f:
+        offset = f.tell()
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return offset
+
+
+def stage_matches(records, directory=None):
+    """Append a batch of match records (from match_record()) as one compressed block, not yet indexed.
+
+    Returns the pending index entry to pass to publish() once the matches
+    are deleted from the database, or to discard() if they are not. Call it
+    before the DELETE so the archive holds the matches before they are gone.
+    """
+    directory = directory or archive_dir()
+    lines = ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in records)
+    block = gzip.compress(lines.encode('utf-8'), compresslevel=COMPRESS_LEVEL, mtime=0) # Outside the lock.
+    dates = [r['created_at'] for r in records if r['created_at']]
+    with _locked(directory):
+        segment = _current_segment(directory, current_app.config['ARCHIVE_SEGMENT_MAX_BYTES'])
+        offset = _append(os.path.join(directory, segment), block)
+        entry = {
+            'segment': segment,
+            'offset': offset,
+            'length': len(block),
+            'first': min(dates, default=None),
+            'last': max(dates, default=None),
+            'matches': [r['id'] for r in records],
+            'players': sorted(set().union(*(_record_player_ids(r) for r in records))),
+        }
+        handle, path = tempfile.mkstemp(prefix=PENDING_PREFIX, suffix='.json', dir=directory)
+        with os.fdopen(handle, 'wb') as f:
+            f.write(json.dumps(entry, separators=(',', ':')).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+    return dict(entry, pending=path)
+
+
+def publish(entry):
+    """Add a staged batch to the index, making it readable. Does nothing if it was already published or discarded."""
+    directory = os.path.dirname(entry['pending'])
+    line = {key: value for key, value in entry.items() if key != 'pending'}
+    with _locked(directory):
+        # Whoever removes the pending file publishes the line, so it is never indexed twice.
+        try:
+            os.remove(entry['pending'])
+        except FileNotFoundError:
+            return False
+        _append(os.path.join(directory, INDEX_NAME), (json.dumps(line, separators=(',', ':')) + '\n').encode('utf-8'))
+        return True
+
+
+def discard(entry):
+    # The DELETE did not happen: forget the staged block, which stays in its segment unread.
+    with _locked(os.path.dirname(entry['pending'])):
+        try:
+            os.remove(entry['pending'])
+        except FileNotFoundError:
+            pass
+
+
+def pending_entries(directory=None, max_age=PENDING_MAX_AGE):
+    """Staged batches older than max_age seconds, left by a prune that stopped before publish() or discard().
+
+    The caller publishes the ones whose DELETE was committed and discards the rest
+    (see persistence._finish_pending_archive).
+    """
+    directory = directory or archive_dir()
+    if not os.path.isdir(directory):
+        return []
+    entries = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if not name.startswith(PENDING_PREFIX):
+            continue
+        try:
+            if time.time() - os.path.getmtime(path) < max_age:
+                continue
+            with open(path, encoding='utf-8') as f:
+                entries.append(dict(json.load(f), pending=path))
+        except (OSError, ValueError):
+            continue # Removed by another process meanwhile, or cut short by a crash before it was complete.
+    return entries
+
+
+def append_matches(records):
+    """Stage and publish a batch straight away, e.g. to build an archive outside a prune. Returns how many were written."""
+    if not records:
+        return 0
+    publish(stage_matches(records))
+    return len(records)
+
+
+def to_datetime(value):
+    # A datetime from a datetime, a date (midnight) or an ISO string. Raises ValueError for anything else.
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(value)
+
+
+def iter_matches(since=None, before=None, player_id=None, directory=None):
+    """Yield archived match records, oldest batch first.
+
+    since (inclusive) and before (exclusive) are datetimes, dates or ISO
+    strings; player_id keeps only matches where that player was on a court.
+    Only one batch is decompressed at a time.
+    """
+    directory = directory or archive_dir()
+    since, before = to_datetime(since), to_datetime(before)
+    for entry in _iter_index(directory):
+        # Skip whole batches using the index before reading any compressed data.
+        if since and entry['last'] and datetime.fromisoformat(entry['last']) < since:
+            continue
+        if before and entry['first'] and datetime.fromisoformat(entry['first']) >= before:
+            continue
+        if player_id is not None and player_id not in entry['players']:
+            continue
+        with open(os.path.join(directory, entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            block = gzip.decompress(f.read(entry['length']))
+        for line in io.StringIO(block.decode('utf-8')):
+            record = json.loads(line)
+            created_at = to_datetime(record['created_at'])
+            if since and (created_at is None or created_at < since):
+                continue
+            if before and (created_at is None or created_at >= before):
+                continue
+            if player_id is not None and player_id not in _record_player_ids(record):
+                continue
+            yield record
+
+
+def iter_results(since=None, before=None, player_id=None, directory=None):
+    """Yield one flat dictionary (RESULT_FIELDS) per player per archived court.
+
+    won is True or False, or None if no winner was recorded for the court.
+    With player_id only that player's rows are returned. Regenerated
+    matches were never played, so they are left out.
+    """
+    for record in iter_matches(since, before, player_id, directory):
+        if record.get('replaced_by') is not None: # Records archived before regenerating kept matches have no such key.
+            continue
+        for court in record['courts']:
+            for team in (1, 2):
+                for pid, name in court[f'team{team}']:
+                    if player_id is not None and pid != player_id:
+                        continue
+                    yield {
+                        'match_id': record['id'],
+                        'created_at': record['created_at'],
+                        'match_type': record['match_type'],
+                        'court_number': court['court_number'],
+                        'team': team,
+                        'player_id': pid,
+                        'player_name': name,
+                        'won': None if court['winning_team'] is None else court['winning_team'] == team,
+                    }
+
+
+def iter_csv(rows):
+    # CSV text for the rows of iter_results(), a header line first, produced one line at a time.
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def player_totals(since=None, before=None, directory=None):
+    """Archived games, wins and losses per player id, e.g. for stats over several seasons.
+
+    Memory grows with the number of players, not with the number of matches scanned.
+    """
+    totals = {}
+    for row in iter_results(since, before, directory=directory):
+        if row['player_id'] is None:
+            continue
+        games, wins, losses = totals.get(row['player_id'], (0, 0, 0))
+        totals[row['player_id']] = (games + 1, wins + (row['won'] is True), losses + (row['won'] is False))
+    return {pid: {'games': g, 'wins': w, 'losses': l} for pid, (g, w, l) in totals.items()}
+
+
+@click.command('export-archive')
+@click.option('--since', help='First date to include (YYYY-MM-DD).')
+@click.option('--before', help='Only matches before this date (YYYY-MM-DD).')
+@click.option('--player', 'player_id', type=int, help='Only this player id.')
+@click.option('--output', type=click.File('w'), default='-', help='CSV file to write (default: standard output).')
+@with_appcontext
+def export_archive_command(since, before, player_id, output):
+    """Write the archived results as CSV."""
+    for chunk in iter_csv(iter_results(since, before, player_id)):
+        output.write(chunk)
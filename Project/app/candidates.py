@@ -0,0 +1,189 @@
+import os
+import random
+import secrets
+import threading
+import time
+from flask import current_app
+from app.matchmaking import get_strategy, player_rating
+from app.roster import RosterPlayer, unpack_player_ids
+
+# How much each problem costs when candidates are compared; the lowest total wins.
+# Repeated partners and opponents cost planner.PARTNER_WEIGHT and planner.OPPONENT_WEIGHT per saved match.
+BALANCE_WEIGHT = 1 / 100 # Per rating point between the two teams on a court.
+GENDER_WEIGHT = 0.5 # Per team that is not one male and one female (only when the roster has both).
+
+
+def new_seed():
+    # 48 random bits leave plenty of room below 2**63, so a run of consecutive seeds still fits in a signed 64-bit column.
+    return secrets.randbits(48)
+
+
+def generate(match_type, players, num_courts, seed, priority=()):
+    """The pairings the strategy for match_type gives for this seed. Same players, seed and priority, same result.
+
+    priority holds the ids from the rest queue (stats.rest_queue) who must get a court first.
+    """
+    return get_strategy(match_type).create(players, num_courts, rng=random.Random(seed), priority=priority)
+
+
+def reproduce(match, players):
+    """The pairings of a saved match, generated again from its seed and rest queue.
+
+    players must be the match's roster as it was then (same players, in
+    roster order, with the ratings they had), e.g. get_roster().subset() of
+    its roster ids while nothing has changed. Returns None for matches
+    without a seed, such as planned sessions.
+    """
+    if match.seed is None:
+        return None
+    return generate(match.match_type, players, match.num_courts, match.seed, unpack_player_ids(match.seat_priority))
+
+
+def _pair(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+def load_pair_history(player_ids):
+    """Count how often every pair of these players were partners and opponents in the saved matches.
+
+    The counts come from planner.PlayHistory. They are returned as two
+    {(player_id, player_id): count} dictionaries with the smaller id first,
+    plain data that is cheap to send to the worker processes. The saved
+    history is capped at MAX_MATCHES, so these stay small.
+    """
+    import numpy as np # Loaded on first use, so starting the app does not pay for it.
+    from app.planner import PlayHistory
+    history = PlayHistory.from_database(player_ids)
+    ids = history.player_ids
+    size = len(ids) # Leaves out the spare slot for players outside the roster.
+
+    def pair_counts(counts):
+        first, second = np.nonzero(np.triu(counts[:size, :size], 1))
+        return {_pair(ids[a], ids[b]): int(counts[a, b]) for a, b in zip(first.tolist(), second.tolist())}
+
+    return pair_counts(history.partners), pair_counts(history.opponents)
+
+
+def score_pairings(match_data, partners, opponents, mixed_possible):
+    # The cost of one candidate (lower is better): team balance, repeated partners and opponents, and gender mix.
+    from app.planner import PARTNER_WEIGHT, OPPONENT_WEIGHT
+    score = 0.0
+    for court in match_data:
+        team1, team2 = court['team1'], court['team2']
+        score += BALANCE_WEIGHT * abs(sum(player_rating(p) for p in team1) - sum(player_rating(p) for p in team2))
+        for team in (team1, team2):
+            score += PARTNER_WEIGHT * partners.get(_pair(team[0].id, team[1].id), 0)
+            if mixed_possible and {team[0].gender, team[1].gender} != {'male', 'female'}:
+                score += GENDER_WEIGHT
+        for a in team1:
+            for b in team2:
+                score += OPPONENT_WEIGHT * opponents.get(_pair(a.id, b.id), 0)
+    return score
+
+
+def _search_seeds(job):
+    """Try seeds first_seed, first_seed + step, ... until the deadline. Runs inside a worker process.
+
+    Everything it needs arrives in job as plain data, so nothing here touches
+    the database. Returns (best score, best seed, candidates checked).
+    """
+    match_type, player_rows, num_courts, priority, partners, opponents, first_seed, step, deadline = job
+    players = [RosterPlayer(*row) for row in player_rows]
+    genders = {p.gender for p in players}
+    mixed_possible = 'male' in genders and 'female' in genders
+
+    best_score, best_seed, checked = None, None, 0
+    seed = first_seed
+    # Always check at least one candidate, even if the budget ran out while the job was queued.
+    while checked == 0 or time.time() < deadline:
+        match_data = generate(match_type, players, num_courts, seed, priority)
+        if match_data:
+            score = score_pairings(match_data, partners, opponents, mixed_possible)
+            if best_score is None or score < best_score:
+                best_score, best_seed = score, seed
+        checked += 1
+        seed += step
+    return best_score, best_seed, checked
+
+
+# One pool for the whole process, started by start_pool() or on first use. A request
+# that searches may be running next to others on threads, so workers are not forked from it
+# (a fork copies whatever locks those threads hold) but from a forkserver: a clean
+# process that imports the main script, this module and the planner once, so workers
+# still start instantly and never open the database. Like every multiprocessing start
+# method other than fork, it needs the main script to guard its own work with
+# `if __name__ == '__main__':` (run.py and the bench scripts do).
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    import multiprocessing # Only needed once a search uses more than one worker.
+    from concurrent.futures import ProcessPoolExecutor
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+                context.set_forkserver_preload(['__main__', 'app.candidates', 'app.planner'])
+            else:
+                context = multiprocessing.get_context() # Windows: workers are spawned.
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _pool_workers = workers
+        return _pool
+
+
+def _worker_count(config):
+    return config['CANDIDATE_WORKERS'] or os.cpu_count() or 1
+
+
+def start_pool(app):
+    """Start the worker processes for "Regenerate best" now instead of in the first search.
+
+    Starting the forkserver imports the app once more, which takes a moment,
+    and a gevent worker serves nothing else meanwhile (see gunicorn.conf.py).
+    Does nothing when searches run in this process.
+    """
+    workers = _worker_count(app.config)
+    if workers > 1:
+        list(_get_pool(workers).map(abs, range(workers))) # The pool only starts a worker once it has a job for it.
+
+
+def find_best_pairings(match_type, players, num_courts, time_budget=None, workers=None, priority=()):
+    """Generate candidate pairings with consecutive seeds and keep the one with the lowest score.
+
+    Each worker process gets every n-th seed and keeps trying until the time
+    budget (CANDIDATE_TIME_BUDGET seconds) runs out, so more cores check more
+    candidates in the same time. With one worker everything runs in this
+    process. Every candidate seats the players in priority first. Returns
+    (match_data, seed, candidates checked); match_data is empty if no
+    candidate could fill a court.
+    """
+    config = current_app.config
+    time_budget = config['CANDIDATE_TIME_BUDGET'] if time_budget is None else time_budget
+    workers = workers or _worker_count(config)
+
+    player_rows = [(p.id, p.name, p.skill, p.gender, getattr(p, 'rating', None)) for p in players]
+    partners, opponents = load_pair_history([p.id for p in players])
+    first_seed = new_seed()
+    deadline = time.time() + time_budget
+    jobs = [
+        (match_type, player_rows, num_courts, tuple(priority), partners, opponents, first_seed + i, workers, deadline)
+        for i in range(workers)
+    ]
+
+    if workers == 1:
+        results = [_search_seeds(jobs[0])]
+    else:
+        results = list(_get_pool(workers).map(_search_seeds, jobs))
+
+    checked = sum(r[2] for r in results)
+    found = [(score, seed) for score, seed, _ in results if score is not None]
+    if not found:
+        return [], None, checked
+    best_score, best_seed = min(found)
+    # Rebuilding the winner from its seed gives the caller the pairings made of its own player objects.
+    return generate(match_type, players, num_courts, best_seed, priority), best_seed, checked
@@ -0,0 +1,114 @@
+"""Settings for create_app().
+
+The config class is chosen by name ('development', 'production' or
+'testing'), by the APP_CONFIG environment variable, or defaults to
+development. Environment variables then override it:
+
+* SECRET_KEY, DATABASE_URL, DATABASE_MODE, ARCHIVE_DIR, METRICS_TOKEN
+  and INSTRUMENTATION_ENABLED=1 by their own names;
+* any other setting with a DRAFT_ prefix, e.g. DRAFT_MAX_PLAYERS=64 or
+  DRAFT_HISTORY_PRUNE_MODE=background (values are read as JSON when they
+  can be, so numbers and true/false work).
+
+The testing config ignores the environment, so a test never picks up the
+developer's database.
+"""
+import os
+
+DEFAULT_SECRET_KEY = '12345'
+
+
+class Config:
+    use_environment = True # Lower case, so it is not copied into app.config.
+
+    SECRET_KEY = DEFAULT_SECRET_KEY
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///draft.db' # Relative paths are kept in the instance folder.
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    MAX_PLAYERS = 32
+    MAX_MATCHES = 10
+    MAX_COURTS = 50
+    DRAFT_PAGE_SIZE = 50
+    RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024 # Memory for cached match and history pages.
+    RESPONSE_CACHE_TOKEN_REFRESH = 30 * 60 # Seconds; must stay below WTF_CSRF_TIME_LIMIT (1 hour).
+    LIVE_QUEUE_SIZE = 32 # Updates held for one live viewer before they are dropped.
+    LIVE_HEARTBEAT_SECONDS = 15
+    LIVE_SYNC_SECONDS = 2 # How often each worker process checks its viewers' matches for results set by other workers.
+    CANDIDATE_TIME_BUDGET = 1.0 # Seconds "Regenerate best" spends searching for better pairings.
+    CANDIDATE_WORKERS = None # Worker processes for that search; None uses every CPU core.
+    INSTRUMENTATION_ENABLED = False # Request/SQL timings and /metrics.
+    METRICS_TOKEN = None # /metrics needs "Authorization: Bearer <this>"; without a token it is not served at all.
+    HISTORY_PRUNE_MODE = 'deferred' # 'inline', 'deferred' (after the response is sent) or 'background'.
+    HISTORY_PRUNE_BATCH_SIZE = 20 # Matches deleted per transaction, so a prune never holds the write lock for long.
+    ARCHIVE_ENABLED = True # Pruned matches go to compressed archive files instead of being lost.
+    ARCHIVE_DIR = None # None keeps the archive in a folder next to the database file.
+    ARCHIVE_SEGMENT_MAX_BYTES = 16 * 1024 * 1024 # Size at which a new archive segment file is started.
+    DATABASE_MODE = 'simple' # 'production' for many people recording results at once.
+    SQLITE_BUSY_TIMEOUT = 10 # Seconds a write waits for another write to finish before "database is locked".
+
+
+class DevelopmentConfig(Config):
+    pass
+
+
+class ProductionConfig(Config):
+    DATABASE_MODE = 'production'
+
+
+class TestingConfig(Config):
+    use_environment = False
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://' # A private in-memory database for every app.
+    WTF_CSRF_ENABLED = False
+    HISTORY_PRUNE_MODE = 'inline' # Pruning happens inside the request, so tests can check it straight away.
+    ARCHIVE_ENABLED = False # Nowhere to keep it for an in-memory database; set ARCHIVE_DIR to turn it back on.
+    CANDIDATE_TIME_BUDGET = 0.05
+    CANDIDATE_WORKERS = 1
+
+
+CONFIGS = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+}
+
+# Environment variables with their own names, and the setting each one fills in.
+ENVIRONMENT_NAMES = {
+    'SECRET_KEY': 'SECRET_KEY',
+    'DATABASE_URL': 'SQLALCHEMY_DATABASE_URI', # Benchmarks point this at a temporary file.
+    'DATABASE_MODE': 'DATABASE_MODE',
+    'ARCHIVE_DIR': 'ARCHIVE_DIR',
+    'METRICS_TOKEN': 'METRICS_TOKEN',
+}
+
+
+def load(app_config, config=None):
+    """Fill app_config from a config name or class (see the module docstring) plus the environment.
+
+    config may also be a dictionary of settings, applied on top of the
+    config APP_CONFIG selects, e.g. create_app({'MAX_PLAYERS': 64}).
+    """
+    overrides = {}
+    if isinstance(config, dict):
+        overrides, config = config, None
+    if config is None:
+        config = os.environ.get('APP_CONFIG', 'development')
+    if isinstance(config, str):
+        if config not in CONFIGS:
+            raise ValueError(f"Unknown config {config!r}; expected one of {', '.join(CONFIGS)}.")
+        config = CONFIGS[config]
+
+    app_config.from_object(config)
+    if config.use_environment:
+        for variable, setting in ENVIRONMENT_NAMES.items():
+            if os.environ.get(variable):
+                app_config[setting] = os.environ[variable]
+        if os.environ.get('INSTRUMENTATION_ENABLED'):
+            app_config['INSTRUMENTATION_ENABLED'] = os.environ['INSTRUMENTATION_ENABLED'] == '1'
+        app_config.from_prefixed_env('DRAFT')
+    app_config.update(overrides)
+
+    if issubclass(config, ProductionConfig) and app_config['SECRET_KEY'] == DEFAULT_SECRET_KEY:
+        raise RuntimeError("Set SECRET_KEY in the environment before using the production config.")
+    if app_config['DATABASE_MODE'] == 'production':
+        # Enough pooled connections for a round's worth of simultaneous requests; the rest queue for a free one.
+        app_config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {'pool_size': 20, 'max_overflow': 20, 'pool_timeout': 30})
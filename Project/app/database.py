@@ -0,0 +1,27 @@
+from sqlalchemy import event
+from app import write_queue
+
+
+def configure_engine(app, engine):
+    """Per-connection SQLite settings, plus the write queue in production mode. Nothing connects here."""
+    if engine.dialect.name != 'sqlite':
+        return
+    busy_timeout_ms = int(app.config['SQLITE_BUSY_TIMEOUT'] * 1000)
+    production = app.config['DATABASE_MODE'] == 'production'
+
+    # SQLite ignores foreign keys (and so ON DELETE CASCADE) unless it is switched on for every connection.
+    @event.listens_for(engine, 'connect')
+    def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        # A write that finds the database locked retries for this long instead of failing at once.
+        cursor.execute(f'PRAGMA busy_timeout={busy_timeout_ms}')
+        if production:
+            # WAL lets pages be read while a result is being written, and writers only wait for each other.
+            # NORMAL only syncs at checkpoints, which is still safe from corruption in WAL mode.
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+    if production:
+        write_queue.install(engine)
@@ -1,19 +1,25 @@
 from flask_wtf import FlaskForm
-from wtforms import StringField, SelectField, SubmitField, RadioField
-from wtforms.validators import DataRequired, Length
+from wtforms import StringField, SelectField, SubmitField, RadioField, IntegerField
+from wtforms.validators import DataRequired, Length, NumberRange
+from app.matchmaking import strategy_choices
+
+# Shared with the JSON import API so both accept exactly the same values.
+NAME_MAX_LENGTH = 30
+SKILL_CHOICES = [
+    ('Beginner', 'Beginner'),
+    ('Intermediate', 'Intermediate'),
+    ('Advanced', 'Advanced')
+]
+GENDER_CHOICES = [
+    ('male', 'Male'),
+    ('female', 'Female'),
+    ('other', 'Other')
+]
 
 class PlayerForm(FlaskForm):
-    name = StringField('Name', validators=[DataRequired(), Length(max=30)])
-    skill = SelectField('Skill Level', choices=[
-        ('Beginner', 'Beginner'),
-        ('Intermediate', 'Intermediate'),
-        ('Advanced', 'Advanced')
-    ], validators=[DataRequired()])
-    gender = SelectField('Gender', choices=[
-        ('male', 'Male'),
-        ('female', 'Female'),
-        ('other', 'Other')
-    ], validators=[DataRequired()])
+    name = StringField('Name', validators=[DataRequired(), Length(max=NAME_MAX_LENGTH)])
+    skill = SelectField('Skill Level', choices=SKILL_CHOICES, validators=[DataRequired()])
+    gender = SelectField('Gender', choices=GENDER_CHOICES, validators=[DataRequired()])
     submit = SubmitField('Add Player')
 
 class MatchForm(FlaskForm):
@@ -21,12 +27,13 @@ class MatchForm(FlaskForm):
     
     match_type = RadioField(
         'Matchmaking Type', 
-        choices=[
-            ('skill', 'Balanced by Skill (Top players on same court)'),
-            ('mixed', 'Balanced by Gender (Prioritizes Mixed Teams)'),
-            ('random', 'Purely Random')
-        ],
+        choices=strategy_choices(), # Every strategy registered in matchmaking.py.
         default='skill', # Set a sensible default
         validators=[DataRequired()]
     )
     submit = SubmitField('Generate Matches')
+
+class SessionForm(FlaskForm):
+    num_courts = SelectField('Number of Courts', coerce=int, validators=[DataRequired()])
+    num_rounds = IntegerField('Number of Rounds', default=5, validators=[DataRequired(), NumberRange(min=1)])
+    submit = SubmitField('Plan Session')
@@ -0,0 +1,141 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app, request, session, make_response
+from flask_wtf.csrf import generate_csrf
+from werkzeug.http import is_resource_modified
+
+
+class ResponseCache:
+    """Rendered pages kept in memory, least recently used first out.
+
+    Memory is bounded by the total size of the cached bodies. Each entry
+    also remembers which match it belongs to, so a write to that match can
+    drop exactly its pages.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # key -> (body, match_id)
+        self._keys_by_match = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, body, match_id=None):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (body, match_id)
+            self._keys_by_match.setdefault(match_id, set()).add(key)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_match(self, match_id):
+        with self._lock:
+            for key in list(self._keys_by_match.get(match_id, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_match.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        body, match_id = entry
+        self._size -= len(body)
+        keys = self._keys_by_match.get(match_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_match[match_id]
+
+
+_cache_lock = threading.Lock()
+
+# Pages that are not about one match (the history list) are filed under this id.
+HISTORY = 'history'
+
+
+def get_cache():
+    # One cache per app, kept in app.extensions.
+    with _cache_lock:
+        cache = current_app.extensions.get('response_cache')
+        if cache is None:
+            cache = current_app.extensions['response_cache'] = ResponseCache(current_app.config['RESPONSE_CACHE_MAX_BYTES'])
+        return cache
+
+
+def invalidate_match(match_id):
+    get_cache().invalidate_match(match_id)
+
+
+def invalidate_history():
+    get_cache().invalidate_match(HISTORY)
+
+
+def clear():
+    get_cache().clear()
+
+
+def _viewer_key():
+    # Pages with forms carry the visitor's CSRF token, so they are cached per session.
+    # The token is refreshed well before Flask-WTF's time limit so a cached page never holds an expired one.
+    generate_csrf()
+    raw_token = session.get('csrf_token', '')
+    refresh = current_app.config['RESPONSE_CACHE_TOKEN_REFRESH']
+    return f"{hashlib.sha1(raw_token.encode()).hexdigest()[:12]}-{int(time.time() // refresh)}"
+
+
+def cached_page(match_id, version, last_modified, render, per_viewer=False):
+    """Serve a page from the response cache with ETag and Last-Modified headers.
+
+    match_id is the match the page shows (or HISTORY) and version must
+    change whenever the data on the page changes, so the ETag is derived
+    from them. last_modified must move forward with every such change, or
+    be None to send no Last-Modified. A conditional GET whose ETag still
+    matches, or that has no If-None-Match and an If-Modified-Since no older
+    than last_modified, gets a 304 without the page being rendered or
+    looked up. Pages with flashed messages are one-offs and always rendered
+    fresh.
+    """
+    if session.get('_flashes'):
+        return render()
+
+    cache_key = (match_id, version) + ((_viewer_key(),) if per_viewer else ())
+    etag = hashlib.sha1(repr(cache_key).encode()).hexdigest()
+
+    # Werkzeug checks If-None-Match first and only falls back to If-Modified-Since without it.
+    # HTTP dates have whole seconds, so last_modified is compared without its microseconds.
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response('', 304)
+    else:
+        cache = get_cache()
+        body = cache.get(cache_key)
+        if body is None:
+            body = render().encode()
+            cache.put(cache_key, body, match_id)
+        response = make_response(body)
+
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified # Werkzeug would stamp the current time on None.
+    # Browsers may keep the page but must check the ETag before showing it again.
+    response.cache_control.no_cache = True
+    if per_viewer:
+        response.cache_control.private = True
+    return response
@@ -0,0 +1,229 @@
+import bisect
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+
+# Timing records are written to this logger as one JSON object per line.
+logger = logging.getLogger('app.metrics')
+
+# Upper bounds (in milliseconds, or a plain count for statement counts) of the histogram buckets.
+BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# install() gives each app that has INSTRUMENTATION_ENABLED its own Metrics in app.extensions.
+# Everything below looks that up first, so for an app with instrumentation off the only cost is
+# that lookup: no SQL events, no request hooks and no histograms.
+
+
+class Histogram:
+    """Counts of observed values per bucket, plus count, sum and maximum."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1) # The last bucket holds everything above BUCKETS[-1].
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+            self.count += 1
+            self.total += value
+            self.maximum = max(self.maximum, value)
+
+    def percentile(self, fraction):
+        # The upper bound of the bucket holding that fraction of observations (the maximum for the last bucket).
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.maximum
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'count': self.count,
+                'sum': round(self.total, 3),
+                'mean': round(self.total / self.count, 3) if self.count else 0.0,
+                'max': round(self.maximum, 3),
+                'p50': self.percentile(0.5),
+                'p95': self.percentile(0.95),
+                'p99': self.percentile(0.99),
+                'buckets': {('+Inf' if i == len(BUCKETS) else str(BUCKETS[i])): c for i, c in enumerate(self.counts)},
+            }
+
+
+class Metrics:
+    """The histograms of one app, by name."""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, value):
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram())
+        histogram.observe(value)
+
+    def snapshot(self):
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        return {name: histogram.snapshot() for name, histogram in histograms}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+def _current_metrics():
+    # The current app's Metrics, or None when instrumentation is off for it (or there is no app).
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('instrumentation')
+
+
+def observe(name, value):
+    metrics = _current_metrics()
+    if metrics is not None:
+        metrics.observe(name, value)
+
+
+def snapshot():
+    # Every histogram of the current app, by name, for the /metrics endpoint.
+    metrics = _current_metrics()
+    return metrics.snapshot() if metrics is not None else {}
+
+
+def reset():
+    metrics = _current_metrics()
+    if metrics is not None:
+        metrics.reset()
+
+
+def enabled():
+    return _current_metrics() is not None
+
+
+def log_event(event_name, **fields):
+    """Write one structured record, e.g. log_event('history_prune', deleted=3, ms=1.2).
+
+    Records are logged whether or not instrumentation is on; they replace
+    the old print() diagnostics.
+    """
+    logger.info(json.dumps({'event': event_name, **fields}, default=str))
+
+
+@contextmanager
+def _timing(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        observe(f'{name}.ms', elapsed)
+        if has_request_context() and 'instrumentation' in g:
+            timers = g.instrumentation['timers']
+            timers[name] = round(timers.get(name, 0.0) + elapsed, 3)
+
+
+_not_timing = nullcontext()
+
+
+def timer(name):
+    """Time a block and add it to the current request's record and the `<name>.ms` histogram.
+
+        with instrumentation.timer('matchmaking.balanced'):
+            match_data = ...
+
+    When instrumentation is off this returns a shared do-nothing context manager.
+    """
+    if _current_metrics() is None:
+        return _not_timing
+    return _timing(name)
+
+
+def timed(name):
+    # Decorator version of timer() for whole functions.
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_metrics() is None:
+                return func(*args, **kwargs)
+            with _timing(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _sql_timer(metrics):
+    # The after_cursor_execute listener for one app's engine, adding to that app's histograms.
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = (time.perf_counter() - conn.info['query_start'].pop()) * 1000
+        metrics.observe('sql.statement.ms', elapsed)
+        if has_request_context() and 'instrumentation' in g:
+            record = g.instrumentation
+            record['sql_statements'] += 1
+            record['sql_ms'] += elapsed
+    return after_cursor_execute
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute, so drop its start time here.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('query_start'):
+        connection.info['query_start'].pop()
+
+
+def _start_request():
+    g.instrumentation = {'start': time.perf_counter(), 'sql_statements': 0, 'sql_ms': 0.0, 'timers': {}}
+
+
+def _finish_request(response):
+    record = g.pop('instrumentation', None)
+    if record is None:
+        return response
+    total = (time.perf_counter() - record['start']) * 1000
+    endpoint = request.endpoint or 'unknown'
+    observe(f'request.{endpoint}.ms', total)
+    observe(f'request.{endpoint}.sql_statements', record['sql_statements'])
+    observe(f'request.{endpoint}.sql_ms', record['sql_ms'])
+    log_event(
+        'request',
+        endpoint=endpoint,
+        method=request.method,
+        status=response.status_code,
+        ms=round(total, 3),
+        sql_statements=record['sql_statements'],
+        sql_ms=round(record['sql_ms'], 3),
+        timers=record['timers'],
+    )
+    return response
+
+
+def install(app, engine):
+    """Hook the request and SQL timers into the app and its engine if INSTRUMENTATION_ENABLED is set.
+
+    Called by create_app(). Each app gets its own histograms, so apps in the
+    same process (e.g. tests) never see each other's numbers.
+    """
+    if not app.config.get('INSTRUMENTATION_ENABLED') or 'instrumentation' in app.extensions:
+        return
+    metrics = app.extensions['instrumentation'] = Metrics()
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _sql_timer(metrics))
+    event.listen(engine, 'handle_error', _handle_error)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
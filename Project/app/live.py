@@ -0,0 +1,201 @@
+import json
+import queue
+import threading
+import time
+from flask import current_app, request, abort, Response
+from app import db
+from app.models import Match, Court
+
+
+class MatchBroker:
+    """Hands match updates to everyone watching that match.
+
+    Each open /match/<id>/events stream gets its own small queue. Publishing
+    puts the event on every queue for the match and never waits, so a slow
+    or stalled viewer can only lose its own updates, not hold up the POST
+    that recorded the result.
+
+    The broker lives in one worker process, and the write routes publish to
+    it straight away. Results recorded by another worker process are found
+    by one watcher thread per broker: every LIVE_SYNC_SECONDS it reads the
+    versions of the matches that have viewers, in one query however many
+    viewers there are, and publishes the board of any match that changed.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.queue_size = app.config['LIVE_QUEUE_SIZE']
+        self._subscribers = {} # match_id -> set of queues
+        self._versions = {} # match_id -> the version its viewers were last sent, for the watched matches
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    def subscribe(self, match_id, version):
+        # version is the match version the new viewer is up to date with.
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(match_id, set()).add(subscriber)
+            self._versions.setdefault(match_id, version)
+            if self._watcher is None or not self._watcher.is_alive():
+                self._watcher = threading.Thread(target=self._watch, name='live-watcher', daemon=True)
+                self._watcher.start()
+        return subscriber
+
+    def unsubscribe(self, match_id, subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(match_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[match_id]
+                self._versions.pop(match_id, None)
+
+    def publish(self, match_id, event, data):
+        # Returns how many viewers the event was handed to.
+        with self._lock:
+            subscribers = list(self._subscribers.get(match_id, ()))
+        delivered = 0
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait((event, data))
+                delivered += 1
+            except queue.Full:
+                pass # This viewer is not keeping up; the board it gets on reconnecting brings it up to date.
+        return delivered
+
+    def viewer_count(self, match_id):
+        with self._lock:
+            return len(self._subscribers.get(match_id, ()))
+
+    def _watch(self):
+        while True:
+            time.sleep(self.app.config['LIVE_SYNC_SECONDS'])
+            with self._lock:
+                known = dict(self._versions)
+            if not known:
+                continue
+            try:
+                with self.app.app_context():
+                    try:
+                        boards = read_boards(list(known), known)
+                    finally:
+                        db.session.remove()
+            except Exception:
+                self.app.logger.exception("Could not check the watched matches for changes.")
+                continue
+            for match_id, (version, board) in boards.items():
+                with self._lock:
+                    if match_id in self._versions:
+                        self._versions[match_id] = version
+                self.publish(match_id, 'board', board)
+
+
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    # One broker per app, kept in app.extensions.
+    with _broker_lock:
+        broker = current_app.extensions.get('live_broker')
+        if broker is None:
+            broker = current_app.extensions['live_broker'] = MatchBroker(current_app._get_current_object())
+        return broker
+
+
+def read_boards(match_ids, known_versions=None):
+    """The whole board of each match as {match_id: (version, board)}, read with two queries.
+
+    A board is {"courts": [{"court_id": ..., "winning_team": ...}, ...],
+    "replaced_by": id or null}. With known_versions ({match_id: version})
+    only the matches whose version is different are read. Matches that no
+    longer exist are left out.
+    """
+    known_versions = known_versions or {}
+    versions = {
+        match_id: (version, replaced_by)
+        for match_id, version, replaced_by in db.session.execute(
+            db.select(Match.id, Match.version, Match.replaced_by).where(Match.id.in_(match_ids))
+        )
+        if known_versions.get(match_id) != version
+    }
+    if not versions:
+        return {}
+    courts = {}
+    for court_id, match_id, winning_team in db.session.execute(
+        db.select(Court.id, Court.match_id, Court.winning_team)
+        .where(Court.match_id.in_(list(versions))).order_by(Court.court_number)
+    ):
+        courts.setdefault(match_id, []).append({'court_id': court_id, 'winning_team': winning_team})
+    return {
+        match_id: (version, {'courts': courts.get(match_id, []), 'replaced_by': replaced_by})
+        for match_id, (version, replaced_by) in versions.items()
+    }
+
+
+def publish_court(court):
+    # The only change a result makes to the board: which team won on one court.
+    return get_broker().publish(court.match_id, 'court', {
+        'court_id': court.id,
+        'court_number': court.court_number,
+        'winning_team': court.winning_team,
+    })
+
+
+def publish_regenerated(previous_match_id, new_match_id):
+    # Viewers of the old match are told where the new pairings are.
+    return get_broker().publish(previous_match_id, 'regenerated', {'replaced_by': new_match_id})
+
+
+def format_event(event, data):
+    # One Server-Sent Events message.
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def event_stream_response(match_id, seen_version):
+    """A streaming Server-Sent Events response for one match.
+
+    seen_version is the match version the page was rendered with. If the
+    match has changed since (or the browser is reconnecting after missing
+    something), the current board is sent first. The viewer is subscribed
+    before that, so nothing published meanwhile is missed. The stream waits
+    on its queue rather than on the database, and sends a comment line every
+    LIVE_HEARTBEAT_SECONDS so proxies keep the connection open and a closed
+    connection is noticed. The subscription ends when the response closes.
+
+    Every open stream holds a thread under the development server or sync
+    workers; served by gevent workers (see gunicorn.conf.py) it is a
+    greenlet, so a worker can hold thousands of them.
+    """
+    current = read_boards([match_id]).get(match_id)
+    if current is None:
+        abort(404)
+    db.session.remove() # The stream can stay open for hours, so give the database connection back now.
+    version, board = current
+
+    broker = get_broker()
+    heartbeat = current_app.config['LIVE_HEARTBEAT_SECONDS']
+    urls = current_app.create_url_adapter(request) # Builds links to new matches once the request has ended.
+    subscriber = broker.subscribe(match_id, version)
+    if seen_version != version:
+        subscriber.put_nowait(('board', board))
+
+    def stream():
+        yield "retry: 5000\n\n" # Tell the browser to reconnect after 5 seconds if the stream drops.
+        while True:
+            try:
+                event, data = subscriber.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            if data.get('replaced_by'):
+                data = dict(data, url=urls.build('main.view_match_details', {'match_id': data['replaced_by']}))
+            yield format_event(event, data)
+
+    response = Response(
+        stream(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'} # Stop proxies from buffering the stream.
+    )
+    response.call_on_close(lambda: broker.unsubscribe(match_id, subscriber))
+    return response
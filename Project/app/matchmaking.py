@@ -1,11 +1,45 @@
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-def create_random_matches(players, num_courts):
+# Every create_*_matches function takes any iterable of players that have id, name, skill and gender
+# (and optionally rating): ORM Player objects or the cached roster.RosterSnapshot.
+# They also take an optional rng (a random.Random); passing one seeded with the same number
+# and the same players gives exactly the same pairings again.
+# priority is a list of player ids from the rest queue (stats.rest_queue), longest waiting first.
+# Those players are given a place on a court before anyone else; the rest are chosen as before.
+
+def _seat_first(ordered, seats, priority):
+    # Split `ordered` into the `seats` players who play and the ones who rest.
+    # Players in priority get a seat first, then the seats left go to the first players in `ordered`.
+    # Both lists keep the order of `ordered`, so without a priority this is just ordered[:seats].
+    waiting = set()
+    if priority:
+        present = {p.id for p in ordered}
+        for player_id in priority:
+            if len(waiting) == seats:
+                break
+            if player_id in present:
+                waiting.add(player_id)
+    free = seats - len(waiting)
+    playing, resting = [], []
+    for p in ordered:
+        if p.id in waiting:
+            playing.append(p)
+        elif free > 0:
+            playing.append(p)
+            free -= 1
+        else:
+            resting.append(p)
+    return playing, resting
+
+def create_random_matches(players, num_courts, rng=random, priority=()):
     # Create a new list from the players list to change it without changing original list.
     available = list(players)
     matches = [] # Initialize an empty list.
-    random.shuffle(available)
+    rng.shuffle(available)
+    # Players are popped from the end of the list, so the ones who play (rest queue first) are kept at the end.
+    seats = min(num_courts, len(available) // 4) * 4
+    available = _seat_first(available[::-1], seats, priority)[0][::-1]
     
     # Loop from 1 up to the total number of courts to create a match for each court.
     for court_num in range(1, num_courts + 1):
@@ -16,7 +50,7 @@ def create_random_matches(players, num_courts):
         matches.append({'court': court_num, 'team1': selected[:2], 'team2': selected[2:]})
     return matches
 
-def create_skill_based_matches(players, num_courts):
+def create_skill_based_matches(players, num_courts, rng=random, priority=()):
     # Create a dictionary to map skill level strings to numerical values for sorting.
     skill_map = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3}
     
@@ -29,7 +63,7 @@ def create_skill_based_matches(players, num_courts):
 
     # Iterate through the lists of players in each skill tier.
     for skill_tier in tiers.values():
-        random.shuffle(skill_tier) # Shuffle the players within each skill tier.
+        rng.shuffle(skill_tier) # Shuffle the players within each skill tier.
         
     # Create a single list of all players, ordered from highest skill to lowest.
     available_players = tiers.get('Advanced', []) + \
@@ -37,6 +71,8 @@ def create_skill_based_matches(players, num_courts):
                         tiers.get('Beginner', [])
     matches = []
     possible_courts = min(num_courts, len(available_players) // 4)
+    # Players from the rest queue take the place of the lowest players who would otherwise play; the skill order stays.
+    available_players = _seat_first(available_players, possible_courts * 4, priority)[0]
 
     # Loop through the number of courts fillable.
     for court_num in range(1, possible_courts + 1):
@@ -59,13 +95,18 @@ def create_skill_based_matches(players, num_courts):
         matches.append({'court': court_num, 'team1': team1, 'team2': team2})
     return matches
 
-def create_mixed_gender_matches(players, num_courts):
+def create_mixed_gender_matches(players, num_courts, rng=random, priority=()):
     males = [p for p in players if p.gender == 'male'] # Create a list containing only the male players.
     females = [p for p in players if p.gender == 'female'] # Create a list containing only the female players.
     
     others = [p for p in players if p.gender not in ['male', 'female']] # Create a list for any players not identified as 'Male' or 'Female'.
-    random.shuffle(males)
-    random.shuffle(females)
+    rng.shuffle(males)
+    rng.shuffle(females)
+    # Players and teams are popped from the end of their lists, so the rest queue is moved there, longest waiting last.
+    # Only one man and one woman per team can play, so with a lopsided queue the longest waiting get the places.
+    urgency = {player_id: len(priority) - i for i, player_id in enumerate(priority)}
+    males.sort(key=lambda p: urgency.get(p.id, 0))
+    females.sort(key=lambda p: urgency.get(p.id, 0))
     all_teams = []
     
     # Loop as long as there is at least one male and one female player available.
@@ -74,6 +115,7 @@ def create_mixed_gender_matches(players, num_courts):
         team = [males.pop(), females.pop()]
         # Add the mixed-gender team to the list of all teams.
         all_teams.append(team)
+    all_teams.sort(key=lambda team: max(urgency.get(team[0].id, 0), urgency.get(team[1].id, 0)))
         
     matches = []
     
@@ -94,3 +136,289 @@ def create_mixed_gender_matches(players, num_courts):
             'team2': team2
         })
     return matches
+
+# Starting ratings for players who do not have a numeric rating of their own yet.
+SKILL_RATINGS = {'Beginner': 1000.0, 'Intermediate': 1200.0, 'Advanced': 1400.0}
+
+# The three ways four players on a court can be split into two teams: (team1 a, team1 b, team2 a, team2 b).
+# A plain tuple so NumPy is only imported by the functions that need it (see _best_splits).
+TEAM_SPLITS = ((0, 1, 2, 3), (0, 2, 1, 3), (0, 3, 1, 2))
+
+# How many neighbouring courts (in strength order) each court tries swapping players with.
+SWAP_WINDOW = 8
+
+def starting_rating(skill):
+    return SKILL_RATINGS.get(skill, SKILL_RATINGS['Intermediate'])
+
+def player_rating(player):
+    # Use the player's numeric rating when there is one, otherwise fall back to their skill tier.
+    rating = getattr(player, 'rating', None)
+    if rating is None:
+        return starting_rating(player.skill)
+    return rating
+
+def _best_splits(court_ratings):
+    # court_ratings has the four ratings of a court in its last axis.
+    # Returns the index of the best split in TEAM_SPLITS and the team strength gap it leaves, for every court at once.
+    import numpy as np
+    splits = np.array(TEAM_SPLITS)
+    team1 = court_ratings[..., splits[:, 0]] + court_ratings[..., splits[:, 1]]
+    team2 = court_ratings[..., splits[:, 2]] + court_ratings[..., splits[:, 3]]
+    gaps = np.abs(team1 - team2)
+    return gaps.argmin(axis=-1), gaps.min(axis=-1)
+
+def _neighbour_pairs(num_courts):
+    # Each court with the next SWAP_WINDOW courts, as two arrays of court indexes.
+    import numpy as np
+    offsets = np.arange(1, min(SWAP_WINDOW, num_courts - 1) + 1)
+    first = np.concatenate([np.arange(num_courts - d) for d in offsets])
+    second = np.concatenate([np.arange(d, num_courts) for d in offsets])
+    return first, second
+
+def improve_courts(courts, court_cost, max_passes, court_pairs=None, values=None):
+    """Swap single players between courts while it lowers the total cost, and return the courts.
+
+    courts is an array of shape (courts, 4) of player indexes. court_cost
+    takes an array whose last axis holds the four players of a court and
+    returns the cost of each court; the players are given as their entries
+    in values (ratings, say), or as their indexes if values is None.
+    court_pairs is called at the start of every pass and returns the pairs
+    of courts to try as two index arrays; by default each court is tried
+    with its SWAP_WINDOW neighbours. All 16 single swaps of every pair are
+    scored in one go with NumPy.
+    """
+    import numpy as np
+    num_courts = len(courts)
+    if num_courts < 2:
+        return courts
+    if court_pairs is None:
+        pairs = _neighbour_pairs(num_courts)
+        court_pairs = lambda: pairs
+
+    # The 16 possible swaps between two courts: position a on the first court with position b on the second.
+    swap_a = np.repeat(np.arange(4), 4)
+    swap_b = np.tile(np.arange(4), 4)
+    swap_ids = np.arange(16)
+
+    for _ in range(max_passes):
+        first, second = court_pairs()
+        court_values = courts if values is None else values[courts]
+        costs = court_cost(court_values)
+
+        first_values = np.repeat(court_values[first][:, None, :], 16, axis=1)
+        second_values = np.repeat(court_values[second][:, None, :], 16, axis=1)
+        first_values[:, swap_ids, swap_a] = court_values[second][:, swap_b]
+        second_values[:, swap_ids, swap_b] = court_values[first][:, swap_a]
+
+        gains = (costs[first] + costs[second])[:, None] - (court_cost(first_values) + court_cost(second_values))
+        best_swap = gains.argmax(axis=1)
+        best_gain = gains[np.arange(len(first)), best_swap]
+
+        # Apply the biggest improvements first, touching each court at most once per pass.
+        improving = np.flatnonzero(best_gain > 1e-9)
+        if len(improving) == 0:
+            break
+        used = np.zeros(num_courts, dtype=bool)
+        for pair in improving[np.argsort(-best_gain[improving], kind='stable')]:
+            i, j = first[pair], second[pair]
+            if used[i] or used[j]:
+                continue
+            a, b = swap_a[best_swap[pair]], swap_b[best_swap[pair]]
+            courts[i, a], courts[j, b] = courts[j, b], courts[i, a]
+            used[i] = used[j] = True
+    return courts
+
+def create_balanced_matches(players, num_courts, max_passes=50, rng=random, priority=()):
+    # Shuffle first so ties and the choice of who rests change from one generation to the next.
+    available = list(players)
+    rng.shuffle(available)
+    possible_courts = min(num_courts, len(available) // 4)
+    if possible_courts == 0:
+        return []
+
+    import numpy as np # Loaded on first use, so starting the app does not pay for it.
+    playing = _seat_first(available, possible_courts * 4, priority)[0]
+    ratings = np.array([player_rating(p) for p in playing], dtype=float)
+
+    # Start from courts of four players with neighbouring ratings, strongest court first.
+    order = np.argsort(-ratings, kind='stable')
+    courts = order.reshape(possible_courts, 4).copy()
+    courts = improve_courts(courts, lambda court_ratings: _best_splits(court_ratings)[1], max_passes, values=ratings)
+
+    # Pick the team split with the smallest gap on every court.
+    splits, _ = _best_splits(ratings[courts])
+
+    matches = []
+    for court_num, (court, split) in enumerate(zip(courts, splits), start=1):
+        a, b, c, d = TEAM_SPLITS[split]
+        matches.append({
+            'court': court_num,
+            'team1': [playing[court[a]], playing[court[b]]],
+            'team2': [playing[court[c]], playing[court[d]]]
+        })
+    return matches
+
+def _acceptable_team(team):
+    # A team is fine unless it is two men or two women; a player of another gender can partner anyone.
+    genders = {p.gender for p in team}
+    return not (len(genders) == 1 and genders <= {'male', 'female'})
+
+def _pair_strong_with_weak(strong_side, weak_side):
+    # Strongest of one list with the weakest of the other, so every pair ends up close to the same total.
+    strong_side = sorted(strong_side, key=player_rating, reverse=True)
+    weak_side = sorted(weak_side, key=player_rating)
+    return [[a, b] for a, b in zip(strong_side, weak_side)]
+
+def create_mixed_balanced_matches(players, num_courts, max_passes=5, rng=random, priority=()):
+    """Mixed teams with balanced strength, including players of every gender.
+
+    Who plays is picked at random from everyone after the rest queue, like
+    the other strategies, and then only as many swaps with resting players
+    are made as needed to avoid two-man or two-woman teams (players from the
+    rest queue are never swapped out). Teams are one man and one woman
+    where possible; players of other genders partner whoever is left. Each
+    team is built strong with weak so the totals are close, and neighbouring
+    teams in strength order share a court. Everything is sorting, so it
+    stays fast for hundreds of players.
+    """
+    available = list(players)
+    rng.shuffle(available) # Decides who rests and breaks ties differently every time.
+    possible_courts = min(num_courts, len(available) // 4)
+    if possible_courts == 0:
+        return []
+    playing, resting = _seat_first(available, possible_courts * 4, priority)
+    waiting = set(priority)
+
+    # More men than women (or the other way round) beyond what other-gender players can partner
+    # means same-gender teams. Swap some of the surplus for resting women (or men) or other-gender players.
+    def surplus_gender():
+        counts = Counter(p.gender for p in playing)
+        others = len(playing) - counts['male'] - counts['female']
+        if abs(counts['male'] - counts['female']) <= others:
+            return None
+        return 'male' if counts['male'] > counts['female'] else 'female'
+
+    surplus = surplus_gender()
+    while surplus is not None:
+        swap_in = next((i for i, p in enumerate(resting) if p.gender != surplus), None)
+        # Stop when nobody suitable is resting, or every surplus player is from the rest queue (they keep their
+        # places); some same-gender teams cannot be avoided then.
+        swap_out = next((i for i in range(len(playing) - 1, -1, -1)
+                         if playing[i].gender == surplus and playing[i].id not in waiting), None)
+        if swap_in is None or swap_out is None:
+            break
+        playing[swap_out], resting[swap_in] = resting[swap_in], playing[swap_out]
+        surplus = surplus_gender()
+
+    males = [p for p in playing if p.gender == 'male']
+    females = [p for p in playing if p.gender == 'female']
+    others = [p for p in playing if p.gender not in ('male', 'female')]
+
+    # As many man-and-woman teams as possible.
+    num_mixed = min(len(males), len(females))
+    teams = _pair_strong_with_weak(males[:num_mixed], females[:num_mixed])
+
+    # Other-gender players partner the men or women left over (only one of the two is left), then whoever remains pairs up.
+    extra_same = males[num_mixed:] + females[num_mixed:]
+    wildcard_pairs = min(len(others), len(extra_same))
+    teams += _pair_strong_with_weak(extra_same[:wildcard_pairs], others[:wildcard_pairs])
+    rest = sorted(extra_same[wildcard_pairs:] + others[wildcard_pairs:], key=player_rating)
+    half = len(rest) // 2
+    teams += _pair_strong_with_weak(rest[half:], rest[:half])
+
+    # Teams next to each other in strength order play each other, strongest court first.
+    teams.sort(key=lambda team: sum(player_rating(p) for p in team), reverse=True)
+    courts = [teams[i] + teams[i + 1] for i in range(0, len(teams), 2)]
+    courts = _improve_mixed_courts(courts, max_passes)
+
+    matches = []
+    for court_num, court in enumerate(courts, start=1):
+        _, split = _best_acceptable_split(court)
+        a, b, c, d = TEAM_SPLITS[split]
+        matches.append({'court': court_num, 'team1': [court[a], court[b]], 'team2': [court[c], court[d]]})
+    return matches
+
+def _best_acceptable_split(court):
+    # The closest of the three ways to split a court that keeps every team acceptable. Returns (gap, split).
+    # Plain Python: for four players this is quicker than setting up NumPy arrays.
+    ratings = [player_rating(p) for p in court]
+    best = None
+    for split, (a, b, c, d) in enumerate(TEAM_SPLITS):
+        if not (_acceptable_team([court[a], court[b]]) and _acceptable_team([court[c], court[d]])):
+            continue
+        gap = abs(ratings[a] + ratings[b] - ratings[c] - ratings[d])
+        if best is None or gap < best[0]:
+            best = (gap, split)
+    if best is None: # Only when same-gender teams could not be avoided; keep the teams as built.
+        return abs(ratings[0] + ratings[1] - ratings[2] - ratings[3]), 0
+    return best
+
+def _improve_mixed_courts(courts, max_passes):
+    # Swap two players of the same gender between neighbouring courts while it lowers the total gap.
+    # Same gender for same gender keeps every team as mixed as it was.
+    gaps = [_best_acceptable_split(court)[0] for court in courts]
+    for _ in range(max_passes):
+        improved = False
+        for i in range(len(courts) - 1):
+            first, second = courts[i], courts[i + 1]
+            for a in range(4):
+                for b in range(4):
+                    if first[a].gender != second[b].gender:
+                        continue
+                    first[a], second[b] = second[b], first[a]
+                    new_first, new_second = _best_acceptable_split(first)[0], _best_acceptable_split(second)[0]
+                    if new_first + new_second < gaps[i] + gaps[i + 1] - 1e-9:
+                        gaps[i], gaps[i + 1] = new_first, new_second
+                        improved = True
+                    else:
+                        first[a], second[b] = second[b], first[a] # Undo.
+        if not improved:
+            break
+    return courts
+
+
+class Strategy:
+    """One way of generating matches, as offered in the match form.
+
+    requirement is an optional function that gets the players and returns
+    an error message when the strategy cannot run with them, or None.
+    """
+
+    def __init__(self, key, label, create, requirement=None):
+        self.key = key
+        self.label = label
+        self.create = create
+        self.requirement = requirement
+
+    def check(self, players):
+        return self.requirement(players) if self.requirement else None
+
+
+# The strategies in the order the match form lists them. The key is what Match.match_type stores.
+STRATEGIES = {}
+
+def register_strategy(key, label, create, requirement=None):
+    STRATEGIES[key] = Strategy(key, label, create, requirement)
+    return STRATEGIES[key]
+
+def get_strategy(key):
+    # Unknown keys (e.g. 'session' for planned rounds) regenerate as random matches.
+    return STRATEGIES.get(key, STRATEGIES['random'])
+
+def strategy_choices():
+    return [(strategy.key, strategy.label) for strategy in STRATEGIES.values()]
+
+def _two_of_each_gender(players):
+    # A mixed court needs at least 2 male and 2 female players.
+    counts = getattr(players, 'gender_counts', None) # Already counted in a roster snapshot.
+    if counts is None:
+        counts = Counter(p.gender for p in players)
+    if counts['male'] < 2 or counts['female'] < 2:
+        return "Cannot generate mixed match. You need at least 2 male and 2 female players."
+    return None
+
+register_strategy('skill', 'Balanced by Skill (Top players on same court)', create_skill_based_matches)
+register_strategy('balanced', 'Balanced by Rating (Closest possible teams on every court)', create_balanced_matches)
+register_strategy('mixed_balanced', 'Mixed and Balanced (Mixed teams of even strength, every gender plays)', create_mixed_balanced_matches)
+register_strategy('mixed', 'Balanced by Gender (Prioritizes Mixed Teams)', create_mixed_gender_matches, _two_of_each_gender)
+register_strategy('random', 'Purely Random', create_random_matches)
@@ -0,0 +1,219 @@
+from sqlalchemy import text
+from sqlalchemy.schema import CreateTable
+from app import db
+
+# db.create_all() only creates missing tables, it never changes a table that already exists.
+# Existing draft.db files are brought up to date by the steps below, in order.
+# The number of steps already applied is kept in SQLite's PRAGMA user_version.
+
+
+def _column_names(conn, table_name):
+    return {row['name'] for row in conn.execute(text(f'PRAGMA table_info("{table_name}")')).mappings()}
+
+
+def _rebuild_table(conn, table):
+    """Recreate a table from its current model definition, keeping its rows.
+
+    SQLite cannot change the foreign keys of an existing table, so the table
+    is copied into a new one, the old one is dropped and the copy renamed.
+    """
+    new_name = f"{table.name}_new"
+    create_sql = str(CreateTable(table).compile(dialect=conn.dialect))
+    old_name = conn.dialect.identifier_preparer.format_table(table)
+    conn.execute(text(create_sql.replace(f"CREATE TABLE {old_name} ", f"CREATE TABLE {new_name} ", 1)))
+
+    # Only copy the columns the old table has; columns added by later steps start out empty.
+    existing = _column_names(conn, table.name)
+    columns = ", ".join(c.name for c in table.columns if c.name in existing)
+    conn.execute(text(f'INSERT INTO {new_name} ({columns}) SELECT {columns} FROM "{table.name}"'))
+    conn.execute(text(f'DROP TABLE "{table.name}"'))
+    conn.execute(text(f'ALTER TABLE {new_name} RENAME TO "{table.name}"'))
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _has_cascade(conn, table_name, column_name):
+    for fk in conn.execute(text(f'PRAGMA foreign_key_list("{table_name}")')).mappings():
+        if fk['from'] == column_name:
+            return fk['on_delete'] == 'CASCADE'
+    return False
+
+
+def _cascade_court_tables(conn):
+    # Courts and their players are now removed by the database when a match is deleted.
+    from app.models import Court, CourtPlayer
+    if not _has_cascade(conn, 'court', 'match_id'):
+        _rebuild_table(conn, Court.__table__)
+    if not _has_cascade(conn, 'court_player', 'court_id'):
+        _rebuild_table(conn, CourtPlayer.__table__)
+
+
+def _add_column(conn, table, column):
+    if column.name not in _column_names(conn, table.name):
+        column_type = column.type.compile(dialect=conn.dialect)
+        conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN {column.name} {column_type}'))
+
+
+def _rating_columns(conn):
+    # Player ratings and the rating change each recorded result applied.
+    from app.models import Player, Court
+    _add_column(conn, Player.__table__, Player.__table__.c.rating)
+    _add_column(conn, Court.__table__, Court.__table__.c.rating_delta)
+
+
+def _player_stats(conn):
+    # The player_stats table is created by db.create_all(). It is filled from the saved history by
+    # _packed_roster_snapshots, because rebuild_stats() reads the roster column that step adds.
+    pass
+
+
+def _player_sort_indexes(conn):
+    # A stored skill rank plus one composite index per draft sort order.
+    from app.models import Player, SKILL_RANKS, UNKNOWN_SKILL_RANK
+    if 'skill_rank' not in _column_names(conn, 'player'):
+        conn.execute(text(f'ALTER TABLE player ADD COLUMN skill_rank INTEGER NOT NULL DEFAULT {UNKNOWN_SKILL_RANK}'))
+        for skill, rank in SKILL_RANKS.items():
+            conn.execute(text('UPDATE player SET skill_rank = :rank WHERE skill = :skill'), {'rank': rank, 'skill': skill})
+    for index in Player.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _match_versions(conn):
+    # A version number and last-changed time per match for HTTP caching.
+    if 'version' not in _column_names(conn, 'match'):
+        conn.execute(text('ALTER TABLE "match" ADD COLUMN version INTEGER NOT NULL DEFAULT 1'))
+    if 'updated_at' not in _column_names(conn, 'match'):
+        conn.execute(text('ALTER TABLE "match" ADD COLUMN updated_at DATETIME'))
+        conn.execute(text('UPDATE "match" SET updated_at = created_at'))
+
+
+def _packed_roster_snapshots(conn):
+    # The comma-joined snapshot strings and the match_roster table are replaced by one packed roster column.
+    from app.models import Match
+    from app.roster import pack_match_roster
+    columns = _column_names(conn, 'match')
+    if 'roster_snapshot' not in columns:
+        conn.execute(text('ALTER TABLE "match" ADD COLUMN roster_snapshot BLOB'))
+
+    if 'player_ids_snapshot' in columns:
+        # Anyone in a match's roster who was not on one of its courts was resting.
+        played = {}
+        for match_id, player_id in conn.execute(text(
+                'SELECT court.match_id, court_player.player_id FROM court_player JOIN court ON court.id = court_player.court_id')):
+            played.setdefault(match_id, set()).add(player_id)
+        linked = {}
+        if conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'match_roster'")).first():
+            for match_id, player_id in conn.execute(text('SELECT match_id, player_id FROM match_roster ORDER BY rowid')):
+                linked.setdefault(match_id, []).append(player_id)
+
+        updates = []
+        for match_id, snapshot in conn.execute(text('SELECT id, player_ids_snapshot FROM "match"')):
+            player_ids = [int(i) for i in (snapshot or '').split(',') if i] or linked.get(match_id, [])
+            resting_ids = [i for i in player_ids if i not in played.get(match_id, ())]
+            updates.append({'id': match_id, 'snapshot': pack_match_roster(player_ids, resting_ids)})
+        if updates:
+            conn.execute(text('UPDATE "match" SET roster_snapshot = :snapshot WHERE id = :id'), updates)
+        _rebuild_table(conn, Match.__table__) # Drops the two old text columns.
+
+        # Recount the player totals now that rests can be read from the new snapshots.
+        # rebuild_stats() also works out the rest debt, so its column (step 8) has to exist first.
+        from app.stats import rebuild_stats
+        _add_rest_debt_column(conn)
+        rebuild_stats(conn)
+
+    conn.execute(text('DROP TABLE IF EXISTS match_roster'))
+
+
+def _match_seeds(conn):
+    # The seed each match's pairings were generated with.
+    from app.models import Match
+    _add_column(conn, Match.__table__, Match.__table__.c.seed)
+
+
+def _add_rest_debt_column(conn):
+    # Returns whether the column was missing. Databases that went through _packed_roster_snapshots
+    # after this column existed already have it, filled in by rebuild_stats().
+    if 'rest_debt' in _column_names(conn, 'player_stats'):
+        return False
+    conn.execute(text('ALTER TABLE player_stats ADD COLUMN rest_debt INTEGER NOT NULL DEFAULT 0'))
+    return True
+
+
+def _rest_queue(conn):
+    # How many rounds each player has rested since they last played, filled in from the saved rosters.
+    from app.models import Match, PlayerStats
+    from app.stats import rest_debts
+    if _add_rest_debt_column(conn):
+        # rest_debts() leaves out replaced matches, so that column (step 12) has to exist first.
+        _add_column(conn, Match.__table__, Match.__table__.c.replaced_by)
+        updates = [{'player_id': player_id, 'debt': debt} for player_id, debt in rest_debts(conn).items() if debt]
+        if updates:
+            conn.execute(text('UPDATE player_stats SET rest_debt = :debt WHERE player_id = :player_id'), updates)
+    for index in PlayerStats.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _match_seat_priorities(conn):
+    # The rest queue each match was generated with, needed with the seed to reproduce it.
+    from app.models import Match
+    _add_column(conn, Match.__table__, Match.__table__.c.seat_priority)
+
+
+def _court_player_rest_debts(conn):
+    # The rest debt each player had before a match seated them. Older matches leave it empty.
+    from app.models import CourtPlayer
+    _add_column(conn, CourtPlayer.__table__, CourtPlayer.__table__.c.rest_debt)
+
+
+def _replaced_matches(conn):
+    # This step's replaced_match table came from db.create_all(); step 12 drops it again.
+    pass
+
+
+def _match_replacements(conn):
+    # Regenerated matches are now kept and point at the match that replaced them. Until now they were deleted,
+    # so there is nothing to fill in, and the replaced_match redirects they left behind are no longer used.
+    from app.models import Match
+    _add_column(conn, Match.__table__, Match.__table__.c.replaced_by)
+    conn.execute(text('DROP TABLE IF EXISTS replaced_match'))
+
+
+def _archive_batches(conn):
+    # The archive_batch table is created by db.create_all(). Pending files left from before it existed have no
+    # rows, so they are discarded like batches whose DELETE never happened.
+    pass
+
+
+MIGRATIONS = [
+    _cascade_court_tables,
+    _rating_columns,
+    _player_stats,
+    _player_sort_indexes,
+    _match_versions,
+    _packed_roster_snapshots,
+    _match_seeds,
+    _rest_queue,
+    _match_seat_priorities,
+    _court_player_rest_debts,
+    _replaced_matches,
+    _match_replacements,
+    _archive_batches,
+]
+
+
+def upgrade():
+    """Apply any migration steps the current database has not seen yet."""
+    if db.engine.dialect.name != 'sqlite':
+        return
+    with db.engine.connect() as conn:
+        version = conn.execute(text('PRAGMA user_version')).scalar()
+        if version >= len(MIGRATIONS):
+            return
+        # Foreign keys have to be off while tables are rebuilt, and this pragma only works outside a transaction.
+        conn.execute(text('PRAGMA foreign_keys=OFF'))
+        conn.commit()
+        for step_number, step in enumerate(MIGRATIONS[version:], start=version + 1):
+            step(conn)
+            conn.execute(text(f'PRAGMA user_version = {step_number}'))
+            conn.commit()
+        conn.execute(text('PRAGMA foreign_keys=ON'))
@@ -1,17 +1,32 @@
 from app import db
 from datetime import datetime
 
-match_roster = db.Table('match_roster',
-    db.Column('match_id', db.Integer, db.ForeignKey('match.id', ondelete="CASCADE"), primary_key=True),
-    db.Column('player_id', db.Integer, db.ForeignKey('player.id', ondelete="CASCADE"), primary_key=True)
-)
+# Stored sort position for each skill level, highest skill first, so sorting by skill can use an index.
+SKILL_RANKS = {'Advanced': 0, 'Intermediate': 1, 'Beginner': 2}
+UNKNOWN_SKILL_RANK = 3
+
+def skill_rank(skill):
+    return SKILL_RANKS.get(skill, UNKNOWN_SKILL_RANK)
+
+def _default_skill_rank(context):
+    # Filled in on every insert, including bulk inserts that skip the ORM.
+    return skill_rank(context.get_current_parameters()['skill'])
 
 class Player(db.Model):
     __tablename__ = 'player'
+    # One index per draft sort order, ending in id so every page can carry on exactly where the last one stopped.
+    __table_args__ = (
+        db.Index('ix_player_name_id', 'name', 'id'),
+        db.Index('ix_player_gender_name_id', 'gender', 'name', 'id'),
+        db.Index('ix_player_skill_rank_name_id', 'skill_rank', 'name', 'id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     skill = db.Column(db.String(20), nullable=False)
+    skill_rank = db.Column(db.Integer, nullable=False, default=_default_skill_rank)
     gender = db.Column(db.String(10), nullable=False)
+    # Elo-style rating kept up to date from recorded results. None until the player's first rated game.
+    rating = db.Column(db.Float, nullable=True)
     court_players = db.relationship('CourtPlayer', back_populates='player')
 
 class Match(db.Model):
@@ -19,36 +34,86 @@ class Match(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     num_courts = db.Column(db.Integer, nullable=False)
     match_type = db.Column(db.String(20), nullable=False, default='random')
-    player_ids_snapshot = db.Column(db.String, nullable=True)
     created_at = db.Column(db.DateTime, index=True, default=datetime.utcnow)
-    resting_players_snapshot = db.Column(db.Text, nullable=True)
-    # The relationship to Player for the historical roster snapshot.
-    roster = db.relationship('Player', secondary=match_roster, lazy='subquery',
-                             backref=db.backref('matches', lazy=True))
-    courts = db.relationship('Court', back_populates='match', cascade='all, delete-orphan')
+    # Everyone in the draft for this match and who rested, packed by roster.pack_match_roster().
+    # Names are not copied here; they come from CourtPlayer (players on a court) or Player (resting players).
+    roster_snapshot = db.Column(db.LargeBinary, nullable=True)
+    # Bumped on every change to the match (e.g. a winner being set); cached pages and ETags are keyed on it.
+    version = db.Column(db.Integer, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # The random seed the pairings were generated with. None for planned sessions.
+    seed = db.Column(db.BigInteger, nullable=True)
+    # The rest queue the pairings were generated with (player ids, longest waiting first), packed by
+    # roster.pack_player_ids(). The seed, this and the roster reproduce the pairings (see candidates.reproduce).
+    seat_priority = db.Column(db.LargeBinary, nullable=True)
+    # The match that was regenerated from this one. A replaced match stays in the history but no longer counts
+    # towards the player totals or the rest queue, and no results can be recorded on it.
+    # Not a foreign key: pruning deletes the oldest matches first, so it may outlive the match it points at.
+    replaced_by = db.Column(db.Integer, nullable=True)
+    # passive_deletes lets the database cascade remove the courts when a match is deleted.
+    courts = db.relationship('Court', back_populates='match', cascade='all, delete-orphan', passive_deletes=True,
+                             order_by='Court.court_number')
 
 class Court(db.Model):
     __tablename__ = 'court'
     id = db.Column(db.Integer, primary_key=True)
-    match_id = db.Column(db.Integer, db.ForeignKey('match.id'), nullable=False)
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id', ondelete="CASCADE"), nullable=False, index=True)
     court_number = db.Column(db.Integer, nullable=False) 
     winning_team = db.Column(db.Integer, nullable=True)
+    # Rating change given to each team 1 player (team 2 got the opposite) for the recorded result, so it can be undone.
+    rating_delta = db.Column(db.Float, nullable=True)
     
     match = db.relationship('Match', back_populates='courts')
     
     # The cascade here IS correct: if a Court is deleted, all its player links should go too.
-    court_players = db.relationship('CourtPlayer', back_populates='court', cascade='all, delete-orphan')
+    # Ordered by id so team 1 (saved first) always comes before team 2.
+    court_players = db.relationship('CourtPlayer', back_populates='court', cascade='all, delete-orphan', passive_deletes=True,
+                                    order_by='CourtPlayer.id')
 
 class CourtPlayer(db.Model):
     __tablename__ = 'court_player'
     id = db.Column(db.Integer, primary_key=True)
-    court_id = db.Column(db.Integer, db.ForeignKey('court.id'), nullable=False)
+    court_id = db.Column(db.Integer, db.ForeignKey('court.id', ondelete="CASCADE"), nullable=False, index=True)
     player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete="SET NULL"), nullable=True)
     
     # This is the snapshot of the player's name, which is now the source of truth for history.
     player_name = db.Column(db.String(100), nullable=False)
+    # The player's rest debt just before this match cleared it, so regenerating the match can give it back.
+    rest_debt = db.Column(db.Integer, nullable=True)
     
     court = db.relationship('Court', back_populates='court_players')
     # The relationship to Player. This will be 'None' if the player has been deleted.
     player = db.relationship('Player', back_populates='court_players')
-    
\ No newline at end of file
+    
+class DataVersion(db.Model):
+    # A counter per kind of shared data ('players', 'ratings'), bumped in the same transaction as every change to it.
+    # Each worker process keeps its own cached copies and compares these counters to see whether they are still current.
+    __tablename__ = 'data_version'
+    name = db.Column(db.String(20), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+class ArchiveBatch(db.Model):
+    # One row per batch of pruned matches staged in the archive, named after its pending file (see app/archive.py).
+    # The prune inserts it with deleted=True in the same transaction as the batch's DELETE, so the row exists
+    # exactly when the matches were really deleted. Recovering a leftover pending file inserts deleted=False
+    # before discarding it; a prune that was only slow then fails to insert its row and keeps its matches.
+    __tablename__ = 'archive_batch'
+    name = db.Column(db.String(64), primary_key=True)
+    deleted = db.Column(db.Boolean, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+class PlayerStats(db.Model):
+    # Running totals per player, kept up to date as matches and results are saved.
+    # They are not removed when old matches are pruned from the history.
+    __tablename__ = 'player_stats'
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete="CASCADE"), primary_key=True)
+    # Each count is indexed so the leaderboard can read the top rows in order without sorting the table.
+    games_played = db.Column(db.Integer, nullable=False, default=0, index=True)
+    wins = db.Column(db.Integer, nullable=False, default=0, index=True)
+    losses = db.Column(db.Integer, nullable=False, default=0, index=True)
+    rests = db.Column(db.Integer, nullable=False, default=0, index=True)
+    # Rounds rested since the player was last on a court. The highest values are seated first next round
+    # (see stats.rest_queue); the index keeps that an ordered read of the first few rows.
+    rest_debt = db.Column(db.Integer, nullable=False, default=0, index=True)
+
+    player = db.relationship('Player')
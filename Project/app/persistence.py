@@ -0,0 +1,355 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from operator import itemgetter
+from flask import current_app, after_this_request
+from sqlalchemy import bindparam, insert, update, delete, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models import Match, Court, CourtPlayer, PlayerStats, ArchiveBatch
+from app.roster import pack_match_roster, pack_player_ids, unpack_match_roster
+from app import stats, http_cache, instrumentation, archive
+
+
+@instrumentation.timed('persistence.save_match')
+def save_match(match_type, roster, match_data, commit=True, seed=None, priority=(), replaces=None):
+    """Write a whole Match with its courts, court players and roster snapshot.
+
+    Every table gets a single batched INSERT (instead of one flush per court)
+    and everything is committed together, so the number of statements does not
+    grow with the number of courts. Returns the id of the new match.
+
+    Pass commit=False to save several matches in one transaction; the caller
+    then commits once at the end. seed and priority are the random seed and
+    rest queue the pairings were generated with, if any. replaces is a match
+    the new one was regenerated from (see take_back_match); it is marked as
+    replaced in the same transaction.
+    """
+    # Work out who is playing so the resting players can be flagged in the snapshot.
+    player_ids_in_match = {p.id for d in match_data for p in d['team1'] + d['team2']}
+    roster_ids = [p.id for p in roster]
+    resting_ids = [i for i in roster_ids if i not in player_ids_in_match]
+
+    new_match = Match(
+        num_courts=len(match_data),
+        match_type=match_type,
+        roster_snapshot=pack_match_roster(roster_ids, resting_ids), # Everyone in the draft for this match, and who rested.
+        seed=seed,
+        seat_priority=pack_player_ids(priority) if priority else None
+    )
+    db.session.add(new_match)
+    db.session.flush() # One INSERT for the match itself, needed for its id.
+
+    # One INSERT for every court. Court numbers are unique within a match, so they map the returned ids back to the courts.
+    court_rows = [{'match_id': new_match.id, 'court_number': data['court']} for data in match_data]
+    returned = db.session.execute(insert(Court).returning(Court.id, Court.court_number), court_rows)
+    court_ids = {court_number: court_id for court_id, court_number in returned}
+
+    # One INSERT for every player placed on a court. Each row also keeps the player's rest debt from before this
+    # match (read inside the INSERT), because record_match() below clears it.
+    court_player_rows = [
+        {'court_id': court_ids[data['court']], 'player_id': player.id, 'player_name': player.name, # Snapshot the name in case the player changes later.
+         'debt_player_id': player.id}
+        for data in match_data
+        for player in data['team1'] + data['team2']
+    ]
+    if court_player_rows:
+        debt_before = select(PlayerStats.rest_debt).where(PlayerStats.player_id == bindparam('debt_player_id')).scalar_subquery()
+        db.session.execute(insert(CourtPlayer).values(rest_debt=debt_before), court_player_rows)
+
+    # One upsert adds a game or a rest to every player's running totals.
+    stats.record_match(player_ids_in_match, resting_ids)
+
+    if replaces is not None:
+        # The old match stays in the history, marked as replaced. take_back_match() gave it a new version already.
+        db.session.execute(update(Match).where(Match.id == replaces.id).values(replaced_by=new_match.id))
+
+    match_id = new_match.id
+    if commit:
+        db.session.commit()
+        http_cache.invalidate_history()
+    return match_id
+
+
+def read_take_back(match):
+    """What taking back a match changes in the player totals (stats.take_back_changes), read without writing.
+
+    The game or rest it gave every player is taken back and the rest debts it
+    changed are restored. Pass the result to stats.rest_queue() to see the
+    queue the regenerated pairings will be made from.
+    """
+    # Who was on a court, with the rest debt each had before the match.
+    playing_debts = dict(db.session.execute(
+        select(CourtPlayer.player_id, CourtPlayer.rest_debt)
+        .join(Court, Court.id == CourtPlayer.court_id)
+        .where(Court.match_id == match.id, CourtPlayer.player_id.is_not(None))
+    ).all())
+
+    # Usually the newest match is regenerated and nobody has played since; otherwise newer matches set some debts.
+    resting_ids = unpack_match_roster(match.roster_snapshot)[1]
+    seated_later = set(db.session.scalars(
+        select(CourtPlayer.player_id).distinct()
+        .join(Court, Court.id == CourtPlayer.court_id)
+        .join(Match, Match.id == Court.match_id)
+        .where(Court.match_id > match.id, Match.replaced_by.is_(None),
+               CourtPlayer.player_id.in_(list(playing_debts) + resting_ids))
+    ))
+    return stats.take_back_changes(playing_debts, resting_ids, seated_later)
+
+
+def take_back_match(match):
+    """Take back what a match counted for, before regenerated pairings replace it.
+
+    Only a match without results can be replaced (see has_results). Returns
+    False, writing nothing, if the match changed since it was loaded: a result
+    was recorded on it or it was regenerated elsewhere. Otherwise pass the match
+    to save_match() as replaces= to mark it along with saving the new one, and
+    commit. The first write here takes the write lock, so call it only when the
+    new pairings are ready.
+    """
+    # Claim the match first: the version moves with every result and with every regenerate.
+    claimed = db.session.execute(
+        update(Match).where(Match.id == match.id, Match.version == match.version, Match.replaced_by.is_(None))
+        .values(version=Match.version + 1, updated_at=datetime.utcnow())
+    ).rowcount
+    if not claimed:
+        return False
+    # Read again inside the write, in case another match was saved since read_take_back().
+    stats.unrecord_match(read_take_back(match))
+    return True
+
+
+def has_results(match_id):
+    # Whether any court of the match has a winner recorded.
+    return db.session.scalar(
+        select(Court.id).where(Court.match_id == match_id, Court.winning_team.is_not(None)).limit(1)
+    ) is not None
+
+
+def _read_matches(match_ids):
+    # The archive records of these matches and their (id, version) pairs, read with three plain SELECTs.
+    # Core statements on the session's connection: thousands of rows skip the ORM bookkeeping.
+    connection = db.session.connection()
+    match_rows = connection.execute(
+        select(Match.id, Match.version, Match.created_at, Match.match_type, Match.num_courts, Match.seed,
+               Match.seat_priority, Match.replaced_by, Match.roster_snapshot)
+        .where(Match.id.in_(match_ids))
+    ).all()
+    court_rows = connection.execute(
+        select(Court.id, Court.match_id, Court.court_number, Court.winning_team, Court.rating_delta)
+        .where(Court.match_id.in_(match_ids))
+    ).all()
+    court_player_rows = connection.execute(
+        select(CourtPlayer.id, CourtPlayer.court_id, CourtPlayer.player_id, CourtPlayer.player_name)
+        .join(Court, Court.id == CourtPlayer.court_id)
+        .where(Court.match_id.in_(match_ids))
+    ).all()
+
+    # Court players sorted by id put team 1 first on every court.
+    players_by_court = {}
+    for _, court_id, player_id, player_name in sorted(court_player_rows, key=itemgetter(0)):
+        players_by_court.setdefault(court_id, []).append([player_id, player_name])
+    courts_by_match = {}
+    for court_id, match_id, court_number, winning_team, rating_delta in court_rows:
+        courts_by_match.setdefault(match_id, []).append(
+            (court_number, winning_team, rating_delta, players_by_court.get(court_id, []))
+        )
+    records = [
+        archive.match_record(match, courts_by_match.get(match.id, []))
+        for match in sorted(match_rows, key=lambda m: (m.created_at, m.id))
+    ]
+    return records, [(match.id, match.version) for match in match_rows]
+
+
+def _archive_and_delete(match_ids):
+    """Write these matches to the archive, then delete them. Returns the deleted ids.
+
+    The archive block is written before the DELETE transaction starts and
+    only added to the archive index after it commits, so the database write
+    lock is never held during file I/O and a rolled back DELETE leaves
+    nothing in the archive. The DELETE only removes the matches at the
+    versions that were read; if one changed meanwhile (e.g. a winner was
+    set), nothing is deleted and None is returned so the batch is read again.
+    The same goes if another prune has given this batch up for abandoned
+    (see _finish_pending_archive).
+    """
+    if not match_ids:
+        return []
+    records, versions = _read_matches(match_ids)
+    db.session.commit() # End the read before the file I/O, so no lock is held while it runs.
+    entry = archive.stage_matches(records)
+    try:
+        deleted = db.session.scalars(
+            delete(Match).where(tuple_(Match.id, Match.version).in_(versions)).returning(Match.id),
+            execution_options={'synchronize_session': False}
+        ).all()
+        if len(deleted) != len(versions):
+            db.session.rollback()
+            archive.discard(entry)
+            return None
+        # Committed with the DELETE, so recovery can tell that these matches really are gone.
+        db.session.execute(insert(ArchiveBatch).values(name=os.path.basename(entry['pending']), deleted=True))
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback() # Recovery took the batch for abandoned and discarded it; keep the matches.
+        archive.discard(entry)
+        return None
+    except Exception:
+        db.session.rollback()
+        archive.discard(entry)
+        raise
+    archive.publish(entry)
+    return deleted
+
+
+# How long archive_batch rows are kept. Recovery waits archive.PENDING_MAX_AGE before it looks at a pending file,
+# so a row only has to outlast the slowest prune; a day leaves plenty of room.
+ARCHIVE_BATCH_MAX_AGE = 24 * 60 * 60
+
+
+def _finish_pending_archive():
+    # A prune that stopped between staging a batch and publish() left its index line pending. Its archive_batch
+    # row says whether its DELETE was committed: then the line is published. Without a row the DELETE never
+    # happened (the same matches may have been archived by a later prune since), so the line is dropped, after
+    # a deleted=False row is committed in its place; a prune that is only slow fails to add its own row then,
+    # and rolls its DELETE back.
+    for entry in archive.pending_entries():
+        name = os.path.basename(entry['pending'])
+        deleted = db.session.scalar(select(ArchiveBatch.deleted).where(ArchiveBatch.name == name))
+        if deleted is None:
+            try:
+                db.session.execute(insert(ArchiveBatch).values(name=name, deleted=False))
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback() # Its prune committed just now.
+                deleted = db.session.scalar(select(ArchiveBatch.deleted).where(ArchiveBatch.name == name))
+        if deleted:
+            archive.publish(entry)
+        else:
+            archive.discard(entry)
+
+    # Rows are only needed while their pending file may still be around.
+    expired = datetime.utcnow() - timedelta(seconds=ARCHIVE_BATCH_MAX_AGE)
+    if db.session.scalar(select(ArchiveBatch.name).where(ArchiveBatch.created_at < expired).limit(1)) is not None:
+        db.session.execute(delete(ArchiveBatch).where(ArchiveBatch.created_at < expired))
+        db.session.commit()
+
+
+def prune_history(history_limit, batch_size=None):
+    """Remove every match older than the newest `history_limit` ones from the database.
+
+    Batches of HISTORY_PRUNE_BATCH_SIZE matches are committed one at a
+    time, so a winner being recorded at the same time only ever waits for one
+    short batch. With ARCHIVE_ENABLED each batch is first written to the
+    compressed archive (see app/archive.py), outside the transaction that
+    deletes it. The DELETE is cascaded by the database to court and
+    court_player, and no Match objects are loaded. Returns how many matches
+    were removed.
+    """
+    batch_size = batch_size or current_app.config['HISTORY_PRUNE_BATCH_SIZE']
+    archiving = current_app.config['ARCHIVE_ENABLED']
+    start = time.perf_counter()
+    deleted_ids = []
+    if archiving:
+        _finish_pending_archive()
+    while True:
+        # The next batch after the first `history_limit` rows, newest first.
+        old_match_ids = (
+            select(Match.id)
+            .order_by(Match.created_at.desc(), Match.id.desc())
+            .limit(batch_size)
+            .offset(history_limit)
+        )
+        if archiving:
+            batch = _archive_and_delete(db.session.scalars(old_match_ids).all())
+            if batch is None:
+                continue # A match in the batch changed while it was being archived; read the batch again.
+        else:
+            batch = db.session.scalars(
+                delete(Match).where(Match.id.in_(old_match_ids)).returning(Match.id),
+                execution_options={'synchronize_session': False}
+            ).all()
+        db.session.commit()
+        # Drop the cached pages of the deleted matches and the history list that still shows them.
+        for match_id in batch:
+            http_cache.invalidate_match(match_id)
+        if batch:
+            http_cache.invalidate_history()
+        deleted_ids += batch
+        if len(batch) < batch_size:
+            break
+    elapsed = (time.perf_counter() - start) * 1000
+    instrumentation.observe('persistence.prune_history.ms', elapsed)
+    if deleted_ids:
+        instrumentation.log_event('history_prune', limit=history_limit, deleted=len(deleted_ids),
+                                  archived=archiving, ms=round(elapsed, 3))
+    return len(deleted_ids)
+
+
+def _prune_in_app_context(app):
+    with app.app_context():
+        try:
+            prune_history(app.config['MAX_MATCHES'])
+        except Exception:
+            db.session.rollback()
+            instrumentation.logger.exception("Could not prune match history.")
+        finally:
+            db.session.remove()
+
+
+# Each app's background worker is started on first use and wakes up whenever a prune is requested.
+# Several requests arriving while it works are folded into one run.
+_prune_worker_lock = threading.Lock()
+# Inline prunes of one process take turns. Two at once would read and archive the same oldest batches, and only
+# one of them can delete each; the second finds little left to do once the first is done.
+_inline_prune_lock = threading.Lock()
+
+
+def _prune_worker_loop(app, requested):
+    while True:
+        requested.wait()
+        requested.clear()
+        _prune_in_app_context(app)
+
+
+def _wake_prune_worker(app):
+    with _prune_worker_lock:
+        requested, worker = app.extensions.get('history_prune_worker', (None, None))
+        if worker is None or not worker.is_alive():
+            requested = threading.Event()
+            worker = threading.Thread(target=_prune_worker_loop, args=(app, requested), name='history-prune', daemon=True)
+            worker.start()
+            app.extensions['history_prune_worker'] = (requested, worker)
+    requested.set()
+
+
+def schedule_history_prune():
+    """Trim the match history according to the HISTORY_PRUNE_MODE setting.
+
+    'inline' prunes straight away and returns how many matches were removed.
+    'deferred' prunes once the response has been sent to the browser and
+    'background' hands it to a worker thread; both return None because the
+    request that created the match never waits for them.
+    """
+    app = current_app._get_current_object()
+    mode = app.config.get('HISTORY_PRUNE_MODE', 'inline')
+
+    if mode == 'background':
+        _wake_prune_worker(app)
+        return None
+
+    if mode == 'deferred':
+        @after_this_request
+        def prune_after_response(response):
+            response.call_on_close(lambda: _prune_in_app_context(app))
+            return response
+        return None
+
+    try:
+        with _inline_prune_lock:
+            return prune_history(app.config['MAX_MATCHES'])
+    except Exception:
+        db.session.rollback()
+        instrumentation.logger.exception("Could not prune match history.")
+        raise
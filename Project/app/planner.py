@@ -0,0 +1,144 @@
+import numpy as np
+from app import db
+from app.models import Match, CourtPlayer
+from app import matchmaking
+from app.roster import unpack_match_roster
+
+# The team splits from matchmaking, as an array for NumPy indexing.
+TEAM_SPLITS = np.array(matchmaking.TEAM_SPLITS)
+
+# How much a repeated partner and a repeated opponent cost when arranging a round.
+PARTNER_WEIGHT = 1.0
+OPPONENT_WEIGHT = 0.5
+
+
+class PlayHistory:
+    """Partner, opponent and rest counts for one roster, held as NumPy arrays.
+
+    Players are addressed by their position in the roster. The counts can be
+    loaded from the saved Court/CourtPlayer history and are then updated in
+    place one round at a time, so planning never re-reads the history.
+    """
+
+    def __init__(self, player_ids):
+        self.player_ids = list(player_ids)
+        self.index = {player_id: i for i, player_id in enumerate(self.player_ids)}
+        # Players outside this roster all share one spare slot at the end,
+        # so the courts they were on still count for everyone else.
+        self.outside = len(self.player_ids)
+        size = len(self.player_ids) + 1
+        self.partners = np.zeros((size, size), dtype=np.int32)
+        self.opponents = np.zeros((size, size), dtype=np.int32)
+        self.rests = np.zeros(size, dtype=np.int32)
+
+    @classmethod
+    def from_database(cls, player_ids):
+        history = cls(player_ids)
+        if not history.player_ids:
+            return history
+
+        # Everyone who was placed on a court in the saved matches, in the order they were saved (team 1 first).
+        rows = db.session.execute(
+            db.select(CourtPlayer.court_id, CourtPlayer.player_id)
+            .order_by(CourtPlayer.court_id, CourtPlayer.id)
+        ).all()
+        courts = {}
+        for court_id, player_id in rows:
+            courts.setdefault(court_id, []).append(history.index.get(player_id, history.outside))
+
+        full_courts = [c for c in courts.values() if len(c) == 4]
+        if full_courts:
+            history.record_courts(np.array(full_courts))
+
+        # Resting players are flagged in each match's roster snapshot.
+        for snapshot in db.session.execute(db.select(Match.roster_snapshot)).scalars():
+            resting = [history.index[i] for i in unpack_match_roster(snapshot)[1] if i in history.index]
+            history.rests[resting] += 1
+        return history
+
+    def record_courts(self, courts):
+        # courts is an array of shape (courts, 4): two players of team 1, then two of team 2.
+        team1_a, team1_b, team2_a, team2_b = courts.T
+        for a, b in ((team1_a, team1_b), (team2_a, team2_b)):
+            np.add.at(self.partners, (a, b), 1)
+            np.add.at(self.partners, (b, a), 1)
+        for a in (team1_a, team1_b):
+            for b in (team2_a, team2_b):
+                np.add.at(self.opponents, (a, b), 1)
+                np.add.at(self.opponents, (b, a), 1)
+
+    def record_round(self, courts, resting):
+        self.record_courts(courts)
+        self.rests[resting] += 1
+
+    def court_costs(self, courts):
+        # The repeat cost of every court (last axis holds four players) for each of the three team splits.
+        a = courts[..., TEAM_SPLITS[:, 0]]
+        b = courts[..., TEAM_SPLITS[:, 1]]
+        c = courts[..., TEAM_SPLITS[:, 2]]
+        d = courts[..., TEAM_SPLITS[:, 3]]
+        partner_cost = self.partners[a, b] + self.partners[c, d]
+        opponent_cost = self.opponents[a, c] + self.opponents[a, d] + self.opponents[b, c] + self.opponents[b, d]
+        return PARTNER_WEIGHT * partner_cost + OPPONENT_WEIGHT * opponent_cost
+
+
+def _choose_resting(rests, num_resting, rng):
+    # The players who have rested the least sit out next; ties are broken at random.
+    order = np.lexsort((rng.random(len(rests)), rests))
+    return order[:num_resting], order[num_resting:]
+
+
+def _arrange_courts(history, playing, rng, max_passes):
+    # Start from a random arrangement and swap single players between courts while it lowers the repeat cost.
+    courts = rng.permutation(playing).reshape(-1, 4)
+    num_courts = len(courts)
+    window = min(matchmaking.SWAP_WINDOW, num_courts - 1)
+
+    def court_pairs():
+        # Compare every court with the next few courts of a fresh random ordering each pass.
+        ring = rng.permutation(num_courts)
+        first = np.repeat(ring, window)
+        second = ring[(np.repeat(np.arange(num_courts), window) + np.tile(np.arange(1, window + 1), num_courts)) % num_courts]
+        return first, second
+
+    courts = matchmaking.improve_courts(courts, lambda players: history.court_costs(players).min(axis=-1), max_passes, court_pairs)
+
+    # Put every court into the team split with the fewest repeats.
+    splits = history.court_costs(courts).argmin(axis=-1)
+    return np.take_along_axis(courts, TEAM_SPLITS[splits], axis=1)
+
+
+def plan_session(players, num_courts, num_rounds, history=None, seed=None, max_passes=20):
+    """Plan several rounds for a roster in one go.
+
+    Each round rests the players who have rested least so far and arranges
+    the rest to avoid repeat partners and opponents. The history is updated
+    after every round, so later rounds take the earlier ones into account.
+    Returns one list of {'court', 'team1', 'team2'} dictionaries per round.
+    """
+    players = list(players)
+    possible_courts = min(num_courts, len(players) // 4)
+    if possible_courts == 0 or num_rounds < 1:
+        return []
+
+    if history is None:
+        history = PlayHistory.from_database([p.id for p in players])
+    positions = np.array([history.index[p.id] for p in players])
+    by_position = {history.index[p.id]: p for p in players}
+    rng = np.random.default_rng(seed)
+
+    rounds = []
+    for _ in range(num_rounds):
+        resting, playing = _choose_resting(history.rests[positions], len(players) - possible_courts * 4, rng)
+        courts = _arrange_courts(history, positions[playing], rng, max_passes)
+        history.record_round(courts, positions[resting])
+
+        rounds.append([
+            {
+                'court': court_num,
+                'team1': [by_position[court[0]], by_position[court[1]]],
+                'team2': [by_position[court[2]], by_position[court[3]]]
+            }
+            for court_num, court in enumerate(courts, start=1)
+        ])
+    return rounds
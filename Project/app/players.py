@@ -0,0 +1,192 @@
+import base64
+import csv
+import json
+import threading
+from flask import current_app
+from sqlalchemy import func, select, tuple_, insert
+from app import db
+from app.models import Player
+from app.forms import NAME_MAX_LENGTH, SKILL_CHOICES, GENDER_CHOICES
+from app.roster import invalidate_roster, bump_version, data_versions, PLAYERS
+
+# The draft sort orders. Each one matches a composite index on the player table and ends in id,
+# so together the columns identify a row exactly and a page can start right after the previous one.
+DRAFT_SORTS = {
+    'name': (Player.name, Player.id),
+    'gender': (Player.gender, Player.name, Player.id),
+    'skill': (Player.skill_rank, Player.name, Player.id),
+}
+DRAFT_SORTS['id'] = DRAFT_SORTS['name'] # The old default sort key, kept so existing links still work.
+
+
+def encode_cursor(values):
+    # The sort key of a row, as a short url-safe token.
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode().rstrip('=')
+
+
+def decode_cursor(token, expected_length):
+    # Returns None for a missing or damaged token, which just means "start from the first page".
+    if not token:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(values, list) or len(values) != expected_length:
+        return None
+    return values
+
+
+def draft_page(sort_by='name', after=None, before=None, page_size=50):
+    """One page of the draft list using keyset (seek) pagination.
+
+    Instead of OFFSET, the query starts right after (or right before) the
+    sort key of the row in the cursor, so it reads one index range of
+    page_size + 1 rows whatever page it is on and however big the roster.
+    Returns (players, previous_cursor, next_cursor); a cursor is None when
+    there is no page in that direction.
+    """
+    columns = DRAFT_SORTS.get(sort_by, DRAFT_SORTS['name'])
+    key = tuple_(*columns)
+    after_values = decode_cursor(after, len(columns))
+    before_values = decode_cursor(before, len(columns))
+
+    query = select(Player)
+    if before_values is not None:
+        # Walk backwards from the cursor, then flip the page back into display order.
+        query = query.where(key < tuple_(*before_values)).order_by(*[c.desc() for c in columns])
+    else:
+        if after_values is not None:
+            query = query.where(key > tuple_(*after_values))
+        query = query.order_by(*columns)
+
+    # One extra row tells us whether there is another page after this one.
+    players = db.session.scalars(query.limit(page_size + 1)).all()
+    has_more = len(players) > page_size
+    players = players[:page_size]
+    if before_values is not None:
+        players.reverse()
+
+    def cursor_for(player):
+        return encode_cursor([getattr(player, c.key) for c in columns])
+
+    if before_values is not None:
+        previous_cursor = cursor_for(players[0]) if players and has_more else None
+        next_cursor = cursor_for(players[-1]) if players else None
+    else:
+        previous_cursor = cursor_for(players[0]) if players and after_values is not None else None
+        next_cursor = cursor_for(players[-1]) if players and has_more else None
+    return players, previous_cursor, next_cursor
+
+
+# The number of players is needed on every draft page load. It is counted once and then kept
+# (in app.extensions) with the 'players' data version it was counted at, instead of running COUNT(*)
+# over the whole table each time. A player added or deleted by any worker process changes that version.
+_player_count_lock = threading.Lock()
+
+
+def player_count():
+    version = data_versions()[0]
+    with _player_count_lock:
+        cached = current_app.extensions.get('player_count')
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    count = db.session.scalar(select(func.count(Player.id)))
+    with _player_count_lock:
+        current_app.extensions['player_count'] = (version, count)
+    return count
+
+
+def note_players_changed():
+    # Call in the transaction that adds or deletes players, so every worker process sees its copies are out of date.
+    bump_version(PLAYERS)
+
+
+def invalidate_player_cache():
+    # Call after adding or deleting players. Drops this process's cached count and roster snapshot straight away.
+    with _player_count_lock:
+        current_app.extensions.pop('player_count', None)
+    invalidate_roster()
+
+
+# Imported players are written in batches of this size, so a large CSV is never held in memory all at once.
+IMPORT_BATCH_SIZE = 500
+
+
+def csv_error_message(error):
+    # What to tell the uploader about a UnicodeDecodeError or csv.Error met while reading a CSV upload.
+    if isinstance(error, UnicodeDecodeError):
+        return "The row is not UTF-8 text."
+    return f"The row is not valid CSV: {error}."
+_SKILLS = {value for value, label in SKILL_CHOICES}
+_GENDERS = {value for value, label in GENDER_CHOICES}
+
+
+def validate_player_row(row):
+    """Check one imported player against the same rules as PlayerForm.
+
+    Returns (values, None) for a good row or (None, error message).
+    """
+    if not isinstance(row, dict):
+        return None, "Expected an object with name, skill and gender."
+    name = row.get('name')
+    if not isinstance(name, str) or not name.strip():
+        return None, "Name is required."
+    clean_name = ' '.join(name.split()) # Same whitespace clean-up as the draft form.
+    if len(clean_name) > NAME_MAX_LENGTH:
+        return None, f"Name must be at most {NAME_MAX_LENGTH} characters."
+    skill, gender = row.get('skill'), row.get('gender')
+    if skill not in _SKILLS:
+        return None, f"Skill must be one of {', '.join(sorted(_SKILLS))}."
+    if gender not in _GENDERS:
+        return None, f"Gender must be one of {', '.join(sorted(_GENDERS))}."
+    return {'name': clean_name, 'skill': skill, 'gender': gender}, None
+
+
+def import_players(rows):
+    """Add many players in one transaction.
+
+    rows is any iterable of player dictionaries (a parsed JSON array or a
+    csv.DictReader reading the request as it arrives). Good rows are
+    inserted in batches with one executemany INSERT each. If any row is
+    invalid, or the rows would take the draft past MAX_PLAYERS, nothing is
+    saved. Returns (number imported, errors) where each error is a
+    {'row': n, 'error': message} dictionary and rows are counted from 1.
+    A CSV row that cannot be read stops the import there, with its error.
+    """
+    space_left = current_app.config['MAX_PLAYERS'] - player_count()
+    errors = []
+    batch = []
+    imported = 0
+
+    row_number = 0
+    try:
+        for row_number, row in enumerate(rows, start=1):
+            values, error = validate_player_row(row)
+            if error is None and imported + len(batch) >= space_left:
+                error = f"The maximum number of players ({current_app.config['MAX_PLAYERS']}) has been reached."
+            if error is not None:
+                errors.append({'row': row_number, 'error': error})
+                continue
+            if errors:
+                continue # Already failing; keep checking the rest so every error is reported at once.
+            batch.append(values)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                db.session.execute(insert(Player), batch)
+                imported += len(batch)
+                batch = []
+    except (UnicodeDecodeError, csv.Error) as error:
+        # The rows are read as the upload arrives, so a broken one only shows up here.
+        db.session.rollback()
+        return 0, errors + [{'row': row_number + 1, 'error': csv_error_message(error)}]
+
+    if errors:
+        db.session.rollback()
+        return 0, errors
+    if batch:
+        db.session.execute(insert(Player), batch)
+        imported += len(batch)
+    note_players_changed()
+    db.session.commit()
+    invalidate_player_cache()
+    return imported, errors
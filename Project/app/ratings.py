@@ -0,0 +1,121 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import update
+from app import db
+from app.models import Player, Match, Court, CourtPlayer
+from app.matchmaking import player_rating, starting_rating
+from app.roster import invalidate_roster, bump_version, RATINGS
+
+# How far a single result can move a rating.
+K_FACTOR = 32.0
+
+
+def expected_score(team_rating, opponent_rating):
+    # The chance the team wins according to the Elo formula.
+    return 1.0 / (1.0 + 10 ** ((opponent_rating - team_rating) / 400.0))
+
+
+def _team_rating(ratings):
+    # Average rating of the team members that still exist. None if neither does.
+    known = [r for r in ratings if r is not None]
+    return sum(known) / len(known) if known else None
+
+
+def _rating_delta(team1_ratings, team2_ratings, winning_team):
+    # The rating change for each team 1 player; team 2 players get the opposite.
+    team1 = _team_rating(team1_ratings)
+    team2 = _team_rating(team2_ratings)
+    if team1 is None or team2 is None or winning_team not in (1, 2):
+        return None
+    score = 1.0 if winning_team == 1 else 0.0
+    return K_FACTOR * (score - expected_score(team1, team2))
+
+
+def apply_result(court, team1, team2):
+    """Update the ratings of the four players on a court for its current winner.
+
+    team1 and team2 are the court's CourtPlayer rows. Only these players are
+    touched. If a result was already applied (the winner is being changed)
+    its rating change is undone first. The caller commits.
+    """
+    team1_players = [cp.player for cp in team1 if cp.player is not None]
+    team2_players = [cp.player for cp in team2 if cp.player is not None]
+
+    # Undo the change from the previously recorded winner.
+    if court.rating_delta:
+        for player in team1_players:
+            player.rating = player_rating(player) - court.rating_delta
+        for player in team2_players:
+            player.rating = player_rating(player) + court.rating_delta
+
+    delta = _rating_delta(
+        [player_rating(p) for p in team1_players],
+        [player_rating(p) for p in team2_players],
+        court.winning_team
+    )
+    court.rating_delta = delta
+    if delta is None:
+        return
+    for player in team1_players:
+        player.rating = player_rating(player) + delta
+    for player in team2_players:
+        player.rating = player_rating(player) - delta
+
+
+def recompute_all_ratings():
+    """Rebuild every rating from scratch by replaying all recorded results in order.
+
+    Used for audits or after results have been corrected by hand. Everything
+    is read with a few queries, replayed in memory and written back in bulk.
+    Returns how many results were replayed.
+    """
+    # Everyone starts again from the rating for their skill tier.
+    players = {p.id: p.skill for p in db.session.execute(db.select(Player.id, Player.skill))}
+    ratings = {player_id: starting_rating(skill) for player_id, skill in players.items()}
+
+    courts = db.session.execute(
+        db.select(Court.id, Court.winning_team)
+        .join(Match, Match.id == Court.match_id)
+        .where(Court.winning_team.is_not(None))
+        .order_by(Match.created_at, Court.id)
+    ).all()
+    court_players = {}
+    for court_id, player_id in db.session.execute(
+        db.select(CourtPlayer.court_id, CourtPlayer.player_id)
+        .join(Court, Court.id == CourtPlayer.court_id)
+        .where(Court.winning_team.is_not(None))
+        .order_by(CourtPlayer.court_id, CourtPlayer.id)
+    ):
+        court_players.setdefault(court_id, []).append(player_id)
+
+    court_deltas = []
+    for court_id, winning_team in courts:
+        ids = court_players.get(court_id, [])
+        team1 = [i for i in ids[:2] if i in ratings]
+        team2 = [i for i in ids[2:] if i in ratings]
+        delta = _rating_delta([ratings[i] for i in team1], [ratings[i] for i in team2], winning_team)
+        court_deltas.append({'id': court_id, 'rating_delta': delta})
+        if delta is None:
+            continue
+        for i in team1:
+            ratings[i] += delta
+        for i in team2:
+            ratings[i] -= delta
+
+    db.session.execute(update(Court).where(Court.winning_team.is_(None)).values(rating_delta=None))
+    if court_deltas:
+        db.session.execute(update(Court), court_deltas)
+    if ratings:
+        db.session.execute(update(Player), [{'id': i, 'rating': r} for i, r in ratings.items()])
+    bump_version(RATINGS) # Running workers reload their rosters; this may be the CLI.
+    db.session.commit()
+    invalidate_roster()
+    return len(court_deltas)
+
+
+@click.command('recompute-ratings')
+@with_appcontext
+def recompute_ratings_command():
+    """Rebuild all player ratings from the recorded results."""
+    replayed = recompute_all_ratings()
+    click.echo(f"Recomputed ratings from {replayed} recorded result(s).")
@@ -0,0 +1,132 @@
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload, selectinload
+from app import db, stats, roster, http_cache
+from app.models import Match, Court, CourtPlayer
+from app.ratings import apply_result
+
+
+def court_teams(court):
+    # Court players are saved team 1 first, so the first two (by id) are team 1.
+    court_players = (
+        CourtPlayer.query.options(joinedload(CourtPlayer.player))
+        .filter_by(court_id=court.id)
+        .order_by(CourtPlayer.id)
+        .all()
+    )
+    return court_players[:2], court_players[2:]
+
+
+def _apply_winner(court, team_number, team1, team2):
+    # Set the winner and update ratings and win/loss totals. Returns the new ratings by player id.
+    previous_winner = court.winning_team
+    court.winning_team = team_number
+    apply_result(court, team1, team2)
+    stats.record_result(
+        [cp.player_id for cp in team1 if cp.player_id is not None],
+        [cp.player_id for cp in team2 if cp.player_id is not None],
+        previous_winner,
+        team_number
+    )
+    return {cp.player.id: cp.player.rating for cp in team1 + team2 if cp.player is not None}
+
+
+def _bump_versions(match_ids):
+    # A new version gives the match page a new ETag, so browsers holding the old page fetch it again.
+    # Regenerated matches take no results, so they are skipped; returns how many matches were bumped.
+    return db.session.execute(
+        update(Match).where(Match.id.in_(match_ids), Match.replaced_by.is_(None))
+        .values(version=Match.version + 1, updated_at=datetime.utcnow())
+    ).rowcount
+
+
+def record_winner(court, team_number):
+    """Record (or change) the winning team of a court and update everything that depends on it.
+
+    The player ratings and win/loss totals are updated from this one court,
+    so recording a result never replays the rest of the history. Returns
+    False, and saves nothing, if the match has been regenerated.
+    """
+    team1, team2 = court_teams(court)
+    new_ratings = _apply_winner(court, team_number, team1, team2)
+    if not _bump_versions([court.match_id]):
+        db.session.rollback()
+        return False
+    ratings_version = roster.bump_version(roster.RATINGS) # Tells other worker processes their roster is out of date.
+    db.session.commit()
+    roster.update_ratings(new_ratings, ratings_version) # Keep this process's cached roster in step without reloading it.
+    http_cache.invalidate_match(court.match_id)
+    return True
+
+
+def validate_result_row(row):
+    # Returns ((court_id, winning_team), None) or (None, error message).
+    if not isinstance(row, dict):
+        return None, "Expected an object with court_id and winning_team."
+    court_id, winning_team = row.get('court_id'), row.get('winning_team')
+    if not isinstance(court_id, int) or isinstance(court_id, bool):
+        return None, "court_id must be an integer."
+    if winning_team not in (1, 2) or isinstance(winning_team, bool):
+        return None, "winning_team must be 1 or 2."
+    return (court_id, winning_team), None
+
+
+def record_winners(rows):
+    """Record the winners of many courts in one transaction.
+
+    rows is a list of {'court_id': ..., 'winning_team': 1 or 2} dictionaries.
+    All the courts and their players are loaded with three queries, the
+    results are applied in the order given, and everything is committed
+    once. If any row is invalid nothing is saved. Returns (courts, errors)
+    where courts are the updated Court objects and each error is a
+    {'row': n, 'error': message} dictionary with rows counted from 1.
+    """
+    errors = []
+    results = []
+    for row_number, row in enumerate(rows, start=1):
+        values, error = validate_result_row(row)
+        if error is not None:
+            errors.append({'row': row_number, 'error': error})
+        else:
+            results.append((row_number, values))
+
+    court_ids = {court_id for row_number, (court_id, winning_team) in results}
+    courts = {}
+    if court_ids:
+        courts = {
+            court.id: court
+            for court in Court.query.options(selectinload(Court.court_players).joinedload(CourtPlayer.player))
+            .filter(Court.id.in_(court_ids))
+        }
+    replaced = set()
+    if courts:
+        replaced = set(db.session.scalars(
+            select(Match.id).where(Match.id.in_({c.match_id for c in courts.values()}), Match.replaced_by.is_not(None))
+        ))
+    for row_number, (court_id, winning_team) in results:
+        if court_id not in courts:
+            errors.append({'row': row_number, 'error': f"Court {court_id} does not exist."})
+        elif courts[court_id].match_id in replaced:
+            errors.append({'row': row_number, 'error': f"Court {court_id} belongs to a regenerated match."})
+    if errors:
+        errors.sort(key=lambda e: e['row'])
+        return [], errors
+
+    new_ratings = {}
+    updated = []
+    for row_number, (court_id, winning_team) in results:
+        court = courts[court_id]
+        # court_players is ordered by id, so the first two are team 1 just like in court_teams().
+        new_ratings.update(_apply_winner(court, winning_team, court.court_players[:2], court.court_players[2:]))
+        updated.append(court)
+
+    match_ids = {court.match_id for court in updated}
+    if _bump_versions(match_ids) != len(match_ids):
+        db.session.rollback() # One of the matches was regenerated since it was checked above.
+        return [], [{'row': 0, 'error': "A match was regenerated while the results were being saved; nothing was saved."}]
+    ratings_version = roster.bump_version(roster.RATINGS)
+    db.session.commit()
+    roster.update_ratings(new_ratings, ratings_version)
+    for match_id in match_ids:
+        http_cache.invalidate_match(match_id)
+    return updated, errors
@@ -0,0 +1,167 @@
+import sys
+import threading
+from array import array
+from collections import Counter
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app import db
+from app.models import Player, DataVersion
+
+
+class RosterPlayer:
+    # The only player fields matchmaking reads, without any ORM state attached.
+    __slots__ = ('id', 'name', 'skill', 'gender', 'rating')
+
+    def __init__(self, id, name, skill, gender, rating):
+        self.id = id
+        self.name = name
+        self.skill = skill
+        self.gender = gender
+        self.rating = rating
+
+    def __repr__(self):
+        return f"<RosterPlayer {self.id} {self.name!r}>"
+
+
+class RosterSnapshot:
+    """A compact, read-only copy of the players in the draft.
+
+    It iterates like a list of players, so every create_*_matches function
+    accepts it directly. The per-gender and per-skill counts are worked out
+    once when the snapshot is built.
+    """
+    __slots__ = ('players', 'ids', '_by_id', 'gender_counts', 'skill_counts')
+
+    def __init__(self, players):
+        self.players = tuple(players)
+        self.ids = array('q', (p.id for p in self.players))
+        self._by_id = {p.id: p for p in self.players}
+        self.gender_counts = Counter(p.gender for p in self.players)
+        self.skill_counts = Counter(p.skill for p in self.players)
+
+    def __iter__(self):
+        return iter(self.players)
+
+    def __len__(self):
+        return len(self.players)
+
+    def get(self, player_id):
+        return self._by_id.get(player_id)
+
+    def subset(self, player_ids):
+        # The players with these ids that are still in the draft, e.g. the roster of an older match.
+        return RosterSnapshot(p for p in (self._by_id.get(i) for i in player_ids) if p is not None)
+
+
+# The data_version counters: PLAYERS changes when players are added or deleted, RATINGS when any rating changes.
+PLAYERS = 'players'
+RATINGS = 'ratings'
+
+
+def data_versions():
+    """The current (PLAYERS, RATINGS) counters, read with one query of a two-row table."""
+    versions = dict(db.session.execute(select(DataVersion.name, DataVersion.version)).all())
+    return versions.get(PLAYERS, 0), versions.get(RATINGS, 0)
+
+
+def bump_version(name):
+    """Add one to a data_version counter and return the new value. Call before committing the change it marks."""
+    stmt = sqlite_insert(DataVersion).values(name=name, version=1)
+    return db.session.scalar(
+        stmt.on_conflict_do_update(index_elements=[DataVersion.name], set_={'version': DataVersion.version + 1})
+        .returning(DataVersion.version)
+    )
+
+
+# One snapshot per app in each process, kept in app.extensions with the data versions it was loaded at.
+# Every use checks the versions first, so a change made by another worker process (or the CLI) is
+# picked up on the next request; this process drops or patches its own copy straight after its own writes.
+_snapshot_lock = threading.Lock()
+
+
+def get_roster():
+    """The current draft as a RosterSnapshot, loading it with one query if it is missing or out of date."""
+    versions = data_versions() # Read before the players, so a change in between only causes an extra reload.
+    with _snapshot_lock:
+        cached = current_app.extensions.get('roster_snapshot')
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+    rows = db.session.execute(select(Player.id, Player.name, Player.skill, Player.gender, Player.rating).order_by(Player.id))
+    snapshot = RosterSnapshot(RosterPlayer(*row) for row in rows)
+    with _snapshot_lock:
+        current_app.extensions['roster_snapshot'] = (versions, snapshot)
+    return snapshot
+
+
+def invalidate_roster():
+    with _snapshot_lock:
+        current_app.extensions.pop('roster_snapshot', None)
+
+
+def update_ratings(ratings, version):
+    """Patch the cached players in place instead of reloading the draft.
+
+    ratings is {player_id: new rating} and version the RATINGS counter
+    bump_version() returned for the change. If anything else changed the
+    ratings since the snapshot was loaded, it is dropped instead.
+    """
+    with _snapshot_lock:
+        cached = current_app.extensions.get('roster_snapshot')
+        if cached is None:
+            return
+        (players_version, ratings_version), snapshot = cached
+        if ratings_version != version - 1:
+            del current_app.extensions['roster_snapshot']
+            return
+        for player_id, rating in ratings.items():
+            player = snapshot.get(player_id)
+            if player is not None:
+                player.rating = rating
+        current_app.extensions['roster_snapshot'] = ((players_version, version), snapshot)
+
+
+# Saved matches keep the roster they were drawn from as one packed array of integers, (player id << 1) | resting.
+# The first byte is the array typecode: the narrowest unsigned type that fits the largest value,
+# so a normal roster takes 2 bytes per player.
+_PACK_TYPECODES = ('B', 'H', 'I', 'Q')
+
+
+def _pack_values(values):
+    largest = max(values, default=0)
+    typecode = next(code for code in _PACK_TYPECODES if largest < 1 << (8 * array(code).itemsize))
+    packed = array(typecode, values)
+    if sys.byteorder == 'big':
+        packed.byteswap() # Always stored little-endian so a database file can move between machines.
+    return typecode.encode() + packed.tobytes()
+
+
+def _unpack_values(data):
+    packed = array(chr(data[0]))
+    packed.frombytes(data[1:])
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed
+
+
+def pack_match_roster(player_ids, resting_ids):
+    """Encode a match roster (in roster order) and which of its players rested as bytes."""
+    resting = set(resting_ids)
+    return _pack_values([(player_id << 1) | (player_id in resting) for player_id in player_ids])
+
+
+def unpack_match_roster(data):
+    """Decode pack_match_roster() bytes back into (player_ids, resting_ids), both in roster order."""
+    if not data:
+        return [], []
+    packed = _unpack_values(data)
+    return [value >> 1 for value in packed], [value >> 1 for value in packed if value & 1]
+
+
+def pack_player_ids(player_ids):
+    # An ordered list of player ids (e.g. a match's seat priority) in the same packed format, without the resting bit.
+    return _pack_values(list(player_ids))
+
+
+def unpack_player_ids(data):
+    return list(_unpack_values(data)) if data else []
@@ -1,25 +1,40 @@
-from flask import render_template, flash, request, redirect, url_for
-from app import app, db
-from app.models import Player, Match, Court, CourtPlayer
-from app.forms import PlayerForm, MatchForm
-from sqlalchemy import case
-from app.matchmaking import create_skill_based_matches, create_random_matches, create_mixed_gender_matches
-
-@app.route('/')
+import csv
+import hmac
+import json
+from datetime import datetime
+from flask import Blueprint, current_app, render_template, flash, request, redirect, url_for, jsonify, abort, Response
+from app import db, stats, csrf
+from app.models import Player, Match, Court
+from app.forms import PlayerForm, MatchForm, SessionForm
+from sqlalchemy.orm import selectinload
+from app.candidates import generate, new_seed, find_best_pairings
+from app.matchmaking import get_strategy
+from app.persistence import save_match, schedule_history_prune, read_take_back, take_back_match, has_results
+from app.results import record_winner, record_winners
+from app.players import draft_page, player_count, note_players_changed, invalidate_player_cache, import_players, csv_error_message
+from app.roster import get_roster, unpack_match_roster
+from app import http_cache, live, instrumentation, archive
+from sqlalchemy import func
+
+# Every page lives on this blueprint; create_app() registers it. Endpoints are named main.<view>.
+bp = Blueprint('main', __name__)
+
+@bp.route('/')
 def layout():
     return render_template("home.html")
 
-@app.route('/draft', methods=['GET', 'POST'])
+@bp.route('/draft', methods=['GET', 'POST'])
 def draft():
     player_form = PlayerForm()
     match_form = MatchForm()
-    MAX_PLAYERS = app.config['MAX_PLAYERS']
-    current_player_count = Player.query.count()
+    session_form = SessionForm(prefix='session') # Prefixed so its fields don't clash with the match form on the same page.
+    MAX_PLAYERS = current_app.config['MAX_PLAYERS']
+    current_player_count = player_count() # Cached until a player is added or deleted by any worker.
 
     if player_form.validate_on_submit(): # Backend enforcement of player limit even if frontend is bypassed.
         if current_player_count >= MAX_PLAYERS:
             flash(f"The maximum number of players ({MAX_PLAYERS}) has been reached.", "error")
-            return redirect(url_for('draft'))
+            return redirect(url_for('.draft'))
 
         sort_by = request.form.get('sort_by', 'id')
         clean_name = ' '.join(player_form.name.data.split()) # Remove beginning, trailing and in between whitespace.
@@ -29,29 +44,24 @@ def draft():
             gender=player_form.gender.data
         )
         db.session.add(new_player)
+        note_players_changed()
         db.session.commit()
+        invalidate_player_cache()
         flash(f'Player "{clean_name}" was added successfully!', 'success')
-        return redirect(url_for('draft', sort_by=sort_by))
+        return redirect(url_for('.draft', sort_by=sort_by))
     
     sort_by = request.args.get('sort_by', 'id') # Get current sort order form url query string.
 
-    players_query = Player.query
-    if sort_by == 'gender': # If sorting by gender is selected, group them by gender first, then by name.
-        players_query = players_query.order_by(Player.gender.asc(), Player.name.asc())
-        
-    elif sort_by == 'skill': # Create virtual column to sort by.
-        skill_order = case(
-            (Player.skill == 'Beginner', 1),
-            (Player.skill == 'Intermediate', 2),
-            (Player.skill == 'Advanced', 3),
-            else_=0 # Assign to unexpected values.
-        )
-        players_query = players_query.order_by(skill_order.desc(), Player.name.asc()) # Highest skill first.
-    else:
-        players_query = players_query.order_by(Player.name.asc())
-    players = players_query.all()
+    # Only one page of players is loaded. The 'after'/'before' cursors say where the page starts,
+    # and each sort order is served from its own index so every page costs the same.
+    players, previous_cursor, next_cursor = draft_page(
+        sort_by,
+        after=request.args.get('after'),
+        before=request.args.get('before'),
+        page_size=current_app.config['DRAFT_PAGE_SIZE']
+    )
 
-    max_courts = len(players) // 4
+    max_courts = min(current_player_count // 4, current_app.config['MAX_COURTS']) # A hall only has so many courts.
     if max_courts > 0:
         match_form.num_courts.choices = [
             (i, f"{i} court{'s' if i > 1 else ''} ({i*4} players)")
@@ -60,22 +70,30 @@ def draft():
         match_form.num_courts.data = max_courts
     else:
         match_form.num_courts.choices = []
+    # The session planner offers the same court choices as a single match.
+    session_form.num_courts.choices = match_form.num_courts.choices
+    session_form.num_courts.data = match_form.num_courts.data
 
     return render_template(
         'draft.html',
         players=players,
         form=player_form,
         match_form=match_form,
+        session_form=session_form,
+        max_rounds=current_app.config['MAX_MATCHES'],
         current_sort=sort_by,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
         player_count=current_player_count,
         max_players_limit=MAX_PLAYERS
     )
 
-@app.route('/generate_matches', methods=['POST'])
+@bp.route('/generate_matches', methods=['POST'])
 def generate_matches():
     form = MatchForm()
-    players_in_draft = Player.query.all()
-    max_courts = len(players_in_draft) // 4
+    # The cached roster snapshot: no player rows are loaded unless players or ratings changed (in any worker) since the last match.
+    players_in_draft = get_roster()
+    max_courts = min(len(players_in_draft) // 4, current_app.config['MAX_COURTS'])
 
     # Dynamically populate the choices for the 'num_courts' dropdown in the form.
     # This ensures the user can't request more courts than are possible with the current number of players.
@@ -87,124 +105,67 @@ def generate_matches():
         num_courts = form.num_courts.data
         match_type = form.match_type.data
 
-        # If the user selected 'mixed' matches, we need to perform a special check.
-        if match_type == 'mixed':
-            # Count the number of male and female players in the draft.
-            # This is necessary to ensure mixed doubles (2 males, 2 females per court) is possible.
-            males_count = Player.query.filter_by(gender='male').count()
-            females_count = Player.query.filter_by(gender='female').count()
-            
-            # A mixed court requires at least 2 males and 2 females. If we don't have that, we can't proceed.
-            if males_count < 2 or females_count < 2:
-                flash("Cannot generate mixed match. You need at least 2 male and 2 female players.", "error")
-                return redirect(url_for('draft'))
-            
-        # Based on the selected match_type, call the appropriate helper function to create the pairings.
-        if match_type == 'skill':
-            match_data = create_skill_based_matches(players_in_draft, num_courts)
-        elif match_type == 'mixed':
-            match_data = create_mixed_gender_matches(players_in_draft, num_courts)
-        else: # 'random' is the default
-            match_data = create_random_matches(players_in_draft, num_courts)
+        # Some strategies need a certain mix of players (e.g. 'mixed' needs 2 male and 2 female players).
+        problem = get_strategy(match_type).check(players_in_draft)
+        if problem:
+            flash(problem, "error")
+            return redirect(url_for('.draft'))
+
+        # The players who have rested longest get a court first: one indexed read of at most num_courts * 4 rows.
+        priority = stats.rest_queue(num_courts * 4)
+
+        # Call the generator for the selected match_type with a fresh seed. The seed and the rest queue are saved
+        # with the match, so the pairings can be reproduced.
+        seed = new_seed()
+        with instrumentation.timer(f'matchmaking.{match_type}'):
+            match_data = generate(match_type, players_in_draft, num_courts, seed, priority)
 
         # If the match creation function returned no data, it means not enough players were available for the requested courts.
         if not match_data:
             flash("Not enough players to generate any courts.", "warning")
-            return redirect(url_for('draft'))
-
-        # Create a set of IDs for all players who were successfully placed in a match.
-        # A set is used for efficient 'in' checks later.
-        player_ids_in_match = {p_obj.id for d in match_data for p_obj in d['team1']+d['team2']}
-        
-        # Determine which players are resting by finding those in the draft who are NOT in the generated matches.
-        resting_players_objects = [p for p in players_in_draft if p.id not in player_ids_in_match]
-        # Extract just the names of the resting players for display and storage.
-        resting_players_names = [p.name for p in resting_players_objects]
-        
-        # Convert the list of resting player names into a single comma-separated string.
-        # This is a simple way to store a "snapshot" of who was resting in the database.
-        resting_players_str = ",".join(resting_players_names)
-        
-        # Similarly, create a snapshot of all player IDs that were part of this draft.
-        player_ids_str = ",".join([str(p.id) for p in players_in_draft])
-
-        # Create a new Match object to be saved in the database.
-        new_match = Match(
-            num_courts=len(match_data),
-            match_type=match_type,
-            player_ids_snapshot=player_ids_str, # Stores the IDs of everyone in the draft for this match.
-            resting_players_snapshot=resting_players_str # Stores the names of resting players.
-        )
-        # Associate the full list of player objects with this match (likely via a many-to-many relationship).
-        # This preserves the historical roster for this specific match.
-        new_match.roster = players_in_draft
-        
-        # Add the new Match object to the database session.
-        db.session.add(new_match)
-        db.session.flush()
-
-        # Iterate through the generated match data, which contains the details for each court.
-        for data in match_data:
-            # Create a Court object, linking it to the new Match via its id.
-            court = Court(court_number=data['court'], match_id=new_match.id)
-            db.session.add(court)
-            # Flush again to get the ID for the newly created court.
-            db.session.flush()
-
-            # Iterate through all players assigned to this court (both teams).
-            for player_object in data['team1'] + data['team2']:
-                # Create a link table record (CourtPlayer) to associate a specific player with a specific court.
-                court_player_link = CourtPlayer(
-                    court_id=court.id,
-                    player_id=player_object.id,
-                    player_name=player_object.name # Snapshot the name in case the player's name changes later.
-                )
-                db.session.add(court_player_link)
-        
-        db.session.commit()
-        
+            return redirect(url_for('.draft'))
+
+        # Save the match, its courts and the player links in one batched write.
+        # The resting players and the roster snapshot are worked out from the draft by the persistence layer.
+        new_match_id = save_match(match_type, players_in_draft, match_data, seed=seed, priority=priority)
         flash("New match generated successfully!", "success")
 
+        # Trim the history down to MAX_MATCHES. Depending on HISTORY_PRUNE_MODE this happens now,
+        # after the response has been sent, or on a background thread.
         try:
-            # Get the configured limit for how many matches to keep in history.
-            history_limit = app.config['MAX_MATCHES']
-            # Fetch all matches from the DB, ordered from oldest to newest.
-            all_matches = Match.query.order_by(Match.created_at.asc()).all()
-
-            # Check if the total number of matches exceeds the configured limit.
-            if len(all_matches) > history_limit:
-                # Calculate how many of the oldest matches need to be deleted.
-                matches_to_delete_count = len(all_matches) - history_limit
-                
-                # Get the actual Match objects to be deleted by slicing the list from the beginning (the oldest).
-                matches_to_delete = all_matches[:matches_to_delete_count]
-                print(f"INFO: Match history limit ({history_limit}) exceeded. Deleting {len(matches_to_delete)} oldest match(es).")
-                
-                # Loop through the list of old matches and delete them.
-                # The database should be set up with cascading deletes to also remove related courts.
-                for old_match in matches_to_delete:
-                    db.session.delete(old_match)
-                    
-                # Commit the deletion transaction.
-                db.session.commit()
-                flash(f"{len(matches_to_delete)} oldest match(es) pruned from history.", "info")
-
-        except Exception as e:
-            db.session.rollback()
-            print(f"ERROR: Could not prune match history. Error: {e}")
+            pruned_count = schedule_history_prune()
+            if pruned_count:
+                flash(f"{pruned_count} oldest match(es) pruned from history.", "info")
+        except Exception:
             flash("Could not prune old match history.", "error")
             
-        return redirect(url_for('view_match_details', match_id=new_match.id))
+        return redirect(url_for('.view_match_details', match_id=new_match_id))
 
     flash("There was an error with your match request.", "error")
-    return redirect(url_for('draft'))
+    return redirect(url_for('.draft'))
 
-@app.route('/regenerate_match/<int:previous_match_id>', methods=['POST'])
+@bp.route('/regenerate_match/<int:previous_match_id>', methods=['POST'])
 def regenerate_match(previous_match_id):
+    return _regenerate(previous_match_id, best=False)
+
+@bp.route('/regenerate_best/<int:previous_match_id>', methods=['POST'])
+def regenerate_best_match(previous_match_id):
+    # Like regenerate, but many seeds are tried across all CPU cores and the best scoring pairings are kept.
+    return _regenerate(previous_match_id, best=True)
+
+def _regenerate(previous_match_id, best):
     previous_match = Match.query.get_or_404(previous_match_id)
+    if previous_match.replaced_by is not None:
+        flash("This match was already regenerated.", "info")
+        return redirect(url_for('.view_match_details', match_id=previous_match.replaced_by))
+    # Regenerating would throw away the recorded winners, so a match with results is kept as it is.
+    if has_results(previous_match_id):
+        flash("Cannot regenerate: winners have already been recorded for this match.", "warning")
+        return redirect(url_for('.view_match_details', match_id=previous_match_id))
     
-    # Get the historical roster of players that were part of the original match.
-    players_for_rematch = previous_match.roster
+    # Get the historical roster of players that were part of the original match and are still in the draft.
+    roster_ids = unpack_match_roster(previous_match.roster_snapshot)[0]
+    players_for_rematch = get_roster().subset(roster_ids)
     
     # Reuse the settings from the previous match.
     num_courts = previous_match.num_courts
@@ -212,121 +173,275 @@ def regenerate_match(previous_match_id):
 
     if len(players_for_rematch) < num_courts * 4:
         flash("Cannot regenerate: not enough of the original players still exist.", "warning")
-        return redirect(url_for('view_match_details', match_id=previous_match_id))
+        return redirect(url_for('.view_match_details', match_id=previous_match_id))
+
+    problem = get_strategy(match_type).check(players_for_rematch)
+    if problem:
+        flash(problem, "warning")
+        return redirect(url_for('.view_match_details', match_id=previous_match_id))
     
-    if match_type == 'skill':
-        match_data = create_skill_based_matches(players_for_rematch, num_courts)
-    elif match_type == 'mixed':
-        match_data = create_mixed_gender_matches(players_for_rematch, num_courts)
-    else: # 'random'
-        match_data = create_random_matches(players_for_rematch, num_courts)
+    # The new pairings replace the old match as the same round, so they are made from the rest queue as it will be
+    # once its games and rests are taken back. Nothing is written yet: the search can take a second or more,
+    # and holding the write lock that long would stall every result being recorded meanwhile.
+    priority = stats.rest_queue(num_courts * 4, read_take_back(previous_match))
+    if best:
+        with instrumentation.timer('matchmaking.best_of_n'):
+            match_data, seed, checked = find_best_pairings(match_type, players_for_rematch, num_courts, priority=priority)
+    else:
+        seed = new_seed()
+        with instrumentation.timer(f'matchmaking.{match_type}'):
+            match_data = generate(match_type, players_for_rematch, num_courts, seed, priority)
 
     # If the pairing function fails to create teams, inform the user.
     if not match_data:
         flash("Could not regenerate pairings with the original settings.", "warning")
-        return redirect(url_for('view_match_details', match_id=previous_match_id))
+        return redirect(url_for('.view_match_details', match_id=previous_match_id))
     
-    # Determine who is playing and who is resting in this new, regenerated match.
-    player_ids_in_match = {p_obj.id for d in match_data for p_obj in d['team1']+d['team2']}
-    resting_players = [p.name for p in players_for_rematch if p.id not in player_ids_in_match]
-
-    # Create the new Match database object with the regenerated data.
-    new_match = Match(
-        num_courts=len(match_data),
-        match_type=match_type,
-        player_ids_snapshot=",".join([str(p.id) for p in players_for_rematch]),
-        resting_players_snapshot=",".join(resting_players)
-    )
-    # Associate the same historical roster with this new match.
-    new_match.roster = players_for_rematch
-    db.session.add(new_match)
-    db.session.flush() # Flush to get the ID for the new match.
-
-    # Loop through the new pairings and save them to the database.
-    for data in match_data:
-        court = Court(court_number=data['court'], match_id=new_match.id)
-        db.session.add(court)
-        db.session.flush() # Flush to get the ID for the new court.
-        for player_object in data['team1'] + data['team2']:
-            court_player_link = CourtPlayer(
-                court_id=court.id,
-                player_id=player_object.id,
-                player_name=player_object.name
-            )
-            db.session.add(court_player_link)
-
-    db.session.commit()
-
-    flash("Match was regenerated with a full reshuffle!", "success")
+    # Then take the old match back and save the regenerated pairings against the same historical roster,
+    # together in one short transaction.
+    if not take_back_match(previous_match):
+        db.session.rollback()
+        flash("The match was changed while it was being regenerated, so it was kept as it is.", "warning")
+        return redirect(url_for('.view_match_details', match_id=previous_match_id))
+    new_match_id = save_match(match_type, players_for_rematch, match_data, seed=seed, priority=priority,
+                              replaces=previous_match)
+    http_cache.invalidate_match(previous_match_id)
+    live.publish_regenerated(previous_match_id, new_match_id) # Anyone still watching the old match is pointed at the new one.
+
+    if best:
+        flash(f"Checked {checked} candidate pairings and kept the best one!", "success")
+    else:
+        flash("Match was regenerated with a full reshuffle!", "success")
     
     # This history pruning logic is identical to the one in generate_matches.
     try:
-        history_limit = app.config['MAX_MATCHES']
-        all_matches = Match.query.order_by(Match.created_at.asc()).all()
+        pruned_count = schedule_history_prune()
+        if pruned_count:
+            flash(f"{pruned_count} oldest match(es) pruned from history.", "info")
+    except Exception:
+        flash("Could not prune old match history.", "error")
+    return redirect(url_for('.view_match_details', match_id=new_match_id))
 
-        if len(all_matches) > history_limit:
-            matches_to_delete_count = len(all_matches) - history_limit
-            matches_to_delete = all_matches[:matches_to_delete_count]
-            print(f"INFO: Match history limit ({history_limit}) exceeded. Deleting {len(matches_to_delete)} oldest match(es).")
-            
-            for old_match in matches_to_delete:
-                db.session.delete(old_match)
-                
-            db.session.commit()
-            flash(f"{len(matches_to_delete)} oldest match(es) pruned from history.", "info")
+@bp.route('/plan_session', methods=['POST'])
+def plan_rounds():
+    form = SessionForm(prefix='session')
+    players_in_draft = get_roster()
+    max_courts = min(len(players_in_draft) // 4, current_app.config['MAX_COURTS'])
+    form.num_courts.choices = [(i, str(i)) for i in range(1, max_courts + 1)]
 
-    except Exception as e:
-        db.session.rollback()
-        print(f"ERROR: Could not prune match history. Error: {e}")
-        flash("Could not prune old match history.", "error")
-    return redirect(url_for('view_match_details', match_id=new_match.id))
+    if form.validate_on_submit():
+        num_rounds = form.num_rounds.data
+        history_limit = current_app.config['MAX_MATCHES']
+
+        # Rounds past the history limit would be pruned straight away, so don't plan more than can be kept.
+        if num_rounds > history_limit:
+            flash(f"A session can plan at most {history_limit} rounds.", "error")
+            return redirect(url_for('.draft'))
+
+        # Plan every round up front. Each round avoids the partners, opponents and rests of the rounds before it.
+        from app.planner import plan_session # Imported here so NumPy only loads once a session is planned.
+        with instrumentation.timer('matchmaking.plan_session'):
+            rounds = plan_session(players_in_draft, form.num_courts.data, num_rounds)
+        if not rounds:
+            flash("Not enough players to plan a session.", "warning")
+            return redirect(url_for('.draft'))
+
+        # Every round is stored as an ordinary match, all in one transaction.
+        for match_data in rounds:
+            save_match('session', players_in_draft, match_data, commit=False)
+        db.session.commit()
+        http_cache.invalidate_history()
+        flash(f"Planned {len(rounds)} rounds. They are listed in the match history.", "success")
 
-@app.route('/history')
+        try:
+            pruned_count = schedule_history_prune()
+            if pruned_count:
+                flash(f"{pruned_count} oldest match(es) pruned from history.", "info")
+        except Exception:
+            flash("Could not prune old match history.", "error")
+
+        return redirect(url_for('.match_history'))
+
+    flash("There was an error with your session request.", "error")
+    return redirect(url_for('.draft'))
+
+@bp.route('/history')
 def match_history():
-    # This line queries the database for all records in the 'Match' table.
-    # 'Match.query' starts a query using the SQLAlchemy Match model.
-    # '.order_by(Match.created_at.desc())' sorts the results by the 'created_at' column in descending order (newest first).
-    # '.all()' executes the query and returns all matching records as a list.
-    all_matches = Match.query.order_by(Match.created_at.desc()).all()
-    return render_template('match_history.html', matches=all_matches)
-
-@app.route('/match/<int:match_id>')
+    # The list only changes when matches are added or pruned, which the count and the id range show.
+    # Checking them is one small query; the page itself is only rendered when they change.
+    # A prune leaves no time behind, so the page has no Last-Modified and browsers revalidate with the ETag.
+    count, first_id, last_id = db.session.execute(
+        db.select(func.count(Match.id), func.min(Match.id), func.max(Match.id))
+    ).one()
+
+    def render():
+        # The page only shows the date and court count, so only those columns are selected (newest first).
+        # This is a single query and no Match objects or rosters are loaded.
+        all_matches = db.session.execute(
+            db.select(Match.id, Match.created_at, Match.num_courts, Match.replaced_by).order_by(Match.created_at.desc(), Match.id.desc())
+        ).all()
+        return render_template('match_history.html', matches=all_matches)
+
+    return http_cache.cached_page(http_cache.HISTORY, (count, first_id, last_id), None, render)
+
+@bp.route('/match/<int:match_id>')
 def view_match_details(match_id):
-    match = Match.query.get_or_404(match_id)
-    # Initializes an empty list to store the names of players who were resting during this match.
-    resting_players_names = []
-    # This checks if the 'resting_players_snapshot' attribute of the 'match' object has any data.
-    if match.resting_players_snapshot:
-        # If the snapshot exists, this line splits the string by commas into a list of individual player names.
-        resting_players_names = match.resting_players_snapshot.split(',')
-    return render_template('generated_match.html', match=match, resting_players=resting_players_names)
-
-@app.route('/set_winner/<int:court_id>/<int:team_number>', methods=['POST'])
+    # Only the version is read up front. Unchanged pages are answered from the cache or with a 304.
+    version_row = db.session.execute(
+        db.select(Match.version, Match.updated_at).where(Match.id == match_id)
+    ).first()
+    if version_row is None:
+        abort(404)
+
+    def render():
+        # Load the match, then all its courts, then all their players: three queries however many courts there are.
+        match = (
+            Match.query
+            .options(selectinload(Match.courts).selectinload(Court.court_players))
+            .filter_by(id=match_id)
+            .first_or_404()
+        )
+        # The resting players are flagged in the roster snapshot; their names come from the cached draft roster.
+        # Players deleted since the match was played are left out.
+        resting_ids = unpack_match_roster(match.roster_snapshot)[1]
+        draft_roster = get_roster()
+        resting_players_names = [draft_roster.get(i).name for i in resting_ids if draft_roster.get(i) is not None]
+        return render_template('generated_match.html', match=match, resting_players=resting_players_names)
+
+    # The page holds forms with the visitor's CSRF token, so it is cached per visitor.
+    return http_cache.cached_page(match_id, version_row.version, version_row.updated_at, render, per_viewer=True)
+
+@bp.route('/match/<int:match_id>/events')
+def match_events(match_id):
+    # A Server-Sent Events stream of changes to one match, used by the match page to stay up to date.
+    return live.event_stream_response(match_id, request.args.get('version', type=int))
+
+def _leaderboard_args():
+    # Shared by the page and the JSON endpoint: the sort column and how many rows to show.
+    sort_by = request.args.get('sort_by', 'wins')
+    if sort_by not in stats.LEADERBOARD_SORTS:
+        sort_by = 'wins'
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+    return sort_by, limit
+
+@bp.route('/leaderboard')
+def leaderboard():
+    sort_by, limit = _leaderboard_args()
+    rows = stats.leaderboard(sort_by, limit)
+    return render_template('leaderboard.html', rows=rows, current_sort=sort_by)
+
+@bp.route('/api/leaderboard')
+def leaderboard_json():
+    sort_by, limit = _leaderboard_args()
+    rows = stats.leaderboard(sort_by, limit)
+    return jsonify(sort_by=sort_by, players=[dict(row._mapping) for row in rows])
+
+# The bulk API takes JSON (or CSV) from scripts rather than forms, so it is exempt from CSRF like any other API.
+@bp.route('/api/players/import', methods=['POST'])
+@csrf.exempt
+def import_players_json():
+    if request.mimetype == 'text/csv':
+        # Read the CSV as it arrives instead of loading the whole upload first. The first line names the columns.
+        # Each line is decoded on its own, so text that is not UTF-8 is reported against the row it is in.
+        reader = csv.DictReader(line.decode('utf-8-sig') for line in request.stream)
+        try:
+            fieldnames = reader.fieldnames or []
+        except (UnicodeDecodeError, csv.Error) as error:
+            return jsonify(errors=[{'row': 0, 'error': csv_error_message(error)}]), 400
+        missing = {'name', 'skill', 'gender'} - set(fieldnames)
+        if missing:
+            return jsonify(errors=[{'row': 0, 'error': f"Missing column(s): {', '.join(sorted(missing))}."}]), 400
+        rows = reader
+    else:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            return jsonify(errors=[{'row': 0, 'error': "Expected a JSON array of players or a text/csv body."}]), 400
+
+    imported, errors = import_players(rows)
+    if errors:
+        return jsonify(imported=0, errors=errors), 400
+    return jsonify(imported=imported, errors=[]), 201
+
+@bp.route('/api/results', methods=['POST'])
+@csrf.exempt
+def record_results_json():
+    rows = request.get_json(silent=True)
+    if not isinstance(rows, list):
+        return jsonify(errors=[{'row': 0, 'error': "Expected a JSON array of {court_id, winning_team} objects."}]), 400
+
+    courts, errors = record_winners(rows)
+    if errors:
+        return jsonify(recorded=0, errors=errors), 400
+    for court in courts:
+        live.publish_court(court)
+    return jsonify(recorded=len(courts), errors=[])
+
+@bp.route('/api/archive/results')
+def archived_results():
+    # Streams the results of pruned matches: ?since=YYYY-MM-DD&before=YYYY-MM-DD&player_id=N&format=csv|ndjson
+    try:
+        since = archive.to_datetime(request.args.get('since') or None)
+        before = archive.to_datetime(request.args.get('before') or None)
+    except ValueError:
+        return jsonify(error="since and before must be dates like 2024-01-31."), 400
+    player_id = request.args.get('player_id', type=int)
+    directory = archive.archive_dir() # Worked out now; the generator runs after the request context is gone.
+    rows = archive.iter_results(since, before, player_id, directory)
+
+    if request.args.get('format') == 'ndjson':
+        return Response((json.dumps(row) + '\n' for row in rows), mimetype='application/x-ndjson')
+    return Response(archive.iter_csv(rows), mimetype='text/csv',
+                    headers={'Content-Disposition': 'attachment; filename=archived-results.csv'})
+
+@bp.route('/set_winner/<int:court_id>/<int:team_number>', methods=['POST'])
 def set_winner(court_id, team_number):
     court = Court.query.get_or_404(court_id)
-    court.winning_team = team_number
-    db.session.commit()
+    if team_number not in (1, 2): # Same rule as the results API; anything else would be fed into the ratings.
+        flash("The winning team must be Team 1 or Team 2.", "error")
+        return redirect(url_for('.view_match_details', match_id=court.match_id))
+    # Also updates the ratings of the four players on this court.
+    if not record_winner(court, team_number):
+        flash("This match was regenerated; record the winner on the new match instead.", "warning")
+        return redirect(url_for('.view_match_details', match_id=court.match_id))
+    live.publish_court(court) # Other screens showing this match update without reloading.
     
     flash(f'Updated winner for Court {court.court_number} to Team {team_number}!', 'success')
     
-    return redirect(url_for('view_match_details', match_id=court.match_id))
-@app.route('/delete_player/<int:player_id>', methods=['POST'])
+    return redirect(url_for('.view_match_details', match_id=court.match_id))
+@bp.route('/delete_player/<int:player_id>', methods=['POST'])
 def delete_player(player_id):
     player = Player.query.get_or_404(player_id)
+    stats.remove_player(player.id)
     db.session.delete(player)
+    # Match pages list resting players by their current name, so every saved match page changes.
+    db.session.execute(db.update(Match).values(version=Match.version + 1, updated_at=datetime.utcnow()))
+    note_players_changed()
     db.session.commit()
+    invalidate_player_cache()
+    http_cache.clear()
     flash(f'Player "{player.name}" has been deleted.', 'info')
-    return redirect(url_for('draft'))
-
-@app.errorhandler(500)
+    return redirect(url_for('.draft'))
+
+@bp.route('/metrics')
+def metrics():
+    # Aggregated timing histograms. Only there when INSTRUMENTATION_ENABLED is on and METRICS_TOKEN is set.
+    # The client's address is not checked: behind a reverse proxy every request comes from the proxy.
+    token = current_app.config.get('METRICS_TOKEN')
+    if not instrumentation.enabled() or not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode()):
+        abort(403)
+    return jsonify(instrumentation.snapshot())
+
+@bp.app_errorhandler(500)
 def internal_error(e):
     db.session.rollback()
     return render_template("/error-templates/500.html")
 
-@app.errorhandler(404)
+@bp.app_errorhandler(404)
 def page_not_found(e):
     return render_template("/error-templates/404.html")
 
-@app.errorhandler(405)
+@bp.app_errorhandler(405)
 def method_not_allowed(e):
     return render_template("/error-templates/405.html")
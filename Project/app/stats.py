@@ -0,0 +1,214 @@
+from sqlalchemy import bindparam, case, delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app import db
+from app.models import Player, PlayerStats, Match, Court, CourtPlayer
+from app.roster import unpack_match_roster
+
+# The leaderboard orderings. Each one is served straight from an index on player_stats.
+LEADERBOARD_SORTS = {
+    'wins': PlayerStats.wins,
+    'games': PlayerStats.games_played,
+    'losses': PlayerStats.losses,
+    'rests': PlayerStats.rests,
+}
+
+
+def _add_counts(rows):
+    # rows: dictionaries with a player_id and the amounts to add. One upsert for all of them.
+    if not rows:
+        return
+    stmt = sqlite_insert(PlayerStats)
+    db.session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[PlayerStats.player_id],
+            set_={
+                'games_played': PlayerStats.games_played + stmt.excluded.games_played,
+                'wins': PlayerStats.wins + stmt.excluded.wins,
+                'losses': PlayerStats.losses + stmt.excluded.losses,
+                'rests': PlayerStats.rests + stmt.excluded.rests,
+                # Playing clears the rest debt; resting adds to it.
+                'rest_debt': case((stmt.excluded.games_played > 0, 0), else_=PlayerStats.rest_debt + stmt.excluded.rest_debt),
+            }
+        ),
+        rows
+    )
+
+
+def record_match(playing_ids, resting_ids):
+    # A new match adds one game for everyone on a court and one rest for everyone else.
+    # It also moves everyone in the rest queue: players on a court go to the back, resting players move up.
+    zero = {'games_played': 0, 'wins': 0, 'losses': 0, 'rests': 0, 'rest_debt': 0}
+    rows = [dict(zero, player_id=i, games_played=1) for i in playing_ids]
+    rows += [dict(zero, player_id=i, rests=1, rest_debt=1) for i in resting_ids]
+    _add_counts(rows)
+
+
+def take_back_changes(playing_debts, resting_ids, seated_later):
+    # What taking record_match() back changes for a match that is being replaced (see persistence.read_take_back).
+    # playing_debts maps each player on a court to their rest debt before the match; it is given back on top of
+    # the rounds they rested since. Resting players lose the round of debt it added. Anyone in seated_later has
+    # played a newer match, which set their debt, so theirs is left alone.
+    changes = [{'stats_player_id': i, 'game_count': 1, 'rest_count': 0, 'debt_change': 0 if i in seated_later else debt or 0}
+               for i, debt in playing_debts.items()]
+    changes += [{'stats_player_id': i, 'game_count': 0, 'rest_count': 1, 'debt_change': 0 if i in seated_later else -1}
+                for i in resting_ids]
+    return changes
+
+
+def unrecord_match(changes):
+    # Applies take_back_changes() to the totals.
+    # A plain UPDATE rather than the upsert, so players whose totals were removed are skipped.
+    if not changes:
+        return
+    table = PlayerStats.__table__
+    db.session.execute(
+        update(table)
+        .where(table.c.player_id == bindparam('stats_player_id'))
+        .values(
+            games_played=table.c.games_played - bindparam('game_count'),
+            rests=table.c.rests - bindparam('rest_count'),
+            rest_debt=func.max(table.c.rest_debt + bindparam('debt_change'), 0)
+        ),
+        changes
+    )
+
+
+def record_result(team1_ids, team2_ids, previous_winner, new_winner):
+    # Move one win/loss per player from the previous result (if any) to the new one.
+    if previous_winner == new_winner:
+        return
+    changes = {i: {'player_id': i, 'games_played': 0, 'wins': 0, 'losses': 0, 'rests': 0, 'rest_debt': 0}
+               for i in team1_ids + team2_ids}
+    for winner, sign in ((previous_winner, -1), (new_winner, 1)):
+        if winner not in (1, 2):
+            continue
+        winners, losers = (team1_ids, team2_ids) if winner == 1 else (team2_ids, team1_ids)
+        for i in winners:
+            changes[i]['wins'] += sign
+        for i in losers:
+            changes[i]['losses'] += sign
+    _add_counts(list(changes.values()))
+
+
+def remove_player(player_id):
+    db.session.execute(delete(PlayerStats).where(PlayerStats.player_id == player_id))
+
+
+def rest_queue(limit, changes=()):
+    """Ids of up to `limit` players who rested last round, the longest waiting first.
+
+    The create_*_matches functions put these players on a court before anyone
+    else. Pass the number of places (courts * 4): this reads only that many
+    entries of the rest_debt index, however many players or matches there are.
+
+    changes are take_back_changes() for a match about to be replaced. They are
+    applied to what is read rather than written, so the queue comes out as it
+    will be once the match is taken back, without holding a write.
+    """
+    debt_changes = {c['stats_player_id']: c['debt_change'] for c in changes if c['debt_change']}
+    if not debt_changes:
+        return db.session.scalars(
+            select(PlayerStats.player_id)
+            .where(PlayerStats.rest_debt > 0)
+            .order_by(PlayerStats.rest_debt.desc(), PlayerStats.player_id.desc())
+            .limit(limit)
+        ).all()
+
+    # Only the changed players can move, so whoever else ends up in the first `limit` places is already
+    # among the first `limit + len(debt_changes)` of the index.
+    debts = dict(db.session.execute(
+        select(PlayerStats.player_id, PlayerStats.rest_debt)
+        .where(PlayerStats.rest_debt > 0)
+        .order_by(PlayerStats.rest_debt.desc(), PlayerStats.player_id.desc())
+        .limit(limit + len(debt_changes))
+    ).all())
+    debts.update(db.session.execute(
+        select(PlayerStats.player_id, PlayerStats.rest_debt).where(PlayerStats.player_id.in_(list(debt_changes)))
+    ).all())
+    for player_id, change in debt_changes.items():
+        if player_id in debts: # Same as the UPDATE: players whose totals were removed are skipped.
+            debts[player_id] = max(debts[player_id] + change, 0)
+    waiting = sorted((player_id for player_id, debt in debts.items() if debt > 0),
+                     key=lambda player_id: (debts[player_id], player_id), reverse=True)
+    return waiting[:limit]
+
+
+def rest_debts(connection):
+    """Work out every player's rest debt from the saved match rosters, oldest match first.
+
+    Only used to fill the column for an existing database; new matches update it as they are saved.
+    """
+    debts = {}
+    for snapshot in connection.execute(
+        select(Match.roster_snapshot).where(Match.replaced_by.is_(None)).order_by(Match.created_at, Match.id)
+    ).scalars():
+        player_ids, resting_ids = unpack_match_roster(snapshot)
+        resting = set(resting_ids)
+        for player_id in player_ids:
+            debts[player_id] = debts.get(player_id, 0) + 1 if player_id in resting else 0
+    return debts
+
+
+def leaderboard(sort_by='wins', limit=50):
+    """The top `limit` players for one of the LEADERBOARD_SORTS orderings.
+
+    Reads only the first `limit` entries of the matching index, so the cost
+    does not depend on how much history there is.
+    """
+    column = LEADERBOARD_SORTS.get(sort_by, PlayerStats.wins)
+    return db.session.execute(
+        select(
+            PlayerStats.player_id, Player.name, Player.rating,
+            PlayerStats.games_played, PlayerStats.wins, PlayerStats.losses, PlayerStats.rests
+        )
+        .join(Player, Player.id == PlayerStats.player_id)
+        .order_by(column.desc(), PlayerStats.player_id.desc())
+        .limit(limit)
+    ).all()
+
+
+def rebuild_stats(connection=None):
+    """Recount every player's totals from the saved history.
+
+    Used to fill the table for databases that had matches before it existed.
+    Only matches still in the history can be counted, and regenerated
+    matches are left out like they are from the running totals.
+    """
+    conn = connection if connection is not None else db.session.connection()
+    totals = {player_id: {'player_id': player_id, 'games_played': 0, 'wins': 0, 'losses': 0, 'rests': 0, 'rest_debt': 0}
+              for player_id in conn.execute(select(Player.id)).scalars()}
+
+    # Court players are saved team 1 first, so the first two on a court (by id) are team 1.
+    courts = {}
+    for court_id, match_id, winning_team, player_id in conn.execute(
+        select(Court.id, Court.match_id, Court.winning_team, CourtPlayer.player_id)
+        .join(CourtPlayer, CourtPlayer.court_id == Court.id)
+        .join(Match, Match.id == Court.match_id)
+        .where(Match.replaced_by.is_(None))
+        .order_by(Court.id, CourtPlayer.id)
+    ):
+        courts.setdefault(court_id, (match_id, winning_team, []))[2].append(player_id)
+
+    for match_id, winning_team, player_ids in courts.values():
+        for team, team_ids in ((1, player_ids[:2]), (2, player_ids[2:])):
+            for i in team_ids:
+                if i not in totals:
+                    continue
+                totals[i]['games_played'] += 1
+                if winning_team == team:
+                    totals[i]['wins'] += 1
+                elif winning_team in (1, 2):
+                    totals[i]['losses'] += 1
+
+    # Resting players are flagged in each match's roster snapshot.
+    for snapshot in conn.execute(select(Match.roster_snapshot).where(Match.replaced_by.is_(None))).scalars():
+        for player_id in unpack_match_roster(snapshot)[1]:
+            if player_id in totals:
+                totals[player_id]['rests'] += 1
+    for player_id, debt in rest_debts(conn).items():
+        if player_id in totals:
+            totals[player_id]['rest_debt'] = debt
+
+    conn.execute(delete(PlayerStats))
+    if totals:
+        conn.execute(PlayerStats.__table__.insert(), list(totals.values()))
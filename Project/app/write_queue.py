@@ -0,0 +1,31 @@
+import threading
+from sqlalchemy import event
+
+# SQLite allows one writer at a time. A writer that finds the database locked sleeps and
+# polls (busy_timeout), and under load the same few requests keep losing that race, so
+# some wait seconds. Queueing the writers of this process on a lock instead hands the
+# database over as soon as the previous write is committed, in roughly arrival order.
+# Other processes writing to the same file still fall back on busy_timeout.
+_write_lock = threading.Lock()
+
+_WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # The first write of a transaction waits for its turn; reads never do.
+    if not conn.info.get('holds_write_lock') and statement.lstrip().upper().startswith(_WRITE_STATEMENTS):
+        _write_lock.acquire()
+        conn.info['holds_write_lock'] = True
+
+
+def _release(dbapi_connection, connection_record, *args):
+    # The connection goes back to the pool after its commit or rollback, so the write is finished.
+    if connection_record is not None and connection_record.info.pop('holds_write_lock', False):
+        _write_lock.release()
+
+
+def install(engine):
+    """Queue the writes of this process one after another. Call once for a SQLite engine."""
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine.pool, 'checkin', _release)
+    event.listen(engine.pool, 'invalidate', _release)
@@ -0,0 +1,90 @@
+"""Archive a few years of synthetic matches and scan them back.
+
+Run from the Project folder:  python -m bench.bench_archive [matches]
+
+Synthetic matches (8 courts, 40 players, two a day by default) are appended
+to a temporary archive in prune-sized batches, then read back three ways:
+every result, one player's results (most batches skipped using the index)
+and one month. For each scan the time and the peak memory allocated by
+Python are printed; the peak should stay about the same however many
+matches are archived, because only one batch is held at a time.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+_tmp_dir = tempfile.mkdtemp(prefix='draft-bench-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_tmp_dir, 'bench.db')
+os.environ['ARCHIVE_DIR'] = os.path.join(_tmp_dir, 'archive')
+
+from app import create_app, archive
+from app.roster import pack_match_roster
+
+app = create_app()
+
+COURTS = 8
+CLUB_SIZE = 40
+BATCH_SIZE = 20
+
+
+def _records(count):
+    # `count` matches two per day, the courts filled from a club of CLUB_SIZE players.
+    rng = random.Random(1)
+    start = datetime(2020, 1, 1, 18, 0)
+    roster = list(range(1, CLUB_SIZE + 1))
+    for match_id in range(1, count + 1):
+        playing = rng.sample(roster, COURTS * 4)
+        resting = [i for i in roster if i not in playing]
+        match_row = SimpleNamespace(id=match_id, created_at=start + timedelta(hours=12 * match_id), match_type='balanced',
+                                    num_courts=COURTS, seed=rng.getrandbits(48),
+                                    roster_snapshot=pack_match_roster(roster, resting), seat_priority=None,
+                                    replaced_by=None)
+        courts = [
+            (number + 1, rng.choice([1, 2, None]), round(rng.uniform(0, 32), 2),
+             [[player_id, f"Player {player_id}"] for player_id in playing[number * 4:number * 4 + 4]])
+            for number in range(COURTS)
+        ]
+        yield archive.match_record(match_row, courts)
+
+
+def _scan(label, scan):
+    # scan() returns what to iterate over; it is called inside the measurement.
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _ in scan())
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<28} {count:>9} rows {elapsed:>7.2f}s  peak {peak / 1024:>8.0f} KiB")
+
+
+def run(matches):
+    with app.app_context():
+        start = time.perf_counter()
+        batch = []
+        for record in _records(matches):
+            batch.append(record)
+            if len(batch) == BATCH_SIZE:
+                archive.append_matches(batch)
+                batch = []
+        if batch:
+            archive.append_matches(batch)
+        elapsed = time.perf_counter() - start
+
+        directory = archive.archive_dir()
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"archived {matches} matches in {elapsed:.2f}s, {size / 1024 / 1024:.1f} MiB on disk "
+              f"({size / matches:.0f} bytes per match)")
+        _scan('all results', archive.iter_results)
+        _scan('player 7', lambda: archive.iter_results(player_id=7))
+        _scan('March 2021', lambda: archive.iter_results(since='2021-03-01', before='2021-04-01'))
+        _scan('totals (all players)', lambda: archive.player_totals().items())
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
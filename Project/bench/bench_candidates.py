@@ -0,0 +1,54 @@
+"""Compare how many candidate pairings "Regenerate best" checks with one process and with a pool.
+
+Run from the Project folder:  python -m bench.bench_candidates [workers]
+
+A synthetic draft of 64 players (8 courts) is searched for the same time
+budget with one in-process worker and then with the process pool (every
+CPU core unless a worker count is given). The pool should check about
+`workers` times as many candidates; on a machine with one core there is
+nothing to gain and the numbers come out about the same.
+"""
+import os
+import random
+import sys
+import tempfile
+
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='draft-bench-'), 'bench.db')
+
+from app import create_app, init_db
+from app.candidates import find_best_pairings
+from app.roster import RosterPlayer
+
+app = create_app()
+
+PLAYERS = 64
+COURTS = 8
+TIME_BUDGET = 2.0
+MATCH_TYPES = ['random', 'balanced']
+
+
+def _players():
+    rng = random.Random(1)
+    return [
+        RosterPlayer(i, f"Player {i}", rng.choice(['Beginner', 'Intermediate', 'Advanced']),
+                     'male' if i % 2 else 'female', rng.uniform(900, 1500))
+        for i in range(1, PLAYERS + 1)
+    ]
+
+
+def run(workers):
+    players = _players()
+    print(f"{PLAYERS} players, {COURTS} courts, {TIME_BUDGET:.1f}s budget, {os.cpu_count()} CPU core(s)")
+    print(f"{'type':>9} {'1 worker':>9} {f'{workers} workers':>11} {'speed-up':>9}")
+    with app.app_context():
+        init_db() # The search reads the (empty) match history.
+        # Start the pool once so its start-up time is not charged to the first measurement.
+        find_best_pairings('random', players, COURTS, time_budget=0.1, workers=workers)
+        for match_type in MATCH_TYPES:
+            _, _, single = find_best_pairings(match_type, players, COURTS, time_budget=TIME_BUDGET, workers=1)
+            _, _, pooled = find_best_pairings(match_type, players, COURTS, time_budget=TIME_BUDGET, workers=workers)
+            print(f"{match_type:>9} {single:>9} {pooled:>11} {pooled / single:>8.1f}x")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1))
@@ -0,0 +1,167 @@
+"""Fire hundreds of simultaneous "Set as Winner" requests while matches are generated and pruned.
+
+Run from the Project folder:
+
+    python -m bench.bench_concurrency
+    python -m bench.bench_concurrency --requests 800 --threads 64 --p99-ms 500
+    DATABASE_MODE=simple python -m bench.bench_concurrency   # the old rollback-journal setup, for comparison
+
+A temporary database gets a club big enough for --courts courts, one match
+using every court, and a backlog of old matches waiting to be pruned. Then
+--threads threads send --requests POST /set_winner requests between them
+(every court several times, alternating teams), while one more thread keeps
+posting /generate_matches, each of which prunes the history inline in
+batches, and another keeps regenerating a second match with Regenerate
+Best, whose search runs for CANDIDATE_TIME_BUDGET seconds each time and
+must not hold up the results meanwhile. The run fails (exit status 1) if
+any request did not redirect normally, for example because the database
+was locked, or if the 99th percentile latency is above --p99-ms.
+bench/checks.py runs it with the other checks.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='draft-bench-'), 'bench.db')
+os.environ.setdefault('DATABASE_MODE', 'production')
+
+from flask import got_request_exception
+from sqlalchemy import insert, update
+
+from app import create_app, db, init_db
+from app.models import Match, Player
+from app.persistence import save_match
+from app.roster import get_roster
+from app.candidates import generate
+from bench.synthetic import synthetic_roster, player_rows
+
+app = create_app()
+
+BACKLOG_MATCHES = 300 # Old matches the generator thread has to prune while results come in.
+REGENERATE_PAUSE = 1.0 # Seconds between two Regenerate Best clicks, roughly as often as someone could look at the result.
+
+
+def _setup(courts):
+    # One match with every court in use and one to regenerate (both kept newest, so pruning never removes them),
+    # and an old backlog.
+    init_db()
+    roster = synthetic_roster(courts * 4, seed=courts)
+    db.session.execute(insert(Player), player_rows(roster))
+    db.session.commit()
+    players = get_roster().players
+    old = datetime.utcnow() - timedelta(days=30)
+    for i in range(BACKLOG_MATCHES):
+        match_id = save_match('random', players, generate('random', players, courts, seed=i), commit=False)
+        db.session.execute(update(Match).where(Match.id == match_id).values(created_at=old + timedelta(minutes=i)))
+    regenerate_courts = max(1, courts // 5)
+    regenerate_id = save_match('balanced', players, generate('balanced', players, regenerate_courts, seed=1), commit=False)
+    match_id = save_match('balanced', players, generate('balanced', players, courts, seed=0), commit=False)
+    db.session.execute(
+        update(Match).where(Match.id.in_([match_id, regenerate_id])).values(created_at=datetime.utcnow() + timedelta(days=1))
+    )
+    db.session.commit()
+    return [court.id for court in db.session.get(Match, match_id).courts], regenerate_id
+
+
+def _percentile(timings, fraction):
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(requests, threads, courts, p99_ms):
+    app.config['WTF_CSRF_ENABLED'] = False # The test clients post without a token.
+    app.config['HISTORY_PRUNE_MODE'] = 'inline' # The generator thread prunes inside its own requests.
+    app.config['MAX_PLAYERS'] = courts * 4
+    app.config['MAX_COURTS'] = courts
+    app.config['MAX_MATCHES'] = 10
+
+    with app.app_context():
+        court_ids, regenerate_id = _setup(courts)
+        journal_mode = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+        db.session.remove()
+
+    errors = []
+    got_request_exception.connect(lambda sender, exception, **extra: errors.append(repr(exception)), app, weak=False)
+    local = threading.local()
+
+    def set_winner(i):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = app.test_client()
+        start = time.perf_counter()
+        response = client.post(f'/set_winner/{court_ids[i % len(court_ids)]}/{1 + (i // len(court_ids)) % 2}')
+        elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code != 302:
+            errors.append(f'set_winner returned {response.status_code}')
+        return elapsed
+
+    stop = threading.Event()
+    generated = []
+
+    def keep_generating():
+        # Every new match pushes the history over MAX_MATCHES, so each of these requests prunes too.
+        client = app.test_client()
+        while not stop.is_set():
+            response = client.post('/generate_matches', data={'num_courts': courts, 'match_type': 'random'})
+            if response.status_code != 302:
+                errors.append(f'generate_matches returned {response.status_code}')
+            generated.append(response.status_code)
+
+    regenerated = []
+
+    def keep_regenerating():
+        # Each regenerate replaces the match, so the next one goes to the match it was redirected to.
+        client = app.test_client()
+        match_id = regenerate_id
+        while not stop.is_set():
+            response = client.post(f'/regenerate_best/{match_id}')
+            new_id = response.headers.get('Location', '').rsplit('/', 1)[-1]
+            if response.status_code != 302 or not new_id.isdigit() or int(new_id) == match_id:
+                errors.append(f'regenerate_best returned {response.status_code} to {new_id or "nowhere"}')
+                return
+            match_id = int(new_id)
+            regenerated.append(match_id)
+            stop.wait(REGENERATE_PAUSE)
+
+    background = [threading.Thread(target=keep_generating, name='generator'),
+                  threading.Thread(target=keep_regenerating, name='regenerator')]
+    for thread in background:
+        thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        timings = list(pool.map(set_winner, range(requests)))
+    wall = time.perf_counter() - start
+    stop.set()
+    for thread in background:
+        thread.join()
+
+    p99 = _percentile(timings, 0.99)
+    print(f"journal_mode={journal_mode}, {threads} threads, {courts} courts, {BACKLOG_MATCHES} matches to prune")
+    print(f"set_winner: {requests} requests in {wall:.2f}s, p50 {statistics.median(timings):.1f} ms, "
+          f"p95 {_percentile(timings, 0.95):.1f} ms, p99 {p99:.1f} ms, max {max(timings):.1f} ms")
+    print(f"generate_matches (with pruning) ran {len(generated)} times alongside")
+    print(f"regenerate_best ran {len(regenerated)} times alongside")
+    for error in errors[:10]:
+        print(f"  error: {error}")
+    print(f"{len(errors)} error(s); p99 limit {p99_ms:.0f} ms")
+    return 1 if errors or p99 > p99_ms else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--courts', type=int, default=50)
+    parser.add_argument('--p99-ms', type=float, default=1000.0, help='fail if the 99th percentile is slower than this')
+    args = parser.parse_args(argv)
+    return run(args.requests, args.threads, args.courts, args.p99_ms)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Benchmark for saving a whole match in one batched write.
+
+Run from the Project folder:  python -m bench.bench_persistence
+
+A temporary SQLite file is used so the real draft.db is never touched.
+For each roster size it reports how many SQL statements one save runs and
+how long the write takes.
+"""
+import os
+import sys
+import tempfile
+import time
+
+_tmp_dir = tempfile.mkdtemp(prefix='draft-bench-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_tmp_dir, 'bench.db')
+
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models import Player
+from app.matchmaking import create_random_matches
+from app.persistence import save_match
+
+app = create_app()
+
+SIZES = [8, 32, 128, 512]
+REPEATS = 5
+
+
+def _count_statements(engine):
+    counter = {'statements': 0}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter['statements'] += 1
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    return counter
+
+
+def run():
+    with app.app_context():
+        counter = _count_statements(db.engine)
+        print(f"{'players':>8} {'courts':>7} {'statements':>11} {'best ms':>9} {'mean ms':>9}")
+        for size in SIZES:
+            db.session.remove()
+            db.drop_all()
+            db.create_all()
+            players = [Player(name=f"Player {i}", skill='Intermediate', gender='male' if i % 2 else 'female')
+                       for i in range(size)]
+            db.session.add_all(players)
+            db.session.commit()
+            num_courts = size // 4
+
+            timings = []
+            statements = 0
+            for _ in range(REPEATS):
+                players = Player.query.all() # Reload outside the timed block, the last commit expired them.
+                match_data = create_random_matches(players, num_courts)
+                counter['statements'] = 0
+                start = time.perf_counter()
+                save_match('random', players, match_data)
+                timings.append((time.perf_counter() - start) * 1000)
+                statements = counter['statements']
+
+            print(f"{size:>8} {num_courts:>7} {statements:>11} {min(timings):>9.2f} {sum(timings) / len(timings):>9.2f}")
+
+
+if __name__ == '__main__':
+    sys.exit(run())
@@ -0,0 +1,53 @@
+"""Compare the old comma-joined match snapshots with the packed roster snapshot.
+
+Run from the Project folder:  python -m bench.bench_snapshot
+
+For rosters of 32 and 5,000 players (a quarter of them resting) it reports
+the bytes each format stores per match and how long it takes to decode the
+roster ids and resting players. The old format also stored every roster
+entry a second time as a match_roster row; those rows are shown separately
+because their size depends on SQLite's page layout.
+"""
+import timeit
+
+from app.roster import pack_match_roster, unpack_match_roster
+
+SIZES = [32, 5000]
+REPEATS = 5
+
+
+def _old_snapshot(player_ids, names, resting_ids):
+    # What save_match used to write: every id, plus the names of the resting players.
+    resting = set(resting_ids)
+    return ",".join(str(i) for i in player_ids), ",".join(names[i] for i in player_ids if i in resting)
+
+
+def _old_decode(ids_text, resting_text):
+    return [int(i) for i in ids_text.split(',') if i], resting_text.split(',')
+
+
+def _best_ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number * 1000
+
+
+def run():
+    print(f"{'players':>8} {'old bytes':>10} {'+roster rows':>13} {'new bytes':>10} {'old decode ms':>14} {'new decode ms':>14}")
+    for size in SIZES:
+        # Ids from a long-lived database, so they are not all small numbers.
+        player_ids = list(range(10_000, 10_000 + size))
+        names = {i: f"Player {i}" for i in player_ids}
+        resting_ids = player_ids[::4]
+
+        ids_text, resting_text = _old_snapshot(player_ids, names, resting_ids)
+        packed = pack_match_roster(player_ids, resting_ids)
+        assert unpack_match_roster(packed) == (player_ids, resting_ids)
+
+        old_bytes = len(ids_text.encode()) + len(resting_text.encode())
+        number = max(1, 20_000 // size)
+        old_ms = _best_ms(lambda: _old_decode(ids_text, resting_text), number)
+        new_ms = _best_ms(lambda: unpack_match_roster(packed), number)
+        print(f"{size:>8} {old_bytes:>10} {size:>13} {len(packed):>10} {old_ms:>14.4f} {new_ms:>14.4f}")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,72 @@
+"""How long it takes to start the app, and a check that starting it never opens the database.
+
+Run from the Project folder:  python -m bench.bench_startup
+
+Reports, each measured in a fresh Python process:
+
+* import: `from app import create_app` (Flask, SQLAlchemy and the extensions);
+* first app: the first create_app(), which imports the views, models and forms;
+* next apps: each further create_app(), i.e. what a forked worker or another test pays;
+* test app + schema: create_app('testing') plus init_db() on its in-memory database.
+
+The script fails if create_app() connects to the database or imports NumPy.
+"""
+import json
+import subprocess
+import sys
+
+REPEATS = 5
+
+_MEASURE = r"""
+import json, os, sys, tempfile, time
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='draft-bench-'), 'bench.db')
+start = time.perf_counter()
+from app import create_app, init_db, db
+from sqlalchemy import event
+imported = time.perf_counter()
+app = create_app()
+first = time.perf_counter()
+for _ in range(10):
+    create_app()
+after = time.perf_counter()
+
+connections = []
+app = create_app()
+with app.app_context():
+    event.listen(db.engine, 'connect', lambda *args: connections.append(1))
+numpy_loaded = 'numpy' in sys.modules
+
+before_test = time.perf_counter()
+test_app = create_app('testing')
+with test_app.app_context():
+    init_db()
+done = time.perf_counter()
+print(json.dumps({
+    'import': (imported - start) * 1000,
+    'first app': (first - imported) * 1000,
+    'next apps': (after - first) * 100,
+    'test app + schema': (done - before_test) * 1000,
+    'connections': len(connections),
+    'numpy': numpy_loaded,
+}))
+"""
+
+
+def _run_once():
+    output = subprocess.run([sys.executable, '-c', _MEASURE], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run():
+    runs = [_run_once() for _ in range(REPEATS)]
+    for name in ('import', 'first app', 'next apps', 'test app + schema'):
+        timings = sorted(r[name] for r in runs)
+        print(f"{name:<20} best {timings[0]:>8.1f} ms   median {timings[len(timings) // 2]:>8.1f} ms")
+    connected = any(r['connections'] for r in runs)
+    numpy = any(r['numpy'] for r in runs)
+    print(f"database opened by create_app: {'YES' if connected else 'no'}; NumPy imported: {'YES' if numpy else 'no'}")
+    return 1 if connected or numpy else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
@@ -0,0 +1,179 @@
+"""Check that a database from every earlier version upgrades to the current schema and still works.
+
+Run from the Project folder:  python -m bench.check_migrations
+
+bench/migration_fixtures holds one SQL dump per PRAGMA user_version the app
+has shipped with (0 is the original schema, before there were migrations).
+Each was made by running that version of the app from a git worktree: add
+players, generate matches, record some winners and delete a player. The
+script loads every dump into a temporary SQLite file and runs init_db() on
+it, then checks that
+
+* user_version is the number of migration steps and a second init_db() changes nothing;
+* the tables, columns, indexes and foreign keys are the same as in a new database;
+* SQLite's integrity and foreign key checks pass;
+* the draft, history, leaderboard and match pages render, and a match can be
+  generated, regenerated and given a winner, after which it is no longer
+  regenerated.
+
+It exits with an error if any version fails. When a migration step is
+added, dump a database made by the previous version into a new fixture.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import traceback
+
+from app import create_app, init_db, db
+from app.migrations import MIGRATIONS
+from app.models import Match, Court
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'migration_fixtures')
+
+
+def _fixtures():
+    names = [n for n in os.listdir(FIXTURE_DIR) if n.startswith('user_version_') and n.endswith('.sql')]
+    return sorted(names, key=lambda n: int(n[len('user_version_'):-len('.sql')]))
+
+
+def _schema(path):
+    # Everything about the schema that the app relies on, comparable between two databases.
+    conn = sqlite3.connect(path)
+    try:
+        tables = [name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+        schema = {}
+        for table in tables:
+            columns = sorted(row[1] for row in conn.execute(f'PRAGMA table_info("{table}")'))
+            indexes = sorted(row[1] for row in conn.execute(f'PRAGMA index_list("{table}")') if not row[1].startswith('sqlite_'))
+            foreign_keys = sorted((row[2], row[3], row[4], row[6]) for row in conn.execute(f'PRAGMA foreign_key_list("{table}")'))
+            schema[table] = {'columns': columns, 'indexes': indexes, 'foreign keys': foreign_keys}
+        return schema
+    finally:
+        conn.close()
+
+
+def _make_app(path, directory):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + path,
+        'WTF_CSRF_ENABLED': False,
+        'HISTORY_PRUNE_MODE': 'inline',
+        'ARCHIVE_DIR': os.path.join(directory, 'archive'),
+        'PROPAGATE_EXCEPTIONS': True, # An error in a page raises here instead of rendering the error page.
+    })
+
+
+def _expect(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+def _use_the_app(app):
+    client = app.test_client()
+    for url in ('/draft', '/history', '/leaderboard', '/leaderboard?sort_by=losses'):
+        response = client.get(url)
+        _expect(response.status_code == 200, f"GET {url} returned {response.status_code}")
+    with app.app_context():
+        latest = db.session.scalar(db.select(Match.id).order_by(Match.id.desc()).limit(1))
+    if latest is not None:
+        response = client.get(f'/match/{latest}')
+        _expect(response.status_code == 200, f"GET /match/{latest} returned {response.status_code}")
+
+    response = client.post('/generate_matches', data={'num_courts': 2, 'match_type': 'random'})
+    _expect(response.status_code == 302, f"generating a match returned {response.status_code}")
+    with app.app_context():
+        new_id = db.session.scalar(db.select(Match.id).order_by(Match.id.desc()).limit(1))
+        court_id = db.session.scalar(db.select(Court.id).where(Court.match_id == new_id).limit(1))
+    _expect(new_id is not None and new_id != latest, "generating a match saved nothing")
+    response = client.post(f'/regenerate_match/{new_id}')
+    _expect(response.status_code == 302, f"regenerating the match returned {response.status_code}")
+    response = client.get(response.headers['Location'])
+    _expect(response.status_code == 200, f"the regenerated match page returned {response.status_code}")
+    with app.app_context():
+        replaced_by = db.session.scalar(db.select(Match.replaced_by).where(Match.id == new_id))
+        court_id = db.session.scalar(db.select(Court.id).where(Court.match_id == replaced_by).limit(1))
+    _expect(replaced_by is not None and replaced_by != new_id, "the regenerated match was not marked as replaced")
+    response = client.post(f'/set_winner/{court_id}/1')
+    _expect(response.status_code == 302, f"setting a winner returned {response.status_code}")
+    client.post(f'/regenerate_match/{replaced_by}')
+    with app.app_context():
+        kept = db.session.scalar(db.select(Match.replaced_by).where(Match.id == replaced_by)) is None
+    _expect(kept, "a match with a result was regenerated")
+
+
+def check_fixture(name, expected_schema):
+    """Upgrade one fixture. Returns a list of problems, empty if it passed."""
+    directory = tempfile.mkdtemp(prefix='draft-migrate-')
+    path = os.path.join(directory, 'draft.db')
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        conn = sqlite3.connect(path)
+        conn.executescript(f.read())
+        conn.close()
+
+    app = _make_app(path, directory)
+    with app.app_context():
+        init_db()
+        version = db.session.execute(db.text('PRAGMA user_version')).scalar()
+        db.session.remove()
+    problems = []
+    if version != len(MIGRATIONS):
+        problems.append(f"user_version is {version}, expected {len(MIGRATIONS)}")
+    upgraded_schema = _schema(path)
+    with app.app_context():
+        init_db() # Running it again must be harmless.
+        db.session.remove()
+    if _schema(path) != upgraded_schema:
+        problems.append("a second init_db() changed the schema")
+
+    for table in sorted(set(expected_schema) | set(upgraded_schema)):
+        expected, actual = expected_schema.get(table), upgraded_schema.get(table)
+        if expected is None or actual is None:
+            problems.append(f"table {table} is {'missing' if actual is None else 'not in a new database'}")
+            continue
+        for part in expected:
+            if expected[part] != actual[part]:
+                problems.append(f"{table} {part}: {actual[part]} instead of {expected[part]}")
+
+    conn = sqlite3.connect(path)
+    integrity = conn.execute('PRAGMA integrity_check').fetchone()[0]
+    dangling = conn.execute('PRAGMA foreign_key_check').fetchall()
+    conn.close()
+    if integrity != 'ok':
+        problems.append(f"integrity check: {integrity}")
+    if dangling:
+        problems.append(f"{len(dangling)} rows point at missing rows, e.g. {dangling[0]}")
+
+    if not problems:
+        try:
+            _use_the_app(app)
+        except Exception as error:
+            problems.append(f"{type(error).__name__}: {error}")
+            traceback.print_exc()
+    return problems
+
+
+def run():
+    directory = tempfile.mkdtemp(prefix='draft-migrate-')
+    path = os.path.join(directory, 'new.db')
+    with _make_app(path, directory).app_context():
+        init_db()
+        db.session.remove()
+    expected_schema = _schema(path)
+
+    failed = False
+    for name in _fixtures():
+        try:
+            problems = check_fixture(name, expected_schema)
+        except Exception as error:
+            traceback.print_exc()
+            problems = [f"upgrade failed: {type(error).__name__}: {str(error).splitlines()[0]}"]
+        failed = failed or bool(problems)
+        print(f"{name:<22} {'OK' if not problems else 'FAILED'}")
+        for problem in problems:
+            print(f"    {problem}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
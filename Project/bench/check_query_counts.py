@@ -0,0 +1,84 @@
+"""Check that /match/<id> and /history run a fixed number of queries.
+
+Run from the Project folder:  python -m bench.check_query_counts
+
+Matches with 1, 10 and 100 courts (and histories of 1, 10 and 100
+matches) are saved into a temporary SQLite file, each page is requested
+through the Flask test client and the SQL statements are counted. The
+script exits with status 1 if the count changes with the size or a page
+does not load. The response cache is cleared before each request so the
+full render is what gets counted. bench/checks.py runs it with the other
+checks.
+"""
+import os
+import sys
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix='draft-bench-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_tmp_dir, 'bench.db')
+
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models import Player
+from app.matchmaking import create_random_matches
+from app.persistence import save_match
+from app.http_cache import get_cache
+from app.players import invalidate_player_cache
+
+app = create_app()
+
+SIZES = [1, 10, 100]
+
+
+def _reset_with_players(count):
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    db.session.add_all([Player(name=f"Player {i}", skill='Intermediate', gender='male') for i in range(count)])
+    db.session.commit()
+    invalidate_player_cache() # The cached draft roster belongs to the old database.
+    return Player.query.all()
+
+
+def _count_request(client, counter, url):
+    get_cache().clear()
+    counter['statements'] = 0
+    response = client.get(url)
+    assert response.status_code == 200, f"{url} returned {response.status_code}"
+    return counter['statements']
+
+
+def run():
+    client = app.test_client()
+    counter = {'statements': 0}
+    results = {'match': {}, 'history': {}}
+
+    with app.app_context():
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            counter['statements'] += 1
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+        for courts in SIZES:
+            players = _reset_with_players(courts * 4)
+            match_id = save_match('random', players, create_random_matches(players, courts))
+            results['match'][courts] = _count_request(client, counter, f'/match/{match_id}')
+
+        for matches in SIZES:
+            players = _reset_with_players(8)
+            for _ in range(matches):
+                save_match('random', players, create_random_matches(players, 2))
+                players = Player.query.all()
+            results['history'][matches] = _count_request(client, counter, '/history')
+
+    failed = False
+    for page, counts in results.items():
+        line = ", ".join(f"{size}: {count}" for size, count in counts.items())
+        steady = len(set(counts.values())) == 1
+        failed = failed or not steady
+        print(f"{page:>8} queries by size -> {line} {'OK' if steady else 'GROWS WITH SIZE'}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
@@ -0,0 +1,32 @@
+"""Run every check script and exit with status 1 if any of them fails.
+
+Run from the Project folder:  python -m bench.checks
+
+The project has no test suite; these scripts are what guards the query
+count, migration, startup and concurrency promises, so run them before merging a
+change. Each one runs in its own Python process (they point DATABASE_URL
+at their own temporary files when imported) and can also be run on its own.
+"""
+import subprocess
+import sys
+
+CHECKS = [
+    ['bench.check_query_counts'],
+    ['bench.check_migrations'],
+    ['bench.bench_startup'],
+    ['bench.bench_concurrency'], # Takes the longest: hundreds of simultaneous results while matches are pruned.
+]
+
+
+def run():
+    failed = []
+    for command in CHECKS:
+        print(f"== python -m {' '.join(command)}", flush=True)
+        if subprocess.run([sys.executable, '-m', *command]).returncode != 0:
+            failed.append(command[0])
+    print(f"{len(CHECKS) - len(failed)} of {len(CHECKS)} checks passed" + (f"; failed: {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
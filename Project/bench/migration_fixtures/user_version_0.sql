@@ -0,0 +1,275 @@
+PRAGMA user_version = 0;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id)
+);
+INSERT INTO "court" VALUES(5,3,1,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL);
+INSERT INTO "court" VALUES(8,4,2,2);
+INSERT INTO "court" VALUES(9,5,1,NULL);
+INSERT INTO "court" VALUES(10,5,2,1);
+INSERT INTO "court" VALUES(11,6,1,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL);
+INSERT INTO "court" VALUES(14,7,2,1);
+INSERT INTO "court" VALUES(15,8,1,NULL);
+INSERT INTO "court" VALUES(16,8,2,2);
+INSERT INTO "court" VALUES(17,9,1,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL);
+INSERT INTO "court" VALUES(20,10,2,2);
+INSERT INTO "court" VALUES(21,11,1,NULL);
+INSERT INTO "court" VALUES(22,11,2,1);
+INSERT INTO "court" VALUES(23,12,1,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(17,5,1,'Player 0');
+INSERT INTO "court_player" VALUES(18,5,4,'Player 3');
+INSERT INTO "court_player" VALUES(19,5,6,'Player 5');
+INSERT INTO "court_player" VALUES(20,5,7,'Player 6');
+INSERT INTO "court_player" VALUES(21,6,5,'Player 4');
+INSERT INTO "court_player" VALUES(22,6,11,'Player 10');
+INSERT INTO "court_player" VALUES(23,6,10,'Player 9');
+INSERT INTO "court_player" VALUES(24,6,12,'Player 11');
+INSERT INTO "court_player" VALUES(25,7,11,'Player 10');
+INSERT INTO "court_player" VALUES(26,7,6,'Player 5');
+INSERT INTO "court_player" VALUES(27,7,12,'Player 11');
+INSERT INTO "court_player" VALUES(28,7,8,'Player 7');
+INSERT INTO "court_player" VALUES(29,8,7,'Player 6');
+INSERT INTO "court_player" VALUES(30,8,2,'Player 1');
+INSERT INTO "court_player" VALUES(31,8,5,'Player 4');
+INSERT INTO "court_player" VALUES(32,8,10,'Player 9');
+INSERT INTO "court_player" VALUES(33,9,9,'Player 8');
+INSERT INTO "court_player" VALUES(34,9,11,'Player 10');
+INSERT INTO "court_player" VALUES(35,9,6,'Player 5');
+INSERT INTO "court_player" VALUES(36,9,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(37,10,4,'Player 3');
+INSERT INTO "court_player" VALUES(38,10,2,'Player 1');
+INSERT INTO "court_player" VALUES(39,10,7,'Player 6');
+INSERT INTO "court_player" VALUES(40,10,10,'Player 9');
+INSERT INTO "court_player" VALUES(41,11,12,'Player 11');
+INSERT INTO "court_player" VALUES(42,11,9,'Player 8');
+INSERT INTO "court_player" VALUES(43,11,6,'Player 5');
+INSERT INTO "court_player" VALUES(44,11,2,'Player 1');
+INSERT INTO "court_player" VALUES(45,12,1,'Player 0');
+INSERT INTO "court_player" VALUES(46,12,8,'Player 7');
+INSERT INTO "court_player" VALUES(47,12,10,'Player 9');
+INSERT INTO "court_player" VALUES(48,12,5,'Player 4');
+INSERT INTO "court_player" VALUES(49,13,12,'Player 11');
+INSERT INTO "court_player" VALUES(50,13,11,'Player 10');
+INSERT INTO "court_player" VALUES(51,13,10,'Player 9');
+INSERT INTO "court_player" VALUES(52,13,2,'Player 1');
+INSERT INTO "court_player" VALUES(53,14,9,'Player 8');
+INSERT INTO "court_player" VALUES(54,14,7,'Player 6');
+INSERT INTO "court_player" VALUES(55,14,4,'Player 3');
+INSERT INTO "court_player" VALUES(56,14,8,'Player 7');
+INSERT INTO "court_player" VALUES(57,15,1,'Player 0');
+INSERT INTO "court_player" VALUES(58,15,7,'Player 6');
+INSERT INTO "court_player" VALUES(59,15,9,'Player 8');
+INSERT INTO "court_player" VALUES(60,15,10,'Player 9');
+INSERT INTO "court_player" VALUES(61,16,11,'Player 10');
+INSERT INTO "court_player" VALUES(62,16,12,'Player 11');
+INSERT INTO "court_player" VALUES(63,16,5,'Player 4');
+INSERT INTO "court_player" VALUES(64,16,2,'Player 1');
+INSERT INTO "court_player" VALUES(65,17,5,'Player 4');
+INSERT INTO "court_player" VALUES(66,17,4,'Player 3');
+INSERT INTO "court_player" VALUES(67,17,7,'Player 6');
+INSERT INTO "court_player" VALUES(68,17,10,'Player 9');
+INSERT INTO "court_player" VALUES(69,18,9,'Player 8');
+INSERT INTO "court_player" VALUES(70,18,12,'Player 11');
+INSERT INTO "court_player" VALUES(71,18,11,'Player 10');
+INSERT INTO "court_player" VALUES(72,18,8,'Player 7');
+INSERT INTO "court_player" VALUES(73,19,6,'Player 5');
+INSERT INTO "court_player" VALUES(74,19,10,'Player 9');
+INSERT INTO "court_player" VALUES(75,19,9,'Player 8');
+INSERT INTO "court_player" VALUES(76,19,8,'Player 7');
+INSERT INTO "court_player" VALUES(77,20,7,'Player 6');
+INSERT INTO "court_player" VALUES(78,20,2,'Player 1');
+INSERT INTO "court_player" VALUES(79,20,11,'Player 10');
+INSERT INTO "court_player" VALUES(80,20,4,'Player 3');
+INSERT INTO "court_player" VALUES(81,21,10,'Player 9');
+INSERT INTO "court_player" VALUES(82,21,9,'Player 8');
+INSERT INTO "court_player" VALUES(83,21,5,'Player 4');
+INSERT INTO "court_player" VALUES(84,21,8,'Player 7');
+INSERT INTO "court_player" VALUES(85,22,7,'Player 6');
+INSERT INTO "court_player" VALUES(86,22,11,'Player 10');
+INSERT INTO "court_player" VALUES(87,22,1,'Player 0');
+INSERT INTO "court_player" VALUES(88,22,4,'Player 3');
+INSERT INTO "court_player" VALUES(89,23,1,'Player 0');
+INSERT INTO "court_player" VALUES(90,23,7,'Player 6');
+INSERT INTO "court_player" VALUES(91,23,10,'Player 9');
+INSERT INTO "court_player" VALUES(92,23,5,'Player 4');
+INSERT INTO "court_player" VALUES(93,24,11,'Player 10');
+INSERT INTO "court_player" VALUES(94,24,12,'Player 11');
+INSERT INTO "court_player" VALUES(95,24,4,'Player 3');
+INSERT INTO "court_player" VALUES(96,24,9,'Player 8');
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	player_ids_snapshot VARCHAR, 
+	created_at DATETIME, 
+	resting_players_snapshot TEXT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(3,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.030463','Player 1,Player 2,Player 7,Player 8');
+INSERT INTO "match" VALUES(4,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.042669','Player 0,Player 2,Player 3,Player 8');
+INSERT INTO "match" VALUES(5,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.057497','Player 0,Player 4,Player 7,Player 11');
+INSERT INTO "match" VALUES(6,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.073869','Player 2,Player 3,Player 6,Player 10');
+INSERT INTO "match" VALUES(7,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.098093','Player 0,Player 4,Player 5');
+INSERT INTO "match" VALUES(8,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.114038','Player 3,Player 5,Player 7');
+INSERT INTO "match" VALUES(9,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.130319','Player 0,Player 1,Player 5');
+INSERT INTO "match" VALUES(10,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.145228','Player 0,Player 4,Player 11');
+INSERT INTO "match" VALUES(11,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.166133','Player 1,Player 5,Player 11');
+INSERT INTO "match" VALUES(12,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:08.200640','Player 1,Player 5,Player 7');
+CREATE TABLE match_roster (
+	match_id INTEGER NOT NULL, 
+	player_id INTEGER NOT NULL, 
+	PRIMARY KEY (match_id, player_id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "match_roster" VALUES(3,1);
+INSERT INTO "match_roster" VALUES(3,2);
+INSERT INTO "match_roster" VALUES(3,4);
+INSERT INTO "match_roster" VALUES(3,5);
+INSERT INTO "match_roster" VALUES(3,6);
+INSERT INTO "match_roster" VALUES(3,7);
+INSERT INTO "match_roster" VALUES(3,8);
+INSERT INTO "match_roster" VALUES(3,9);
+INSERT INTO "match_roster" VALUES(3,10);
+INSERT INTO "match_roster" VALUES(3,11);
+INSERT INTO "match_roster" VALUES(3,12);
+INSERT INTO "match_roster" VALUES(4,1);
+INSERT INTO "match_roster" VALUES(4,2);
+INSERT INTO "match_roster" VALUES(4,4);
+INSERT INTO "match_roster" VALUES(4,5);
+INSERT INTO "match_roster" VALUES(4,6);
+INSERT INTO "match_roster" VALUES(4,7);
+INSERT INTO "match_roster" VALUES(4,8);
+INSERT INTO "match_roster" VALUES(4,9);
+INSERT INTO "match_roster" VALUES(4,10);
+INSERT INTO "match_roster" VALUES(4,11);
+INSERT INTO "match_roster" VALUES(4,12);
+INSERT INTO "match_roster" VALUES(5,1);
+INSERT INTO "match_roster" VALUES(5,2);
+INSERT INTO "match_roster" VALUES(5,4);
+INSERT INTO "match_roster" VALUES(5,5);
+INSERT INTO "match_roster" VALUES(5,6);
+INSERT INTO "match_roster" VALUES(5,7);
+INSERT INTO "match_roster" VALUES(5,8);
+INSERT INTO "match_roster" VALUES(5,9);
+INSERT INTO "match_roster" VALUES(5,10);
+INSERT INTO "match_roster" VALUES(5,11);
+INSERT INTO "match_roster" VALUES(5,12);
+INSERT INTO "match_roster" VALUES(6,1);
+INSERT INTO "match_roster" VALUES(6,2);
+INSERT INTO "match_roster" VALUES(6,4);
+INSERT INTO "match_roster" VALUES(6,5);
+INSERT INTO "match_roster" VALUES(6,6);
+INSERT INTO "match_roster" VALUES(6,7);
+INSERT INTO "match_roster" VALUES(6,8);
+INSERT INTO "match_roster" VALUES(6,9);
+INSERT INTO "match_roster" VALUES(6,10);
+INSERT INTO "match_roster" VALUES(6,11);
+INSERT INTO "match_roster" VALUES(6,12);
+INSERT INTO "match_roster" VALUES(7,1);
+INSERT INTO "match_roster" VALUES(7,2);
+INSERT INTO "match_roster" VALUES(7,4);
+INSERT INTO "match_roster" VALUES(7,5);
+INSERT INTO "match_roster" VALUES(7,6);
+INSERT INTO "match_roster" VALUES(7,7);
+INSERT INTO "match_roster" VALUES(7,8);
+INSERT INTO "match_roster" VALUES(7,9);
+INSERT INTO "match_roster" VALUES(7,10);
+INSERT INTO "match_roster" VALUES(7,11);
+INSERT INTO "match_roster" VALUES(7,12);
+INSERT INTO "match_roster" VALUES(8,1);
+INSERT INTO "match_roster" VALUES(8,2);
+INSERT INTO "match_roster" VALUES(8,4);
+INSERT INTO "match_roster" VALUES(8,5);
+INSERT INTO "match_roster" VALUES(8,6);
+INSERT INTO "match_roster" VALUES(8,7);
+INSERT INTO "match_roster" VALUES(8,8);
+INSERT INTO "match_roster" VALUES(8,9);
+INSERT INTO "match_roster" VALUES(8,10);
+INSERT INTO "match_roster" VALUES(8,11);
+INSERT INTO "match_roster" VALUES(8,12);
+INSERT INTO "match_roster" VALUES(9,1);
+INSERT INTO "match_roster" VALUES(9,2);
+INSERT INTO "match_roster" VALUES(9,4);
+INSERT INTO "match_roster" VALUES(9,5);
+INSERT INTO "match_roster" VALUES(9,6);
+INSERT INTO "match_roster" VALUES(9,7);
+INSERT INTO "match_roster" VALUES(9,8);
+INSERT INTO "match_roster" VALUES(9,9);
+INSERT INTO "match_roster" VALUES(9,10);
+INSERT INTO "match_roster" VALUES(9,11);
+INSERT INTO "match_roster" VALUES(9,12);
+INSERT INTO "match_roster" VALUES(10,1);
+INSERT INTO "match_roster" VALUES(10,2);
+INSERT INTO "match_roster" VALUES(10,4);
+INSERT INTO "match_roster" VALUES(10,5);
+INSERT INTO "match_roster" VALUES(10,6);
+INSERT INTO "match_roster" VALUES(10,7);
+INSERT INTO "match_roster" VALUES(10,8);
+INSERT INTO "match_roster" VALUES(10,9);
+INSERT INTO "match_roster" VALUES(10,10);
+INSERT INTO "match_roster" VALUES(10,11);
+INSERT INTO "match_roster" VALUES(10,12);
+INSERT INTO "match_roster" VALUES(11,1);
+INSERT INTO "match_roster" VALUES(11,2);
+INSERT INTO "match_roster" VALUES(11,4);
+INSERT INTO "match_roster" VALUES(11,5);
+INSERT INTO "match_roster" VALUES(11,6);
+INSERT INTO "match_roster" VALUES(11,7);
+INSERT INTO "match_roster" VALUES(11,8);
+INSERT INTO "match_roster" VALUES(11,9);
+INSERT INTO "match_roster" VALUES(11,10);
+INSERT INTO "match_roster" VALUES(11,11);
+INSERT INTO "match_roster" VALUES(11,12);
+INSERT INTO "match_roster" VALUES(12,1);
+INSERT INTO "match_roster" VALUES(12,2);
+INSERT INTO "match_roster" VALUES(12,4);
+INSERT INTO "match_roster" VALUES(12,5);
+INSERT INTO "match_roster" VALUES(12,6);
+INSERT INTO "match_roster" VALUES(12,7);
+INSERT INTO "match_roster" VALUES(12,8);
+INSERT INTO "match_roster" VALUES(12,9);
+INSERT INTO "match_roster" VALUES(12,10);
+INSERT INTO "match_roster" VALUES(12,11);
+INSERT INTO "match_roster" VALUES(12,12);
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner','male');
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate','female');
+INSERT INTO "player" VALUES(4,'Player 3','Beginner','female');
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate','male');
+INSERT INTO "player" VALUES(6,'Player 5','Advanced','female');
+INSERT INTO "player" VALUES(7,'Player 6','Beginner','male');
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate','female');
+INSERT INTO "player" VALUES(9,'Player 8','Advanced','male');
+INSERT INTO "player" VALUES(10,'Player 9','Beginner','female');
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate','male');
+INSERT INTO "player" VALUES(12,'Player 11','Advanced','female');
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+COMMIT;
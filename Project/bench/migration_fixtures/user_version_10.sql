@@ -0,0 +1,203 @@
+PRAGMA user_version = 10;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-6.56386507355433757027e+00);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,1.7971727849977085611e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,2.17873505121424315689e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-2.09447291910489568071e+01);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-1.2103414638402401948e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,2.74778818184720705639e+01);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	rest_debt INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(17,5,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(18,5,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(19,5,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(20,5,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(21,6,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(22,6,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(23,6,NULL,'Player 2',1);
+INSERT INTO "court_player" VALUES(24,6,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(25,7,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(26,7,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(27,7,NULL,'Player 2',0);
+INSERT INTO "court_player" VALUES(28,7,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(29,8,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(30,8,1,'Player 0',1);
+INSERT INTO "court_player" VALUES(31,8,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(32,8,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(33,9,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(34,9,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(35,9,NULL,'Player 2',0);
+INSERT INTO "court_player" VALUES(36,9,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(37,10,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(38,10,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(39,10,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(40,10,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(41,11,NULL,'Player 2',0);
+INSERT INTO "court_player" VALUES(42,11,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(43,11,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(44,11,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(45,12,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(46,12,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(47,12,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(48,12,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(49,13,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(50,13,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(51,13,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(52,13,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(53,14,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(54,14,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(55,14,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(56,14,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(57,15,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(58,15,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(59,15,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(60,15,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(61,16,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(62,16,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(63,16,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(64,16,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(65,17,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(66,17,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(67,17,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(68,17,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(69,18,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(70,18,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(71,18,1,'Player 0',1);
+INSERT INTO "court_player" VALUES(72,18,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(73,19,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(74,19,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(75,19,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(76,19,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(77,20,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(78,20,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(79,20,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(80,20,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(81,21,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(82,21,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(83,21,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(84,21,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(85,22,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(86,22,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(87,22,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(88,22,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(89,23,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(90,23,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(91,23,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(92,23,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(93,24,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(94,24,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(95,24,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(96,24,10,'Player 9',1);
+CREATE TABLE data_version (
+	name VARCHAR(20) NOT NULL, 
+	version INTEGER NOT NULL, 
+	PRIMARY KEY (name)
+);
+INSERT INTO "data_version" VALUES('players',13);
+INSERT INTO "data_version" VALUES('ratings',8);
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	seed BIGINT, 
+	seat_priority BLOB, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(3,2,'random','2026-10-18 09:04:39.120851',X'42030506080A0C0E1112141718',2,'2026-10-18 09:04:39.120855',145142320738800,X'420C070603');
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 09:04:39.134366',X'42020406080A0D0F1013151618',3,'2026-10-18 09:04:39.151494',41090287570543,X'420B080201');
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 09:04:39.157993',X'42020506090B0C0E1012141619',3,'2026-10-18 09:04:39.170366',75695399488302,X'420A090706');
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 09:04:39.178999',X'42020406080A0D0F1013151618',2,'2026-10-18 09:04:39.179008',280377754017235,X'420C050402');
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 09:04:39.201537',X'420205080B0C0E1012141619',2,'2026-10-18 09:04:39.211671',155026211325603,X'420A090706');
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 09:04:39.218068',X'420304090A0C0E1112141618',2,'2026-10-18 09:04:39.230769',114142307160599,X'420C0502');
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 09:04:39.239187',X'420205080A0C0F1013141618',1,'2026-10-18 09:04:39.239194',132896395736813,X'42080401');
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 09:04:39.251643',X'420204080A0D0E1012141719',2,'2026-10-18 09:04:39.267722',53536536341700,X'42090702');
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 09:04:39.276253',X'420204080A0C0F1112151618',2,'2026-10-18 09:04:39.305496',101196145265052,X'420C0B06');
+INSERT INTO "match" VALUES(12,2,'random','2026-10-18 09:04:39.313986',X'420204090A0D0E1013141618',1,'2026-10-18 09:04:39.313991',56423712690704,X'420A0807');
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',1.00881735272649723355e+03);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.18136343273417446654e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',1.04270136725706015566e+03);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.22094472919104896394e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.38202827215002298547e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',9.96656237929017493112e+02);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.20021694065081487674e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.38715683458050443731e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',1.02431190165273460477e+03);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.20105956197190835157e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',1.37905527080895103607e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	rest_debt INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,10,3,4,2,0);
+INSERT INTO "player_stats" VALUES(2,7,1,2,5,0);
+INSERT INTO "player_stats" VALUES(4,9,2,1,3,1);
+INSERT INTO "player_stats" VALUES(5,9,1,0,3,0);
+INSERT INTO "player_stats" VALUES(6,7,0,1,5,1);
+INSERT INTO "player_stats" VALUES(7,7,2,2,5,0);
+INSERT INTO "player_stats" VALUES(8,8,2,1,4,0);
+INSERT INTO "player_stats" VALUES(9,8,2,2,4,1);
+INSERT INTO "player_stats" VALUES(10,9,1,0,3,0);
+INSERT INTO "player_stats" VALUES(11,9,2,1,3,0);
+INSERT INTO "player_stats" VALUES(12,8,0,1,4,0);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_player_stats_rest_debt ON player_stats (rest_debt);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
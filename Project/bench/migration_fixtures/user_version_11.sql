@@ -0,0 +1,211 @@
+PRAGMA user_version = 11;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-8.1564300739898332182e+00);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,7.29282919963264575358e+00);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,1.94791793656413716462e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-1.09423293188968653312e+01);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-2.43062533145675487835e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,8.63437782679640619676e+00);
+INSERT INTO "court" VALUES(25,13,1,NULL,NULL);
+INSERT INTO "court" VALUES(26,13,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	rest_debt INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(17,5,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(18,5,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(19,5,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(20,5,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(21,6,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(22,6,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(23,6,1,'Player 0',1);
+INSERT INTO "court_player" VALUES(24,6,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(25,7,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(26,7,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(27,7,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(28,7,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(29,8,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(30,8,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(31,8,NULL,'Player 2',1);
+INSERT INTO "court_player" VALUES(32,8,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(33,9,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(34,9,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(35,9,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(36,9,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(37,10,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(38,10,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(39,10,1,'Player 0',1);
+INSERT INTO "court_player" VALUES(40,10,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(41,11,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(42,11,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(43,11,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(44,11,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(45,12,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(46,12,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(47,12,NULL,'Player 2',1);
+INSERT INTO "court_player" VALUES(48,12,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(49,13,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(50,13,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(51,13,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(52,13,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(53,14,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(54,14,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(55,14,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(56,14,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(57,15,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(58,15,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(59,15,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(60,15,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(61,16,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(62,16,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(63,16,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(64,16,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(65,17,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(66,17,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(67,17,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(68,17,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(69,18,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(70,18,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(71,18,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(72,18,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(73,19,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(74,19,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(75,19,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(76,19,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(77,20,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(78,20,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(79,20,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(80,20,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(81,21,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(82,21,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(83,21,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(84,21,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(85,22,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(86,22,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(87,22,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(88,22,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(97,25,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(98,25,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(99,25,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(100,25,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(101,26,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(102,26,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(103,26,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(104,26,1,'Player 0',1);
+CREATE TABLE data_version (
+	name VARCHAR(20) NOT NULL, 
+	version INTEGER NOT NULL, 
+	PRIMARY KEY (name)
+);
+INSERT INTO "data_version" VALUES('players',13);
+INSERT INTO "data_version" VALUES('ratings',8);
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	seed BIGINT, 
+	seat_priority BLOB, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(3,2,'random','2026-10-18 09:18:23.762004',X'42020407080A0C0E1112151718',2,'2026-10-18 09:18:23.762009',20208426129758,X'4209050401');
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 09:18:23.776108',X'42030506080B0D0E1012141618',3,'2026-10-18 09:18:23.794342',122737072475278,X'420B0A0803');
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 09:18:23.803643',X'42020407080A0C0F1013141718',3,'2026-10-18 09:18:23.820578',125431067665535,X'4206050201');
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 09:18:23.830925',X'42020406090B0D0E1012151618',2,'2026-10-18 09:18:23.830932',127326434952685,X'420B090703');
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 09:18:23.861815',X'420205080A0C0E1112141619',2,'2026-10-18 09:18:23.878061',245305194674079,X'420A060504');
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 09:18:23.887511',X'420204080A0C0F1012151718',2,'2026-10-18 09:18:23.905690',168400559945655,X'420C0802');
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 09:18:23.914569',X'420204090B0D0E1012141618',1,'2026-10-18 09:18:23.914575',141027555723486,X'420B0A07');
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 09:18:23.927314',X'420204080A0C0E1012151719',2,'2026-10-18 09:18:23.944952',179154403685279,X'42060504');
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 09:18:23.954200',X'420304080A0D0E1112141618',2,'2026-10-18 09:18:23.985806',159434910086013,X'420C0B0A');
+INSERT INTO "match" VALUES(13,2,'random','2026-10-18 09:18:24.034493',X'420204080B0C0F1012141718',1,'2026-10-18 09:18:24.034501',132385803945436,X'42080601');
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',9.92707170800367407533e+02);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.18498080789755022124e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',9.82366824623721640857e+02);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.23582417332087516118e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.32948708795869151798e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',1.04678224941415169268e+03);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.1911430059590550172e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.40863437782679648078e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',1.01051226214772418648e+03);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.20268837146485498121e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',1.40671723851222191118e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	rest_debt INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,9,0,1,3,0);
+INSERT INTO "player_stats" VALUES(2,10,2,2,2,0);
+INSERT INTO "player_stats" VALUES(4,9,1,3,3,0);
+INSERT INTO "player_stats" VALUES(5,7,2,0,5,1);
+INSERT INTO "player_stats" VALUES(6,8,1,4,4,0);
+INSERT INTO "player_stats" VALUES(7,8,2,0,4,1);
+INSERT INTO "player_stats" VALUES(8,9,2,1,3,0);
+INSERT INTO "player_stats" VALUES(9,10,1,0,2,0);
+INSERT INTO "player_stats" VALUES(10,7,1,2,5,0);
+INSERT INTO "player_stats" VALUES(11,6,1,2,6,1);
+INSERT INTO "player_stats" VALUES(12,10,2,1,2,0);
+CREATE TABLE replaced_match (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "replaced_match" VALUES(12,13);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_replaced_match_match_id ON replaced_match (match_id);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_player_stats_rest_debt ON player_stats (rest_debt);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
@@ -0,0 +1,204 @@
+PRAGMA user_version = 12;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-2.64093527348840240165e+01);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,1.69016252820350914025e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,1.47042055500529613709e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-9.50168279530123882636e+00);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-2.38009299264379343692e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,1.21294112752236138419e+01);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+INSERT INTO "court" VALUES(25,13,1,NULL,NULL);
+INSERT INTO "court" VALUES(26,13,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	rest_debt INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(25,7,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(26,7,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(27,7,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(28,7,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(29,8,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(30,8,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(31,8,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(32,8,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(33,9,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(34,9,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(35,9,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(36,9,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(37,10,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(38,10,5,'Player 4',1);
+INSERT INTO "court_player" VALUES(39,10,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(40,10,NULL,'Player 2',1);
+INSERT INTO "court_player" VALUES(41,11,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(42,11,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(43,11,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(44,11,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(45,12,NULL,'Player 2',0);
+INSERT INTO "court_player" VALUES(46,12,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(47,12,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(48,12,1,'Player 0',1);
+INSERT INTO "court_player" VALUES(49,13,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(50,13,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(51,13,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(52,13,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(53,14,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(54,14,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(55,14,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(56,14,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(57,15,1,'Player 0',1);
+INSERT INTO "court_player" VALUES(58,15,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(59,15,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(60,15,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(61,16,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(62,16,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(63,16,12,'Player 11',1);
+INSERT INTO "court_player" VALUES(64,16,6,'Player 5',0);
+INSERT INTO "court_player" VALUES(65,17,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(66,17,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(67,17,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(68,17,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(69,18,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(70,18,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(71,18,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(72,18,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(73,19,10,'Player 9',0);
+INSERT INTO "court_player" VALUES(74,19,11,'Player 10',0);
+INSERT INTO "court_player" VALUES(75,19,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(76,19,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(77,20,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(78,20,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(79,20,9,'Player 8',1);
+INSERT INTO "court_player" VALUES(80,20,2,'Player 1',1);
+INSERT INTO "court_player" VALUES(81,21,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(82,21,8,'Player 7',1);
+INSERT INTO "court_player" VALUES(83,21,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(84,21,4,'Player 3',1);
+INSERT INTO "court_player" VALUES(85,22,7,'Player 6',1);
+INSERT INTO "court_player" VALUES(86,22,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(87,22,1,'Player 0',0);
+INSERT INTO "court_player" VALUES(88,22,5,'Player 4',0);
+INSERT INTO "court_player" VALUES(89,23,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(90,23,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(91,23,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(92,23,2,'Player 1',0);
+INSERT INTO "court_player" VALUES(93,24,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(94,24,12,'Player 11',0);
+INSERT INTO "court_player" VALUES(95,24,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(96,24,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(97,25,4,'Player 3',0);
+INSERT INTO "court_player" VALUES(98,25,8,'Player 7',0);
+INSERT INTO "court_player" VALUES(99,25,7,'Player 6',0);
+INSERT INTO "court_player" VALUES(100,25,11,'Player 10',1);
+INSERT INTO "court_player" VALUES(101,26,10,'Player 9',1);
+INSERT INTO "court_player" VALUES(102,26,9,'Player 8',0);
+INSERT INTO "court_player" VALUES(103,26,6,'Player 5',1);
+INSERT INTO "court_player" VALUES(104,26,5,'Player 4',0);
+CREATE TABLE data_version (
+	name VARCHAR(20) NOT NULL, 
+	version INTEGER NOT NULL, 
+	PRIMARY KEY (name)
+);
+INSERT INTO "data_version" VALUES('players',13);
+INSERT INTO "data_version" VALUES('ratings',8);
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	seed BIGINT, 
+	seat_priority BLOB, 
+	replaced_by INTEGER, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 09:34:12.313696',X'42020507080B0C0F1012141618',3,'2026-10-18 09:34:12.330322',259870204910901,X'420B0A0904',NULL);
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 09:34:12.338498',X'42030406080A0D0E1013141619',3,'2026-10-18 09:34:12.355702',98679711657001,X'4207050302',NULL);
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 09:34:12.364143',X'42020406090A0C0F1112151618',2,'2026-10-18 09:34:12.364149',205598936917816,X'420C090601',NULL);
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 09:34:12.392982',X'420304080A0C0E1013141619',2,'2026-10-18 09:34:12.409722',142937849073790,X'420A080704',NULL);
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 09:34:12.420090',X'420204090A0C0F1012141718',2,'2026-10-18 09:34:12.437094',122949540577034,X'420C0901',NULL);
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 09:34:12.446574',X'420205080A0D0E1013141618',1,'2026-10-18 09:34:12.446580',205149293617408,X'420B0704',NULL);
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 09:34:12.459312',X'420204090A0C0F1112141618',2,'2026-10-18 09:34:12.475695',238156916534626,X'42090602',NULL);
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 09:34:12.484920',X'420204080A0D0E1012151718',2,'2026-10-18 09:34:12.516630',106076851441655,X'42080704',NULL);
+INSERT INTO "match" VALUES(12,2,'random','2026-10-18 09:34:12.525972',X'420304090B0C0E1012141618',2,'2026-10-18 09:34:12.558710',104633089651353,X'420B0A06',13);
+INSERT INTO "match" VALUES(13,2,'random','2026-10-18 09:34:12.565690',X'420305080A0C0E1012141619',1,'2026-10-18 09:34:12.565697',75290702778841,X'420B0A06',NULL);
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',9.87870588724776439466e+02);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.18371954222822910195e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',1.04111355828493697117e+03);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.2047722140068115095e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.42088703841260871737e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',1.01482709369770486768e+03);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.19269573693668098717e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.34780850669804362954e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',1.04689143272857631931e+03);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.15888644171506302886e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',1.39783016414408712082e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	rest_debt INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,8,0,1,4,1);
+INSERT INTO "player_stats" VALUES(2,9,1,2,3,1);
+INSERT INTO "player_stats" VALUES(4,7,2,0,5,0);
+INSERT INTO "player_stats" VALUES(5,10,1,1,2,0);
+INSERT INTO "player_stats" VALUES(6,8,3,1,4,0);
+INSERT INTO "player_stats" VALUES(7,7,2,1,5,0);
+INSERT INTO "player_stats" VALUES(8,10,1,2,2,0);
+INSERT INTO "player_stats" VALUES(9,8,1,4,4,0);
+INSERT INTO "player_stats" VALUES(10,9,2,0,3,0);
+INSERT INTO "player_stats" VALUES(11,8,0,2,4,0);
+INSERT INTO "player_stats" VALUES(12,8,2,1,4,1);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_player_stats_rest_debt ON player_stats (rest_debt);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
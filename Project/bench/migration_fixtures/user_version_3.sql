@@ -0,0 +1,347 @@
+PRAGMA user_version = 3;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(1,1,1,NULL,NULL);
+INSERT INTO "court" VALUES(2,1,2,1,16.0);
+INSERT INTO "court" VALUES(3,2,1,NULL,NULL);
+INSERT INTO "court" VALUES(4,2,2,2,-16.0);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-5.22140908790736890665e+00);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,1.53837052216365393069e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,1.57660211652013906302e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-2.40543313922130224118e+01);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-1.64085893737541326235e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,1.5586631188059833164e+01);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(1,1,10,'Player 9');
+INSERT INTO "court_player" VALUES(2,1,4,'Player 3');
+INSERT INTO "court_player" VALUES(3,1,6,'Player 5');
+INSERT INTO "court_player" VALUES(4,1,1,'Player 0');
+INSERT INTO "court_player" VALUES(5,2,9,'Player 8');
+INSERT INTO "court_player" VALUES(6,2,7,'Player 6');
+INSERT INTO "court_player" VALUES(7,2,5,'Player 4');
+INSERT INTO "court_player" VALUES(8,2,2,'Player 1');
+INSERT INTO "court_player" VALUES(9,3,4,'Player 3');
+INSERT INTO "court_player" VALUES(10,3,7,'Player 6');
+INSERT INTO "court_player" VALUES(11,3,10,'Player 9');
+INSERT INTO "court_player" VALUES(12,3,6,'Player 5');
+INSERT INTO "court_player" VALUES(13,4,9,'Player 8');
+INSERT INTO "court_player" VALUES(14,4,5,'Player 4');
+INSERT INTO "court_player" VALUES(15,4,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(16,4,8,'Player 7');
+INSERT INTO "court_player" VALUES(17,5,5,'Player 4');
+INSERT INTO "court_player" VALUES(18,5,4,'Player 3');
+INSERT INTO "court_player" VALUES(19,5,6,'Player 5');
+INSERT INTO "court_player" VALUES(20,5,2,'Player 1');
+INSERT INTO "court_player" VALUES(21,6,9,'Player 8');
+INSERT INTO "court_player" VALUES(22,6,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(23,6,11,'Player 10');
+INSERT INTO "court_player" VALUES(24,6,10,'Player 9');
+INSERT INTO "court_player" VALUES(25,7,7,'Player 6');
+INSERT INTO "court_player" VALUES(26,7,8,'Player 7');
+INSERT INTO "court_player" VALUES(27,7,9,'Player 8');
+INSERT INTO "court_player" VALUES(28,7,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(29,8,1,'Player 0');
+INSERT INTO "court_player" VALUES(30,8,10,'Player 9');
+INSERT INTO "court_player" VALUES(31,8,12,'Player 11');
+INSERT INTO "court_player" VALUES(32,8,5,'Player 4');
+INSERT INTO "court_player" VALUES(33,9,7,'Player 6');
+INSERT INTO "court_player" VALUES(34,9,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(35,9,12,'Player 11');
+INSERT INTO "court_player" VALUES(36,9,4,'Player 3');
+INSERT INTO "court_player" VALUES(37,10,1,'Player 0');
+INSERT INTO "court_player" VALUES(38,10,11,'Player 10');
+INSERT INTO "court_player" VALUES(39,10,10,'Player 9');
+INSERT INTO "court_player" VALUES(40,10,5,'Player 4');
+INSERT INTO "court_player" VALUES(41,11,2,'Player 1');
+INSERT INTO "court_player" VALUES(42,11,10,'Player 9');
+INSERT INTO "court_player" VALUES(43,11,7,'Player 6');
+INSERT INTO "court_player" VALUES(44,11,8,'Player 7');
+INSERT INTO "court_player" VALUES(45,12,11,'Player 10');
+INSERT INTO "court_player" VALUES(46,12,5,'Player 4');
+INSERT INTO "court_player" VALUES(47,12,9,'Player 8');
+INSERT INTO "court_player" VALUES(48,12,1,'Player 0');
+INSERT INTO "court_player" VALUES(49,13,10,'Player 9');
+INSERT INTO "court_player" VALUES(50,13,12,'Player 11');
+INSERT INTO "court_player" VALUES(51,13,9,'Player 8');
+INSERT INTO "court_player" VALUES(52,13,1,'Player 0');
+INSERT INTO "court_player" VALUES(53,14,2,'Player 1');
+INSERT INTO "court_player" VALUES(54,14,4,'Player 3');
+INSERT INTO "court_player" VALUES(55,14,7,'Player 6');
+INSERT INTO "court_player" VALUES(56,14,5,'Player 4');
+INSERT INTO "court_player" VALUES(57,15,9,'Player 8');
+INSERT INTO "court_player" VALUES(58,15,2,'Player 1');
+INSERT INTO "court_player" VALUES(59,15,5,'Player 4');
+INSERT INTO "court_player" VALUES(60,15,12,'Player 11');
+INSERT INTO "court_player" VALUES(61,16,6,'Player 5');
+INSERT INTO "court_player" VALUES(62,16,8,'Player 7');
+INSERT INTO "court_player" VALUES(63,16,4,'Player 3');
+INSERT INTO "court_player" VALUES(64,16,11,'Player 10');
+INSERT INTO "court_player" VALUES(65,17,4,'Player 3');
+INSERT INTO "court_player" VALUES(66,17,7,'Player 6');
+INSERT INTO "court_player" VALUES(67,17,5,'Player 4');
+INSERT INTO "court_player" VALUES(68,17,9,'Player 8');
+INSERT INTO "court_player" VALUES(69,18,10,'Player 9');
+INSERT INTO "court_player" VALUES(70,18,11,'Player 10');
+INSERT INTO "court_player" VALUES(71,18,8,'Player 7');
+INSERT INTO "court_player" VALUES(72,18,6,'Player 5');
+INSERT INTO "court_player" VALUES(73,19,4,'Player 3');
+INSERT INTO "court_player" VALUES(74,19,5,'Player 4');
+INSERT INTO "court_player" VALUES(75,19,10,'Player 9');
+INSERT INTO "court_player" VALUES(76,19,9,'Player 8');
+INSERT INTO "court_player" VALUES(77,20,2,'Player 1');
+INSERT INTO "court_player" VALUES(78,20,1,'Player 0');
+INSERT INTO "court_player" VALUES(79,20,8,'Player 7');
+INSERT INTO "court_player" VALUES(80,20,7,'Player 6');
+INSERT INTO "court_player" VALUES(81,21,6,'Player 5');
+INSERT INTO "court_player" VALUES(82,21,2,'Player 1');
+INSERT INTO "court_player" VALUES(83,21,5,'Player 4');
+INSERT INTO "court_player" VALUES(84,21,1,'Player 0');
+INSERT INTO "court_player" VALUES(85,22,9,'Player 8');
+INSERT INTO "court_player" VALUES(86,22,4,'Player 3');
+INSERT INTO "court_player" VALUES(87,22,7,'Player 6');
+INSERT INTO "court_player" VALUES(88,22,12,'Player 11');
+INSERT INTO "court_player" VALUES(89,23,2,'Player 1');
+INSERT INTO "court_player" VALUES(90,23,6,'Player 5');
+INSERT INTO "court_player" VALUES(91,23,7,'Player 6');
+INSERT INTO "court_player" VALUES(92,23,12,'Player 11');
+INSERT INTO "court_player" VALUES(93,24,10,'Player 9');
+INSERT INTO "court_player" VALUES(94,24,8,'Player 7');
+INSERT INTO "court_player" VALUES(95,24,9,'Player 8');
+INSERT INTO "court_player" VALUES(96,24,11,'Player 10');
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	player_ids_snapshot VARCHAR, 
+	created_at DATETIME, 
+	resting_players_snapshot TEXT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(1,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.249727','Player 2,Player 7,Player 10,Player 11');
+INSERT INTO "match" VALUES(2,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.295610','Player 0,Player 1,Player 10,Player 11');
+INSERT INTO "match" VALUES(3,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.320887','Player 0,Player 6,Player 7,Player 11');
+INSERT INTO "match" VALUES(4,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.333010','Player 1,Player 3,Player 5,Player 10');
+INSERT INTO "match" VALUES(5,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.355459','Player 1,Player 5,Player 7,Player 8');
+INSERT INTO "match" VALUES(6,2,'random','1,2,3,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.377456','Player 2,Player 3,Player 5,Player 11');
+INSERT INTO "match" VALUES(7,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.406170','Player 5,Player 7,Player 10');
+INSERT INTO "match" VALUES(8,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.428223','Player 0,Player 6,Player 9');
+INSERT INTO "match" VALUES(9,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.450996','Player 0,Player 1,Player 11');
+INSERT INTO "match" VALUES(10,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.462928','Player 5,Player 10,Player 11');
+INSERT INTO "match" VALUES(11,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.482711','Player 7,Player 9,Player 10');
+INSERT INTO "match" VALUES(12,2,'random','1,2,4,5,6,7,8,9,10,11,12','2026-10-18 08:59:15.504103','Player 0,Player 3,Player 4');
+CREATE TABLE match_roster (
+	match_id INTEGER NOT NULL, 
+	player_id INTEGER NOT NULL, 
+	PRIMARY KEY (match_id, player_id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "match_roster" VALUES(1,1);
+INSERT INTO "match_roster" VALUES(1,2);
+INSERT INTO "match_roster" VALUES(1,4);
+INSERT INTO "match_roster" VALUES(1,5);
+INSERT INTO "match_roster" VALUES(1,6);
+INSERT INTO "match_roster" VALUES(1,7);
+INSERT INTO "match_roster" VALUES(1,8);
+INSERT INTO "match_roster" VALUES(1,9);
+INSERT INTO "match_roster" VALUES(1,10);
+INSERT INTO "match_roster" VALUES(1,11);
+INSERT INTO "match_roster" VALUES(1,12);
+INSERT INTO "match_roster" VALUES(2,1);
+INSERT INTO "match_roster" VALUES(2,2);
+INSERT INTO "match_roster" VALUES(2,4);
+INSERT INTO "match_roster" VALUES(2,5);
+INSERT INTO "match_roster" VALUES(2,6);
+INSERT INTO "match_roster" VALUES(2,7);
+INSERT INTO "match_roster" VALUES(2,8);
+INSERT INTO "match_roster" VALUES(2,9);
+INSERT INTO "match_roster" VALUES(2,10);
+INSERT INTO "match_roster" VALUES(2,11);
+INSERT INTO "match_roster" VALUES(2,12);
+INSERT INTO "match_roster" VALUES(3,1);
+INSERT INTO "match_roster" VALUES(3,2);
+INSERT INTO "match_roster" VALUES(3,4);
+INSERT INTO "match_roster" VALUES(3,5);
+INSERT INTO "match_roster" VALUES(3,6);
+INSERT INTO "match_roster" VALUES(3,7);
+INSERT INTO "match_roster" VALUES(3,8);
+INSERT INTO "match_roster" VALUES(3,9);
+INSERT INTO "match_roster" VALUES(3,10);
+INSERT INTO "match_roster" VALUES(3,11);
+INSERT INTO "match_roster" VALUES(3,12);
+INSERT INTO "match_roster" VALUES(4,1);
+INSERT INTO "match_roster" VALUES(4,2);
+INSERT INTO "match_roster" VALUES(4,4);
+INSERT INTO "match_roster" VALUES(4,5);
+INSERT INTO "match_roster" VALUES(4,6);
+INSERT INTO "match_roster" VALUES(4,7);
+INSERT INTO "match_roster" VALUES(4,8);
+INSERT INTO "match_roster" VALUES(4,9);
+INSERT INTO "match_roster" VALUES(4,10);
+INSERT INTO "match_roster" VALUES(4,11);
+INSERT INTO "match_roster" VALUES(4,12);
+INSERT INTO "match_roster" VALUES(5,1);
+INSERT INTO "match_roster" VALUES(5,2);
+INSERT INTO "match_roster" VALUES(5,4);
+INSERT INTO "match_roster" VALUES(5,5);
+INSERT INTO "match_roster" VALUES(5,6);
+INSERT INTO "match_roster" VALUES(5,7);
+INSERT INTO "match_roster" VALUES(5,8);
+INSERT INTO "match_roster" VALUES(5,9);
+INSERT INTO "match_roster" VALUES(5,10);
+INSERT INTO "match_roster" VALUES(5,11);
+INSERT INTO "match_roster" VALUES(5,12);
+INSERT INTO "match_roster" VALUES(6,1);
+INSERT INTO "match_roster" VALUES(6,2);
+INSERT INTO "match_roster" VALUES(6,4);
+INSERT INTO "match_roster" VALUES(6,5);
+INSERT INTO "match_roster" VALUES(6,6);
+INSERT INTO "match_roster" VALUES(6,7);
+INSERT INTO "match_roster" VALUES(6,8);
+INSERT INTO "match_roster" VALUES(6,9);
+INSERT INTO "match_roster" VALUES(6,10);
+INSERT INTO "match_roster" VALUES(6,11);
+INSERT INTO "match_roster" VALUES(6,12);
+INSERT INTO "match_roster" VALUES(7,1);
+INSERT INTO "match_roster" VALUES(7,2);
+INSERT INTO "match_roster" VALUES(7,4);
+INSERT INTO "match_roster" VALUES(7,5);
+INSERT INTO "match_roster" VALUES(7,6);
+INSERT INTO "match_roster" VALUES(7,7);
+INSERT INTO "match_roster" VALUES(7,8);
+INSERT INTO "match_roster" VALUES(7,9);
+INSERT INTO "match_roster" VALUES(7,10);
+INSERT INTO "match_roster" VALUES(7,11);
+INSERT INTO "match_roster" VALUES(7,12);
+INSERT INTO "match_roster" VALUES(8,1);
+INSERT INTO "match_roster" VALUES(8,2);
+INSERT INTO "match_roster" VALUES(8,4);
+INSERT INTO "match_roster" VALUES(8,5);
+INSERT INTO "match_roster" VALUES(8,6);
+INSERT INTO "match_roster" VALUES(8,7);
+INSERT INTO "match_roster" VALUES(8,8);
+INSERT INTO "match_roster" VALUES(8,9);
+INSERT INTO "match_roster" VALUES(8,10);
+INSERT INTO "match_roster" VALUES(8,11);
+INSERT INTO "match_roster" VALUES(8,12);
+INSERT INTO "match_roster" VALUES(9,1);
+INSERT INTO "match_roster" VALUES(9,2);
+INSERT INTO "match_roster" VALUES(9,4);
+INSERT INTO "match_roster" VALUES(9,5);
+INSERT INTO "match_roster" VALUES(9,6);
+INSERT INTO "match_roster" VALUES(9,7);
+INSERT INTO "match_roster" VALUES(9,8);
+INSERT INTO "match_roster" VALUES(9,9);
+INSERT INTO "match_roster" VALUES(9,10);
+INSERT INTO "match_roster" VALUES(9,11);
+INSERT INTO "match_roster" VALUES(9,12);
+INSERT INTO "match_roster" VALUES(10,1);
+INSERT INTO "match_roster" VALUES(10,2);
+INSERT INTO "match_roster" VALUES(10,4);
+INSERT INTO "match_roster" VALUES(10,5);
+INSERT INTO "match_roster" VALUES(10,6);
+INSERT INTO "match_roster" VALUES(10,7);
+INSERT INTO "match_roster" VALUES(10,8);
+INSERT INTO "match_roster" VALUES(10,9);
+INSERT INTO "match_roster" VALUES(10,10);
+INSERT INTO "match_roster" VALUES(10,11);
+INSERT INTO "match_roster" VALUES(10,12);
+INSERT INTO "match_roster" VALUES(11,1);
+INSERT INTO "match_roster" VALUES(11,2);
+INSERT INTO "match_roster" VALUES(11,4);
+INSERT INTO "match_roster" VALUES(11,5);
+INSERT INTO "match_roster" VALUES(11,6);
+INSERT INTO "match_roster" VALUES(11,7);
+INSERT INTO "match_roster" VALUES(11,8);
+INSERT INTO "match_roster" VALUES(11,9);
+INSERT INTO "match_roster" VALUES(11,10);
+INSERT INTO "match_roster" VALUES(11,11);
+INSERT INTO "match_roster" VALUES(11,12);
+INSERT INTO "match_roster" VALUES(12,1);
+INSERT INTO "match_roster" VALUES(12,2);
+INSERT INTO "match_roster" VALUES(12,4);
+INSERT INTO "match_roster" VALUES(12,5);
+INSERT INTO "match_roster" VALUES(12,6);
+INSERT INTO "match_roster" VALUES(12,7);
+INSERT INTO "match_roster" VALUES(12,8);
+INSERT INTO "match_roster" VALUES(12,9);
+INSERT INTO "match_roster" VALUES(12,10);
+INSERT INTO "match_roster" VALUES(12,11);
+INSERT INTO "match_roster" VALUES(12,12);
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner','male',9.93753706759975102575e+02);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate','female',1.18335743179144719757e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner','female',1.05540698374547423554e+03);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate','male',1.14207168270106944872e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced','female',1.37594566860778695627e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner','male',1.00105593702049281996e+03);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate','female',1.2083542579815411955e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced','male',1.41558663118805975501e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner','female',9.79394885690456135345e+02);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate','male',1.23943803661384959011e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced','female',1.38963477789984767691e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,7,1,2,5);
+INSERT INTO "player_stats" VALUES(2,8,1,2,4);
+INSERT INTO "player_stats" VALUES(4,9,3,0,3);
+INSERT INTO "player_stats" VALUES(5,11,1,4,1);
+INSERT INTO "player_stats" VALUES(6,7,0,1,5);
+INSERT INTO "player_stats" VALUES(7,10,2,2,2);
+INSERT INTO "player_stats" VALUES(8,7,2,1,5);
+INSERT INTO "player_stats" VALUES(9,11,2,1,1);
+INSERT INTO "player_stats" VALUES(10,10,0,2,2);
+INSERT INTO "player_stats" VALUES(11,6,2,0,6);
+INSERT INTO "player_stats" VALUES(12,6,1,1,6);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
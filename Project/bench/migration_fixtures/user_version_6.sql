@@ -0,0 +1,213 @@
+PRAGMA user_version = 6;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(1,1,1,NULL,NULL);
+INSERT INTO "court" VALUES(2,1,2,1,16.0);
+INSERT INTO "court" VALUES(3,2,1,NULL,NULL);
+INSERT INTO "court" VALUES(4,2,2,2,-1.52636932064780062034e+01);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-2.08039272813537401418e+01);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,2.36893120689147771438e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,1.0980341339955522528e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-1.69546156015126641141e+01);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-2.00780852095909878585e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,1.15179200063076763176e+01);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(1,1,4,'Player 3');
+INSERT INTO "court_player" VALUES(2,1,11,'Player 10');
+INSERT INTO "court_player" VALUES(3,1,7,'Player 6');
+INSERT INTO "court_player" VALUES(4,1,12,'Player 11');
+INSERT INTO "court_player" VALUES(5,2,1,'Player 0');
+INSERT INTO "court_player" VALUES(6,2,2,'Player 1');
+INSERT INTO "court_player" VALUES(7,2,5,'Player 4');
+INSERT INTO "court_player" VALUES(8,2,10,'Player 9');
+INSERT INTO "court_player" VALUES(9,3,12,'Player 11');
+INSERT INTO "court_player" VALUES(10,3,4,'Player 3');
+INSERT INTO "court_player" VALUES(11,3,6,'Player 5');
+INSERT INTO "court_player" VALUES(12,3,5,'Player 4');
+INSERT INTO "court_player" VALUES(13,4,10,'Player 9');
+INSERT INTO "court_player" VALUES(14,4,8,'Player 7');
+INSERT INTO "court_player" VALUES(15,4,7,'Player 6');
+INSERT INTO "court_player" VALUES(16,4,2,'Player 1');
+INSERT INTO "court_player" VALUES(17,5,6,'Player 5');
+INSERT INTO "court_player" VALUES(18,5,4,'Player 3');
+INSERT INTO "court_player" VALUES(19,5,2,'Player 1');
+INSERT INTO "court_player" VALUES(20,5,1,'Player 0');
+INSERT INTO "court_player" VALUES(21,6,12,'Player 11');
+INSERT INTO "court_player" VALUES(22,6,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(23,6,8,'Player 7');
+INSERT INTO "court_player" VALUES(24,6,9,'Player 8');
+INSERT INTO "court_player" VALUES(25,7,7,'Player 6');
+INSERT INTO "court_player" VALUES(26,7,8,'Player 7');
+INSERT INTO "court_player" VALUES(27,7,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(28,7,9,'Player 8');
+INSERT INTO "court_player" VALUES(29,8,2,'Player 1');
+INSERT INTO "court_player" VALUES(30,8,12,'Player 11');
+INSERT INTO "court_player" VALUES(31,8,1,'Player 0');
+INSERT INTO "court_player" VALUES(32,8,6,'Player 5');
+INSERT INTO "court_player" VALUES(33,9,6,'Player 5');
+INSERT INTO "court_player" VALUES(34,9,2,'Player 1');
+INSERT INTO "court_player" VALUES(35,9,12,'Player 11');
+INSERT INTO "court_player" VALUES(36,9,11,'Player 10');
+INSERT INTO "court_player" VALUES(37,10,5,'Player 4');
+INSERT INTO "court_player" VALUES(38,10,1,'Player 0');
+INSERT INTO "court_player" VALUES(39,10,8,'Player 7');
+INSERT INTO "court_player" VALUES(40,10,9,'Player 8');
+INSERT INTO "court_player" VALUES(41,11,11,'Player 10');
+INSERT INTO "court_player" VALUES(42,11,12,'Player 11');
+INSERT INTO "court_player" VALUES(43,11,5,'Player 4');
+INSERT INTO "court_player" VALUES(44,11,1,'Player 0');
+INSERT INTO "court_player" VALUES(45,12,2,'Player 1');
+INSERT INTO "court_player" VALUES(46,12,4,'Player 3');
+INSERT INTO "court_player" VALUES(47,12,10,'Player 9');
+INSERT INTO "court_player" VALUES(48,12,6,'Player 5');
+INSERT INTO "court_player" VALUES(49,13,8,'Player 7');
+INSERT INTO "court_player" VALUES(50,13,12,'Player 11');
+INSERT INTO "court_player" VALUES(51,13,5,'Player 4');
+INSERT INTO "court_player" VALUES(52,13,1,'Player 0');
+INSERT INTO "court_player" VALUES(53,14,6,'Player 5');
+INSERT INTO "court_player" VALUES(54,14,7,'Player 6');
+INSERT INTO "court_player" VALUES(55,14,4,'Player 3');
+INSERT INTO "court_player" VALUES(56,14,2,'Player 1');
+INSERT INTO "court_player" VALUES(57,15,12,'Player 11');
+INSERT INTO "court_player" VALUES(58,15,4,'Player 3');
+INSERT INTO "court_player" VALUES(59,15,5,'Player 4');
+INSERT INTO "court_player" VALUES(60,15,6,'Player 5');
+INSERT INTO "court_player" VALUES(61,16,7,'Player 6');
+INSERT INTO "court_player" VALUES(62,16,9,'Player 8');
+INSERT INTO "court_player" VALUES(63,16,11,'Player 10');
+INSERT INTO "court_player" VALUES(64,16,8,'Player 7');
+INSERT INTO "court_player" VALUES(65,17,12,'Player 11');
+INSERT INTO "court_player" VALUES(66,17,1,'Player 0');
+INSERT INTO "court_player" VALUES(67,17,2,'Player 1');
+INSERT INTO "court_player" VALUES(68,17,9,'Player 8');
+INSERT INTO "court_player" VALUES(69,18,6,'Player 5');
+INSERT INTO "court_player" VALUES(70,18,10,'Player 9');
+INSERT INTO "court_player" VALUES(71,18,7,'Player 6');
+INSERT INTO "court_player" VALUES(72,18,4,'Player 3');
+INSERT INTO "court_player" VALUES(73,19,10,'Player 9');
+INSERT INTO "court_player" VALUES(74,19,9,'Player 8');
+INSERT INTO "court_player" VALUES(75,19,11,'Player 10');
+INSERT INTO "court_player" VALUES(76,19,8,'Player 7');
+INSERT INTO "court_player" VALUES(77,20,6,'Player 5');
+INSERT INTO "court_player" VALUES(78,20,7,'Player 6');
+INSERT INTO "court_player" VALUES(79,20,2,'Player 1');
+INSERT INTO "court_player" VALUES(80,20,1,'Player 0');
+INSERT INTO "court_player" VALUES(81,21,9,'Player 8');
+INSERT INTO "court_player" VALUES(82,21,12,'Player 11');
+INSERT INTO "court_player" VALUES(83,21,1,'Player 0');
+INSERT INTO "court_player" VALUES(84,21,4,'Player 3');
+INSERT INTO "court_player" VALUES(85,22,8,'Player 7');
+INSERT INTO "court_player" VALUES(86,22,5,'Player 4');
+INSERT INTO "court_player" VALUES(87,22,11,'Player 10');
+INSERT INTO "court_player" VALUES(88,22,10,'Player 9');
+INSERT INTO "court_player" VALUES(89,23,12,'Player 11');
+INSERT INTO "court_player" VALUES(90,23,8,'Player 7');
+INSERT INTO "court_player" VALUES(91,23,5,'Player 4');
+INSERT INTO "court_player" VALUES(92,23,11,'Player 10');
+INSERT INTO "court_player" VALUES(93,24,4,'Player 3');
+INSERT INTO "court_player" VALUES(94,24,2,'Player 1');
+INSERT INTO "court_player" VALUES(95,24,7,'Player 6');
+INSERT INTO "court_player" VALUES(96,24,1,'Player 0');
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(1,2,'random','2026-10-18 08:59:20.319895',X'42020407080A0D0E1113141618',3,'2026-10-18 08:59:20.355631');
+INSERT INTO "match" VALUES(2,2,'random','2026-10-18 08:59:20.365039',X'42030407080A0C0E1013141718',3,'2026-10-18 08:59:20.381026');
+INSERT INTO "match" VALUES(3,2,'random','2026-10-18 08:59:20.387870',X'42020406080B0C0F1012151718',2,'2026-10-18 08:59:20.387876');
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 08:59:20.397970',X'42020406090B0C0E1012151718',3,'2026-10-18 08:59:20.413093');
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 08:59:20.420528',X'42020407090A0C0F1012151618',3,'2026-10-18 08:59:20.436458');
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 08:59:20.443647',X'42020407080A0C0F1113141618',2,'2026-10-18 08:59:20.443653');
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 08:59:20.469261',X'420204080A0C0E1013151718',2,'2026-10-18 08:59:20.483997');
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 08:59:20.490850',X'420305080A0C0E1012151618',2,'2026-10-18 08:59:20.507755');
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 08:59:20.514947',X'420204080B0C0E1112141718',1,'2026-10-18 08:59:20.514952');
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 08:59:20.524647',X'420204090B0C0E1012141619',2,'2026-10-18 08:59:20.539782');
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 08:59:20.547532',X'420205080A0D0F1012141618',2,'2026-10-18 08:59:20.561124');
+INSERT INTO "match" VALUES(12,2,'random','2026-10-18 08:59:20.567386',X'420204080A0D0E1013151618',1,'2026-10-18 08:59:20.567390');
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',1.08057132455985947674e+03);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.21955750979475965325e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',9.8901965866004445619e+02);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.21920723207522246412e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.411706183411718257e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',989.21133373533);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.18951953033242739362e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.35935607232957249832e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',9.57218386787214285497e+02);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.20543669559520503749e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',1.37919607271864629179e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,10,4,0,2);
+INSERT INTO "player_stats" VALUES(2,10,3,2,2);
+INSERT INTO "player_stats" VALUES(4,9,0,1,3);
+INSERT INTO "player_stats" VALUES(5,8,2,1,4);
+INSERT INTO "player_stats" VALUES(6,9,2,1,3);
+INSERT INTO "player_stats" VALUES(7,8,2,2,4);
+INSERT INTO "player_stats" VALUES(8,9,2,2,3);
+INSERT INTO "player_stats" VALUES(9,7,0,2,5);
+INSERT INTO "player_stats" VALUES(10,6,0,3,6);
+INSERT INTO "player_stats" VALUES(11,7,1,1,5);
+INSERT INTO "player_stats" VALUES(12,11,0,1,1);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
@@ -0,0 +1,214 @@
+PRAGMA user_version = 7;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(1,1,1,NULL,NULL);
+INSERT INTO "court" VALUES(2,1,2,1,2.71686541692376550818e+01);
+INSERT INTO "court" VALUES(3,2,1,NULL,NULL);
+INSERT INTO "court" VALUES(4,2,2,2,-1.66252627962960097818e+01);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-1.64853921261844220684e+01);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,1.1997979389307996456e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,2.48547033326014634715e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-1.9251612584946933282e+01);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-1.6808243917813136647e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,9.74163481023427);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(1,1,10,'Player 9');
+INSERT INTO "court_player" VALUES(2,1,9,'Player 8');
+INSERT INTO "court_player" VALUES(3,1,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(4,1,11,'Player 10');
+INSERT INTO "court_player" VALUES(5,2,7,'Player 6');
+INSERT INTO "court_player" VALUES(6,2,1,'Player 0');
+INSERT INTO "court_player" VALUES(7,2,5,'Player 4');
+INSERT INTO "court_player" VALUES(8,2,6,'Player 5');
+INSERT INTO "court_player" VALUES(9,3,11,'Player 10');
+INSERT INTO "court_player" VALUES(10,3,12,'Player 11');
+INSERT INTO "court_player" VALUES(11,3,5,'Player 4');
+INSERT INTO "court_player" VALUES(12,3,7,'Player 6');
+INSERT INTO "court_player" VALUES(13,4,8,'Player 7');
+INSERT INTO "court_player" VALUES(14,4,9,'Player 8');
+INSERT INTO "court_player" VALUES(15,4,6,'Player 5');
+INSERT INTO "court_player" VALUES(16,4,2,'Player 1');
+INSERT INTO "court_player" VALUES(17,5,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(18,5,4,'Player 3');
+INSERT INTO "court_player" VALUES(19,5,5,'Player 4');
+INSERT INTO "court_player" VALUES(20,5,10,'Player 9');
+INSERT INTO "court_player" VALUES(21,6,12,'Player 11');
+INSERT INTO "court_player" VALUES(22,6,8,'Player 7');
+INSERT INTO "court_player" VALUES(23,6,1,'Player 0');
+INSERT INTO "court_player" VALUES(24,6,6,'Player 5');
+INSERT INTO "court_player" VALUES(25,7,2,'Player 1');
+INSERT INTO "court_player" VALUES(26,7,10,'Player 9');
+INSERT INTO "court_player" VALUES(27,7,1,'Player 0');
+INSERT INTO "court_player" VALUES(28,7,4,'Player 3');
+INSERT INTO "court_player" VALUES(29,8,9,'Player 8');
+INSERT INTO "court_player" VALUES(30,8,11,'Player 10');
+INSERT INTO "court_player" VALUES(31,8,6,'Player 5');
+INSERT INTO "court_player" VALUES(32,8,5,'Player 4');
+INSERT INTO "court_player" VALUES(33,9,1,'Player 0');
+INSERT INTO "court_player" VALUES(34,9,9,'Player 8');
+INSERT INTO "court_player" VALUES(35,9,7,'Player 6');
+INSERT INTO "court_player" VALUES(36,9,5,'Player 4');
+INSERT INTO "court_player" VALUES(37,10,11,'Player 10');
+INSERT INTO "court_player" VALUES(38,10,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(39,10,4,'Player 3');
+INSERT INTO "court_player" VALUES(40,10,6,'Player 5');
+INSERT INTO "court_player" VALUES(41,11,9,'Player 8');
+INSERT INTO "court_player" VALUES(42,11,5,'Player 4');
+INSERT INTO "court_player" VALUES(43,11,2,'Player 1');
+INSERT INTO "court_player" VALUES(44,11,12,'Player 11');
+INSERT INTO "court_player" VALUES(45,12,1,'Player 0');
+INSERT INTO "court_player" VALUES(46,12,10,'Player 9');
+INSERT INTO "court_player" VALUES(47,12,6,'Player 5');
+INSERT INTO "court_player" VALUES(48,12,4,'Player 3');
+INSERT INTO "court_player" VALUES(49,13,2,'Player 1');
+INSERT INTO "court_player" VALUES(50,13,1,'Player 0');
+INSERT INTO "court_player" VALUES(51,13,8,'Player 7');
+INSERT INTO "court_player" VALUES(52,13,9,'Player 8');
+INSERT INTO "court_player" VALUES(53,14,10,'Player 9');
+INSERT INTO "court_player" VALUES(54,14,4,'Player 3');
+INSERT INTO "court_player" VALUES(55,14,6,'Player 5');
+INSERT INTO "court_player" VALUES(56,14,7,'Player 6');
+INSERT INTO "court_player" VALUES(57,15,12,'Player 11');
+INSERT INTO "court_player" VALUES(58,15,7,'Player 6');
+INSERT INTO "court_player" VALUES(59,15,10,'Player 9');
+INSERT INTO "court_player" VALUES(60,15,9,'Player 8');
+INSERT INTO "court_player" VALUES(61,16,5,'Player 4');
+INSERT INTO "court_player" VALUES(62,16,8,'Player 7');
+INSERT INTO "court_player" VALUES(63,16,4,'Player 3');
+INSERT INTO "court_player" VALUES(64,16,2,'Player 1');
+INSERT INTO "court_player" VALUES(65,17,10,'Player 9');
+INSERT INTO "court_player" VALUES(66,17,8,'Player 7');
+INSERT INTO "court_player" VALUES(67,17,1,'Player 0');
+INSERT INTO "court_player" VALUES(68,17,9,'Player 8');
+INSERT INTO "court_player" VALUES(69,18,7,'Player 6');
+INSERT INTO "court_player" VALUES(70,18,6,'Player 5');
+INSERT INTO "court_player" VALUES(71,18,11,'Player 10');
+INSERT INTO "court_player" VALUES(72,18,12,'Player 11');
+INSERT INTO "court_player" VALUES(73,19,5,'Player 4');
+INSERT INTO "court_player" VALUES(74,19,9,'Player 8');
+INSERT INTO "court_player" VALUES(75,19,7,'Player 6');
+INSERT INTO "court_player" VALUES(76,19,10,'Player 9');
+INSERT INTO "court_player" VALUES(77,20,11,'Player 10');
+INSERT INTO "court_player" VALUES(78,20,2,'Player 1');
+INSERT INTO "court_player" VALUES(79,20,1,'Player 0');
+INSERT INTO "court_player" VALUES(80,20,6,'Player 5');
+INSERT INTO "court_player" VALUES(81,21,11,'Player 10');
+INSERT INTO "court_player" VALUES(82,21,4,'Player 3');
+INSERT INTO "court_player" VALUES(83,21,5,'Player 4');
+INSERT INTO "court_player" VALUES(84,21,6,'Player 5');
+INSERT INTO "court_player" VALUES(85,22,8,'Player 7');
+INSERT INTO "court_player" VALUES(86,22,9,'Player 8');
+INSERT INTO "court_player" VALUES(87,22,2,'Player 1');
+INSERT INTO "court_player" VALUES(88,22,10,'Player 9');
+INSERT INTO "court_player" VALUES(89,23,12,'Player 11');
+INSERT INTO "court_player" VALUES(90,23,1,'Player 0');
+INSERT INTO "court_player" VALUES(91,23,10,'Player 9');
+INSERT INTO "court_player" VALUES(92,23,4,'Player 3');
+INSERT INTO "court_player" VALUES(93,24,11,'Player 10');
+INSERT INTO "court_player" VALUES(94,24,8,'Player 7');
+INSERT INTO "court_player" VALUES(95,24,6,'Player 5');
+INSERT INTO "court_player" VALUES(96,24,2,'Player 1');
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	seed BIGINT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(1,2,'random','2026-10-18 08:59:21.956160',X'42020506090A0C0E1112141619',3,'2026-10-18 08:59:21.989643',275500567179821);
+INSERT INTO "match" VALUES(2,2,'random','2026-10-18 08:59:21.999622',X'42030407090A0C0E1012151618',3,'2026-10-18 08:59:22.017570',187499274563224);
+INSERT INTO "match" VALUES(3,2,'random','2026-10-18 08:59:22.025035',X'42020506080A0C0F1013141718',2,'2026-10-18 08:59:22.025041',15517414073384);
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 08:59:22.036516',X'42020407080A0C0F1112141619',3,'2026-10-18 08:59:22.052374',144092487197613);
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 08:59:22.060102',X'42020506080A0C0E1112151619',3,'2026-10-18 08:59:22.075806',265767490780578);
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 08:59:22.083421',X'42020407080A0C0F1112141718',2,'2026-10-18 08:59:22.083427',23865590699701);
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 08:59:22.113403',X'420204080B0C0E1012141719',2,'2026-10-18 08:59:22.129903',23583085792180);
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 08:59:22.137477',X'420304080A0D0E1012141718',2,'2026-10-18 08:59:22.153687',234415327716486);
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 08:59:22.160673',X'420205090B0C0E1012141618',1,'2026-10-18 08:59:22.160678',181714254216780);
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 08:59:22.171633',X'420204090A0C0E1112141619',2,'2026-10-18 08:59:22.186821',164061293978605);
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 08:59:22.194333',X'420304080A0C0F1012141619',2,'2026-10-18 08:59:22.209417',5907162017299);
+INSERT INTO "match" VALUES(12,2,'random','2026-10-18 08:59:22.216663',X'420204080B0C0F1013141618',1,'2026-10-18 08:59:22.216668',244679040613435);
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',1.043976898087050813e+03);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.2093269966531956925e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',1.03210833652824044294e+03);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.17006512537199978398e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.38589756194914639304e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',1.00231395083663619516e+03);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.17386475942899119219e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.37663097988775371045e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',1.0151130685223672572e+03);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.1787043433453104626e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',NULL);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,9,2,0,3);
+INSERT INTO "player_stats" VALUES(2,8,2,2,4);
+INSERT INTO "player_stats" VALUES(4,8,2,1,4);
+INSERT INTO "player_stats" VALUES(5,9,1,2,3);
+INSERT INTO "player_stats" VALUES(6,11,3,3,1);
+INSERT INTO "player_stats" VALUES(7,7,1,1,5);
+INSERT INTO "player_stats" VALUES(8,7,1,2,5);
+INSERT INTO "player_stats" VALUES(9,10,1,2,2);
+INSERT INTO "player_stats" VALUES(10,10,1,1,2);
+INSERT INTO "player_stats" VALUES(11,8,1,2,4);
+INSERT INTO "player_stats" VALUES(12,6,0,0,6);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
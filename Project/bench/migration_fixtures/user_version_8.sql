@@ -0,0 +1,194 @@
+PRAGMA user_version = 8;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-4.9270331396987643302e+00);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,1.19656112342114937517e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,2.09036668162398555628e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-7.5052796736567337632e+00);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-2.72900276213843930852e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,1.2903048258363298828e+01);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(17,5,6,'Player 5');
+INSERT INTO "court_player" VALUES(18,5,10,'Player 9');
+INSERT INTO "court_player" VALUES(19,5,2,'Player 1');
+INSERT INTO "court_player" VALUES(20,5,1,'Player 0');
+INSERT INTO "court_player" VALUES(21,6,11,'Player 10');
+INSERT INTO "court_player" VALUES(22,6,9,'Player 8');
+INSERT INTO "court_player" VALUES(23,6,4,'Player 3');
+INSERT INTO "court_player" VALUES(24,6,5,'Player 4');
+INSERT INTO "court_player" VALUES(25,7,10,'Player 9');
+INSERT INTO "court_player" VALUES(26,7,11,'Player 10');
+INSERT INTO "court_player" VALUES(27,7,4,'Player 3');
+INSERT INTO "court_player" VALUES(28,7,5,'Player 4');
+INSERT INTO "court_player" VALUES(29,8,7,'Player 6');
+INSERT INTO "court_player" VALUES(30,8,8,'Player 7');
+INSERT INTO "court_player" VALUES(31,8,12,'Player 11');
+INSERT INTO "court_player" VALUES(32,8,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(33,9,11,'Player 10');
+INSERT INTO "court_player" VALUES(34,9,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(35,9,6,'Player 5');
+INSERT INTO "court_player" VALUES(36,9,10,'Player 9');
+INSERT INTO "court_player" VALUES(37,10,2,'Player 1');
+INSERT INTO "court_player" VALUES(38,10,9,'Player 8');
+INSERT INTO "court_player" VALUES(39,10,1,'Player 0');
+INSERT INTO "court_player" VALUES(40,10,12,'Player 11');
+INSERT INTO "court_player" VALUES(41,11,5,'Player 4');
+INSERT INTO "court_player" VALUES(42,11,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(43,11,4,'Player 3');
+INSERT INTO "court_player" VALUES(44,11,12,'Player 11');
+INSERT INTO "court_player" VALUES(45,12,8,'Player 7');
+INSERT INTO "court_player" VALUES(46,12,2,'Player 1');
+INSERT INTO "court_player" VALUES(47,12,7,'Player 6');
+INSERT INTO "court_player" VALUES(48,12,1,'Player 0');
+INSERT INTO "court_player" VALUES(49,13,10,'Player 9');
+INSERT INTO "court_player" VALUES(50,13,12,'Player 11');
+INSERT INTO "court_player" VALUES(51,13,7,'Player 6');
+INSERT INTO "court_player" VALUES(52,13,11,'Player 10');
+INSERT INTO "court_player" VALUES(53,14,9,'Player 8');
+INSERT INTO "court_player" VALUES(54,14,4,'Player 3');
+INSERT INTO "court_player" VALUES(55,14,5,'Player 4');
+INSERT INTO "court_player" VALUES(56,14,6,'Player 5');
+INSERT INTO "court_player" VALUES(57,15,7,'Player 6');
+INSERT INTO "court_player" VALUES(58,15,11,'Player 10');
+INSERT INTO "court_player" VALUES(59,15,4,'Player 3');
+INSERT INTO "court_player" VALUES(60,15,9,'Player 8');
+INSERT INTO "court_player" VALUES(61,16,1,'Player 0');
+INSERT INTO "court_player" VALUES(62,16,10,'Player 9');
+INSERT INTO "court_player" VALUES(63,16,2,'Player 1');
+INSERT INTO "court_player" VALUES(64,16,8,'Player 7');
+INSERT INTO "court_player" VALUES(65,17,1,'Player 0');
+INSERT INTO "court_player" VALUES(66,17,12,'Player 11');
+INSERT INTO "court_player" VALUES(67,17,6,'Player 5');
+INSERT INTO "court_player" VALUES(68,17,2,'Player 1');
+INSERT INTO "court_player" VALUES(69,18,10,'Player 9');
+INSERT INTO "court_player" VALUES(70,18,8,'Player 7');
+INSERT INTO "court_player" VALUES(71,18,7,'Player 6');
+INSERT INTO "court_player" VALUES(72,18,5,'Player 4');
+INSERT INTO "court_player" VALUES(73,19,6,'Player 5');
+INSERT INTO "court_player" VALUES(74,19,11,'Player 10');
+INSERT INTO "court_player" VALUES(75,19,7,'Player 6');
+INSERT INTO "court_player" VALUES(76,19,10,'Player 9');
+INSERT INTO "court_player" VALUES(77,20,9,'Player 8');
+INSERT INTO "court_player" VALUES(78,20,12,'Player 11');
+INSERT INTO "court_player" VALUES(79,20,8,'Player 7');
+INSERT INTO "court_player" VALUES(80,20,4,'Player 3');
+INSERT INTO "court_player" VALUES(81,21,11,'Player 10');
+INSERT INTO "court_player" VALUES(82,21,9,'Player 8');
+INSERT INTO "court_player" VALUES(83,21,1,'Player 0');
+INSERT INTO "court_player" VALUES(84,21,6,'Player 5');
+INSERT INTO "court_player" VALUES(85,22,2,'Player 1');
+INSERT INTO "court_player" VALUES(86,22,12,'Player 11');
+INSERT INTO "court_player" VALUES(87,22,5,'Player 4');
+INSERT INTO "court_player" VALUES(88,22,8,'Player 7');
+INSERT INTO "court_player" VALUES(89,23,11,'Player 10');
+INSERT INTO "court_player" VALUES(90,23,9,'Player 8');
+INSERT INTO "court_player" VALUES(91,23,7,'Player 6');
+INSERT INTO "court_player" VALUES(92,23,10,'Player 9');
+INSERT INTO "court_player" VALUES(93,24,12,'Player 11');
+INSERT INTO "court_player" VALUES(94,24,2,'Player 1');
+INSERT INTO "court_player" VALUES(95,24,6,'Player 5');
+INSERT INTO "court_player" VALUES(96,24,4,'Player 3');
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	seed BIGINT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(3,2,'random','2026-10-18 08:59:23.678370',X'42020407080A0C0F1112141619',2,'2026-10-18 08:59:23.678375',60951444525257);
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 08:59:23.692024',X'42030506080A0D0E1013141618',3,'2026-10-18 08:59:23.713095',174057095382577);
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 08:59:23.723060',X'42020406090B0C0F1112141618',3,'2026-10-18 08:59:23.740579',245723414929048);
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 08:59:23.748387',X'42020406080A0D0E1013151718',2,'2026-10-18 08:59:23.748397',191838932118851);
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 08:59:23.775717',X'420305080A0C0E1112141618',2,'2026-10-18 08:59:23.792350',57868727705202);
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 08:59:23.799426',X'420204080B0D0E1012141619',2,'2026-10-18 08:59:23.817128',247015879061307);
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 08:59:23.825200',X'420204090A0C0E1013141718',1,'2026-10-18 08:59:23.825207',179982410476737);
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 08:59:23.841952',X'420305080B0C0E1012141618',2,'2026-10-18 08:59:23.859373',225634502685597);
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 08:59:23.867746',X'420204090A0C0F1012151618',2,'2026-10-18 08:59:23.891902',185667348721003);
+INSERT INTO "match" VALUES(12,2,'random','2026-10-18 08:59:23.900424',X'420304080B0C0E1112141618',1,'2026-10-18 08:59:23.900430',209987199551979);
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',9.80529109092131761788e+02);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.21637393916623159386e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',1.03219369443762411719e+03);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.18219328492539693794e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.37909633318376017999e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',1003.11267225338);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.22492552050390031577e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.40557925042906708772e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',9.92494720326343212932e+02);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.19203970539307874782e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',1.37857444254246615852e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	rest_debt INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,8,0,2,4,1);
+INSERT INTO "player_stats" VALUES(2,8,3,1,4,0);
+INSERT INTO "player_stats" VALUES(4,8,2,1,4,0);
+INSERT INTO "player_stats" VALUES(5,7,1,2,5,1);
+INSERT INTO "player_stats" VALUES(6,9,0,1,3,0);
+INSERT INTO "player_stats" VALUES(7,9,1,2,3,0);
+INSERT INTO "player_stats" VALUES(8,7,3,2,5,1);
+INSERT INTO "player_stats" VALUES(9,8,2,1,4,0);
+INSERT INTO "player_stats" VALUES(10,9,0,1,3,0);
+INSERT INTO "player_stats" VALUES(11,9,0,1,3,0);
+INSERT INTO "player_stats" VALUES(12,10,2,2,2,0);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_rest_debt ON player_stats (rest_debt);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
@@ -0,0 +1,202 @@
+PRAGMA user_version = 9;
+BEGIN TRANSACTION;
+CREATE TABLE court (
+	id INTEGER NOT NULL, 
+	match_id INTEGER NOT NULL, 
+	court_number INTEGER NOT NULL, 
+	winning_team INTEGER, 
+	rating_delta FLOAT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(match_id) REFERENCES "match" (id) ON DELETE CASCADE
+);
+INSERT INTO "court" VALUES(5,3,1,NULL,NULL);
+INSERT INTO "court" VALUES(6,3,2,NULL,NULL);
+INSERT INTO "court" VALUES(7,4,1,NULL,NULL);
+INSERT INTO "court" VALUES(8,4,2,2,-2.08193480938839208253e+01);
+INSERT INTO "court" VALUES(9,5,1,NULL,NULL);
+INSERT INTO "court" VALUES(10,5,2,1,1.63683485189693342931e+01);
+INSERT INTO "court" VALUES(11,6,1,NULL,NULL);
+INSERT INTO "court" VALUES(12,6,2,NULL,NULL);
+INSERT INTO "court" VALUES(13,7,1,NULL,NULL);
+INSERT INTO "court" VALUES(14,7,2,1,2.37921549554419939917e+01);
+INSERT INTO "court" VALUES(15,8,1,NULL,NULL);
+INSERT INTO "court" VALUES(16,8,2,2,-8.04353449317133595286e+00);
+INSERT INTO "court" VALUES(17,9,1,NULL,NULL);
+INSERT INTO "court" VALUES(18,9,2,NULL,NULL);
+INSERT INTO "court" VALUES(19,10,1,NULL,NULL);
+INSERT INTO "court" VALUES(20,10,2,2,-1.21314794731447168625e+01);
+INSERT INTO "court" VALUES(21,11,1,NULL,NULL);
+INSERT INTO "court" VALUES(22,11,2,1,7.97963529752161093711e+00);
+INSERT INTO "court" VALUES(23,12,1,NULL,NULL);
+INSERT INTO "court" VALUES(24,12,2,NULL,NULL);
+CREATE TABLE court_player (
+	id INTEGER NOT NULL, 
+	court_id INTEGER NOT NULL, 
+	player_id INTEGER, 
+	player_name VARCHAR(100) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(court_id) REFERENCES court (id) ON DELETE CASCADE, 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE SET NULL
+);
+INSERT INTO "court_player" VALUES(17,5,1,'Player 0');
+INSERT INTO "court_player" VALUES(18,5,4,'Player 3');
+INSERT INTO "court_player" VALUES(19,5,11,'Player 10');
+INSERT INTO "court_player" VALUES(20,5,2,'Player 1');
+INSERT INTO "court_player" VALUES(21,6,12,'Player 11');
+INSERT INTO "court_player" VALUES(22,6,8,'Player 7');
+INSERT INTO "court_player" VALUES(23,6,9,'Player 8');
+INSERT INTO "court_player" VALUES(24,6,10,'Player 9');
+INSERT INTO "court_player" VALUES(25,7,4,'Player 3');
+INSERT INTO "court_player" VALUES(26,7,5,'Player 4');
+INSERT INTO "court_player" VALUES(27,7,9,'Player 8');
+INSERT INTO "court_player" VALUES(28,7,1,'Player 0');
+INSERT INTO "court_player" VALUES(29,8,2,'Player 1');
+INSERT INTO "court_player" VALUES(30,8,6,'Player 5');
+INSERT INTO "court_player" VALUES(31,8,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(32,8,7,'Player 6');
+INSERT INTO "court_player" VALUES(33,9,2,'Player 1');
+INSERT INTO "court_player" VALUES(34,9,12,'Player 11');
+INSERT INTO "court_player" VALUES(35,9,4,'Player 3');
+INSERT INTO "court_player" VALUES(36,9,1,'Player 0');
+INSERT INTO "court_player" VALUES(37,10,9,'Player 8');
+INSERT INTO "court_player" VALUES(38,10,10,'Player 9');
+INSERT INTO "court_player" VALUES(39,10,11,'Player 10');
+INSERT INTO "court_player" VALUES(40,10,8,'Player 7');
+INSERT INTO "court_player" VALUES(41,11,6,'Player 5');
+INSERT INTO "court_player" VALUES(42,11,7,'Player 6');
+INSERT INTO "court_player" VALUES(43,11,NULL,'Player 2');
+INSERT INTO "court_player" VALUES(44,11,12,'Player 11');
+INSERT INTO "court_player" VALUES(45,12,10,'Player 9');
+INSERT INTO "court_player" VALUES(46,12,4,'Player 3');
+INSERT INTO "court_player" VALUES(47,12,2,'Player 1');
+INSERT INTO "court_player" VALUES(48,12,5,'Player 4');
+INSERT INTO "court_player" VALUES(49,13,1,'Player 0');
+INSERT INTO "court_player" VALUES(50,13,5,'Player 4');
+INSERT INTO "court_player" VALUES(51,13,6,'Player 5');
+INSERT INTO "court_player" VALUES(52,13,9,'Player 8');
+INSERT INTO "court_player" VALUES(53,14,7,'Player 6');
+INSERT INTO "court_player" VALUES(54,14,10,'Player 9');
+INSERT INTO "court_player" VALUES(55,14,8,'Player 7');
+INSERT INTO "court_player" VALUES(56,14,11,'Player 10');
+INSERT INTO "court_player" VALUES(57,15,7,'Player 6');
+INSERT INTO "court_player" VALUES(58,15,9,'Player 8');
+INSERT INTO "court_player" VALUES(59,15,5,'Player 4');
+INSERT INTO "court_player" VALUES(60,15,4,'Player 3');
+INSERT INTO "court_player" VALUES(61,16,10,'Player 9');
+INSERT INTO "court_player" VALUES(62,16,8,'Player 7');
+INSERT INTO "court_player" VALUES(63,16,2,'Player 1');
+INSERT INTO "court_player" VALUES(64,16,12,'Player 11');
+INSERT INTO "court_player" VALUES(65,17,2,'Player 1');
+INSERT INTO "court_player" VALUES(66,17,5,'Player 4');
+INSERT INTO "court_player" VALUES(67,17,6,'Player 5');
+INSERT INTO "court_player" VALUES(68,17,12,'Player 11');
+INSERT INTO "court_player" VALUES(69,18,7,'Player 6');
+INSERT INTO "court_player" VALUES(70,18,8,'Player 7');
+INSERT INTO "court_player" VALUES(71,18,11,'Player 10');
+INSERT INTO "court_player" VALUES(72,18,1,'Player 0');
+INSERT INTO "court_player" VALUES(73,19,4,'Player 3');
+INSERT INTO "court_player" VALUES(74,19,8,'Player 7');
+INSERT INTO "court_player" VALUES(75,19,10,'Player 9');
+INSERT INTO "court_player" VALUES(76,19,2,'Player 1');
+INSERT INTO "court_player" VALUES(77,20,12,'Player 11');
+INSERT INTO "court_player" VALUES(78,20,7,'Player 6');
+INSERT INTO "court_player" VALUES(79,20,5,'Player 4');
+INSERT INTO "court_player" VALUES(80,20,9,'Player 8');
+INSERT INTO "court_player" VALUES(81,21,9,'Player 8');
+INSERT INTO "court_player" VALUES(82,21,10,'Player 9');
+INSERT INTO "court_player" VALUES(83,21,7,'Player 6');
+INSERT INTO "court_player" VALUES(84,21,4,'Player 3');
+INSERT INTO "court_player" VALUES(85,22,6,'Player 5');
+INSERT INTO "court_player" VALUES(86,22,2,'Player 1');
+INSERT INTO "court_player" VALUES(87,22,11,'Player 10');
+INSERT INTO "court_player" VALUES(88,22,1,'Player 0');
+INSERT INTO "court_player" VALUES(89,23,2,'Player 1');
+INSERT INTO "court_player" VALUES(90,23,12,'Player 11');
+INSERT INTO "court_player" VALUES(91,23,6,'Player 5');
+INSERT INTO "court_player" VALUES(92,23,7,'Player 6');
+INSERT INTO "court_player" VALUES(93,24,9,'Player 8');
+INSERT INTO "court_player" VALUES(94,24,8,'Player 7');
+INSERT INTO "court_player" VALUES(95,24,5,'Player 4');
+INSERT INTO "court_player" VALUES(96,24,10,'Player 9');
+CREATE TABLE data_version (
+	name VARCHAR(20) NOT NULL, 
+	version INTEGER NOT NULL, 
+	PRIMARY KEY (name)
+);
+INSERT INTO "data_version" VALUES('players',13);
+INSERT INTO "data_version" VALUES('ratings',8);
+CREATE TABLE "match" (
+	id INTEGER NOT NULL, 
+	num_courts INTEGER NOT NULL, 
+	match_type VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	roster_snapshot BLOB, 
+	version INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	seed BIGINT, 
+	seat_priority BLOB, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "match" VALUES(3,2,'random','2026-10-18 09:02:36.552594',X'42020407080B0D0F1012141618',2,'2026-10-18 09:02:36.552600',26810994765857,X'420A090804');
+INSERT INTO "match" VALUES(4,2,'random','2026-10-18 09:02:36.565383',X'42020406080A0C0E1112151719',3,'2026-10-18 09:02:36.581624',268451024869123,X'4207060503');
+INSERT INTO "match" VALUES(5,2,'random','2026-10-18 09:02:36.592463',X'42020407080B0D0F1012141618',3,'2026-10-18 09:02:36.608240',82859310142365,X'420C0B0A08');
+INSERT INTO "match" VALUES(6,2,'random','2026-10-18 09:02:36.616754',X'42030406080A0C0E1113141718',2,'2026-10-18 09:02:36.616759',104262871556710,X'4207060503');
+INSERT INTO "match" VALUES(7,2,'random','2026-10-18 09:02:36.644299',X'420205090A0C0E1012141619',2,'2026-10-18 09:02:36.659204',77674306302791,X'420B090801');
+INSERT INTO "match" VALUES(8,2,'random','2026-10-18 09:02:36.668178',X'420304080A0D0E1012141718',2,'2026-10-18 09:02:36.683781',204105974364567,X'420C0402');
+INSERT INTO "match" VALUES(9,2,'random','2026-10-18 09:02:36.692431',X'420204090A0C0E1013151618',1,'2026-10-18 09:02:36.692437',169233906764583,X'420B0601');
+INSERT INTO "match" VALUES(10,2,'random','2026-10-18 09:02:36.704722',X'420304080A0D0E1012141718',2,'2026-10-18 09:02:36.719396',24542112326343,X'420A0904');
+INSERT INTO "match" VALUES(11,2,'random','2026-10-18 09:02:36.728153',X'420204080B0C0E1112141619',2,'2026-10-18 09:02:36.758443',71791189695312,X'420B0601');
+INSERT INTO "match" VALUES(12,2,'random','2026-10-18 09:02:36.767171',X'420304090A0C0E1012141718',1,'2026-10-18 09:02:36.767178',49476629876179,X'420C0805');
+CREATE TABLE player (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	skill VARCHAR(20) NOT NULL, 
+	skill_rank INTEGER NOT NULL, 
+	gender VARCHAR(10) NOT NULL, 
+	rating FLOAT, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "player" VALUES(1,'Player 0','Beginner',2,'male',9.92020364702478445878e+02);
+INSERT INTO "player" VALUES(2,'Player 1','Intermediate',1,'female',1.18751572334954357761e+03);
+INSERT INTO "player" VALUES(4,'Player 3','Beginner',2,'female',1016.0);
+INSERT INTO "player" VALUES(5,'Player 4','Intermediate',1,'male',1.20381957782041013158e+03);
+INSERT INTO "player" VALUES(6,'Player 5','Advanced',0,'female',1.38716028720363760838e+03);
+INSERT INTO "player" VALUES(7,'Player 6','Beginner',2,'male',1.00879192522891582934e+03);
+INSERT INTO "player" VALUES(8,'Player 7','Intermediate',1,'female',1.15179596203241749207e+03);
+INSERT INTO "player" VALUES(9,'Player 8','Advanced',0,'male',1.42849982799211397835e+03);
+INSERT INTO "player" VALUES(10,'Player 9','Beginner',2,'female',1032.11696898124);
+INSERT INTO "player" VALUES(11,'Player 10','Intermediate',1,'male',1.16785986122806730231e+03);
+INSERT INTO "player" VALUES(12,'Player 11','Advanced',0,'female',1.40360015336729202321e+03);
+CREATE TABLE player_stats (
+	player_id INTEGER NOT NULL, 
+	games_played INTEGER NOT NULL, 
+	wins INTEGER NOT NULL, 
+	losses INTEGER NOT NULL, 
+	rests INTEGER NOT NULL, 
+	rest_debt INTEGER NOT NULL, 
+	PRIMARY KEY (player_id), 
+	FOREIGN KEY(player_id) REFERENCES player (id) ON DELETE CASCADE
+);
+INSERT INTO "player_stats" VALUES(1,7,0,1,5,1);
+INSERT INTO "player_stats" VALUES(2,10,2,2,2,0);
+INSERT INTO "player_stats" VALUES(4,8,1,0,4,1);
+INSERT INTO "player_stats" VALUES(5,9,2,1,3,0);
+INSERT INTO "player_stats" VALUES(6,8,1,1,4,0);
+INSERT INTO "player_stats" VALUES(7,10,2,3,2,0);
+INSERT INTO "player_stats" VALUES(8,8,0,3,4,0);
+INSERT INTO "player_stats" VALUES(9,9,2,0,3,0);
+INSERT INTO "player_stats" VALUES(10,9,2,1,3,0);
+INSERT INTO "player_stats" VALUES(11,7,1,3,5,1);
+INSERT INTO "player_stats" VALUES(12,8,2,1,4,0);
+CREATE INDEX ix_player_gender_name_id ON player (gender, name, id);
+CREATE INDEX ix_player_name_id ON player (name, id);
+CREATE INDEX ix_player_skill_rank_name_id ON player (skill_rank, name, id);
+CREATE INDEX ix_match_created_at ON "match" (created_at);
+CREATE INDEX ix_court_match_id ON court (match_id);
+CREATE INDEX ix_player_stats_games_played ON player_stats (games_played);
+CREATE INDEX ix_player_stats_losses ON player_stats (losses);
+CREATE INDEX ix_player_stats_rest_debt ON player_stats (rest_debt);
+CREATE INDEX ix_player_stats_rests ON player_stats (rests);
+CREATE INDEX ix_player_stats_wins ON player_stats (wins);
+CREATE INDEX ix_court_player_court_id ON court_player (court_id);
+COMMIT;
@@ -0,0 +1,240 @@
+"""Benchmark suite for matchmaking and the main request paths.
+
+Run from the Project folder:
+
+    python -m bench.suite                          # default sizes, summary + bench-report.json
+    python -m bench.suite --sizes 8,32,128 --output before.json
+    python -m bench.suite --compare before.json    # exit status 1 if anything got slower or chattier
+
+For every roster size a synthetic club is generated (see bench/synthetic.py)
+and two groups are measured:
+
+* matchmaking.<strategy>: each registered create_*_matches function on its
+  own, with courts for everyone, and no database involved.
+* request.<path>: POST /generate_matches, POST /regenerate_match/<id>,
+  GET /history and GET /match/<id> through the Flask test client, against a
+  temporary SQLite file loaded with the same club. The response cache is
+  cleared before the page requests so the full render is measured.
+
+Each entry records the best and median wall time over the repeats and the
+number of SQL statements one run executes. The report is JSON so two runs
+can be compared with --compare, which flags entries whose median time grew
+by more than --threshold (default 1.25x) or whose statement count grew at all.
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_tmp_dir = tempfile.mkdtemp(prefix='draft-bench-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_tmp_dir, 'bench.db')
+
+from sqlalchemy import event, insert
+
+from app import create_app, db
+from app.http_cache import get_cache
+from app.matchmaking import STRATEGIES
+from app.models import Player
+from app.players import invalidate_player_cache
+from bench.synthetic import synthetic_roster, player_rows, parse_mix
+
+app = create_app()
+
+DEFAULT_SIZES = [8, 32, 128, 512, 2000, 10000]
+DEFAULT_REQUEST_SIZES = [8, 32, 128, 512, 2000]
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 1.25
+
+
+class StatementCounter:
+    # Counts every SQL statement sent to the database while it is listening.
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def _measure(func, repeats, counter=None):
+    # Runs func `repeats` times. Returns (timings in ms, statements in the last run).
+    timings = []
+    statements = 0
+    for _ in range(repeats):
+        if counter is not None:
+            counter.count = 0
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+        if counter is not None:
+            statements = counter.count
+    return timings, statements
+
+
+def _entry(name, size, timings, statements=None, **extra):
+    entry = {
+        'name': name,
+        'size': size,
+        'best_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'runs': len(timings),
+    }
+    if statements is not None:
+        entry['statements'] = statements
+    entry.update(extra)
+    return entry
+
+
+def bench_matchmaking(sizes, repeats, skill_mix, gender_mix):
+    results = []
+    for size in sizes:
+        roster = synthetic_roster(size, skill_mix, gender_mix, seed=size)
+        courts = size // 4
+        for key, strategy in STRATEGIES.items():
+            if strategy.check(roster):
+                continue # e.g. 'mixed' without two men and two women.
+            timings, _ = _measure(lambda: strategy.create(roster, courts), repeats)
+            results.append(_entry(f'matchmaking.{key}', size, timings, courts=courts))
+    return results
+
+
+def _load_club(size, skill_mix, gender_mix):
+    # A fresh database holding only the synthetic club.
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    db.session.execute(insert(Player), player_rows(synthetic_roster(size, skill_mix, gender_mix, seed=size)))
+    db.session.commit()
+    invalidate_player_cache()
+    get_cache().clear()
+
+
+def bench_requests(sizes, repeats, skill_mix, gender_mix, match_type):
+    results = []
+    app.config['WTF_CSRF_ENABLED'] = False # The test client posts the forms without a token.
+    app.config['HISTORY_PRUNE_MODE'] = 'inline' # Count the prune as part of the request that triggers it.
+    client = app.test_client()
+    with app.app_context():
+        counter = StatementCounter(db.engine)
+        for size in sizes:
+            courts = size // 4
+            app.config['MAX_PLAYERS'] = size
+            app.config['MAX_COURTS'] = courts
+            _load_club(size, skill_mix, gender_mix)
+            client.get('/draft') # Loads the player count, like a real visit before generating.
+            last = {}
+
+            def generate():
+                response = client.post('/generate_matches', data={'num_courts': courts, 'match_type': match_type})
+                assert response.status_code == 302, response.status_code
+                last['match_id'] = int(response.headers['Location'].rsplit('/', 1)[1])
+
+            def regenerate():
+                response = client.post(f"/regenerate_match/{last['match_id']}")
+                assert response.status_code == 302, response.status_code
+                last['match_id'] = int(response.headers['Location'].rsplit('/', 1)[1]) # The old match is replaced.
+
+            def page(url):
+                def get():
+                    get_cache().clear()
+                    response = client.get(url)
+                    assert response.status_code == 200, response.status_code
+                return get
+
+            for name, func in (('generate_matches', generate), ('regenerate_match', regenerate)):
+                timings, statements = _measure(func, repeats, counter)
+                results.append(_entry(f'request.{name}', size, timings, statements, courts=courts))
+            for name, url in (('history', '/history'), ('match', f"/match/{last['match_id']}")):
+                timings, statements = _measure(page(url), repeats, counter)
+                results.append(_entry(f'request.{name}', size, timings, statements, courts=courts))
+            with client.session_transaction() as session:
+                session.pop('_flashes', None) # Flashed messages would otherwise pile up in the test session.
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old_report, new_report, threshold):
+    """Print how every entry changed. Returns the number of regressions."""
+    old = {(e['name'], e['size']): e for e in old_report['results']}
+    regressions = 0
+    print(f"{'benchmark':<34} {'size':>6} {'old ms':>9} {'new ms':>9} {'ratio':>6} {'SQL':>9}")
+    for entry in new_report['results']:
+        before = old.get((entry['name'], entry['size']))
+        if before is None:
+            continue
+        ratio = entry['median_ms'] / before['median_ms'] if before['median_ms'] else 1.0
+        slower = ratio > threshold
+        chattier = entry.get('statements', 0) > before.get('statements', 0)
+        regressions += slower or chattier
+        sql = f"{before.get('statements', '-')}->{entry.get('statements', '-')}"
+        flag = '  REGRESSION' if slower or chattier else ''
+        print(f"{entry['name']:<34} {entry['size']:>6} {before['median_ms']:>9.2f} {entry['median_ms']:>9.2f} "
+              f"{ratio:>5.2f}x {sql:>9}{flag}")
+    return regressions
+
+
+def _sizes(text):
+    return [int(size) for size in text.split(',') if size]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=_sizes, default=DEFAULT_SIZES, help='roster sizes for matchmaking')
+    parser.add_argument('--request-sizes', type=_sizes, default=DEFAULT_REQUEST_SIZES, help='roster sizes for requests')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--skill-mix', type=parse_mix, default=None, help='e.g. Beginner=4,Intermediate=4,Advanced=2')
+    parser.add_argument('--gender-mix', type=parse_mix, default=None, help='e.g. male=5,female=4,other=1')
+    parser.add_argument('--match-type', default='balanced', help='strategy used for the request benchmarks')
+    parser.add_argument('--output', default='bench-report.json')
+    parser.add_argument('--compare', metavar='REPORT', help='an earlier report to compare this run with')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = bench_matchmaking(args.sizes, args.repeats, args.skill_mix, args.gender_mix)
+    results += bench_requests(args.request_sizes, args.repeats, args.skill_mix, args.gender_mix, args.match_type)
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'repeats': args.repeats,
+            'match_type': args.match_type,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'benchmark':<34} {'size':>6} {'best ms':>9} {'median ms':>10} {'SQL':>5}")
+    for entry in results:
+        print(f"{entry['name']:<34} {entry['size']:>6} {entry['best_ms']:>9.2f} {entry['median_ms']:>10.2f} "
+              f"{entry.get('statements', ''):>5}")
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        print(f"{regressions} regression(s) against {args.compare}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
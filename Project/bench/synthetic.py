@@ -0,0 +1,46 @@
+"""Synthetic club rosters for the benchmarks.
+
+A roster is a list of RosterPlayer objects with names, skills, genders and
+ratings drawn from a seeded random generator, so the same arguments always
+give the same club. The skill and gender mixes are {value: weight}
+dictionaries and can also be parsed from strings like
+"Beginner=4,Intermediate=4,Advanced=2".
+"""
+import random
+
+from app.matchmaking import starting_rating
+from app.roster import RosterPlayer
+
+DEFAULT_SKILL_MIX = {'Beginner': 0.4, 'Intermediate': 0.4, 'Advanced': 0.2}
+DEFAULT_GENDER_MIX = {'male': 0.5, 'female': 0.45, 'other': 0.05}
+
+# How far a player's rating wanders from the starting rating of their skill tier.
+RATING_SPREAD = 80.0
+
+
+def parse_mix(text):
+    # "male=5,female=4,other=1" -> {'male': 5.0, 'female': 4.0, 'other': 1.0}
+    mix = {}
+    for part in text.split(','):
+        value, _, weight = part.partition('=')
+        mix[value.strip()] = float(weight)
+    return mix
+
+
+def synthetic_roster(size, skill_mix=None, gender_mix=None, seed=0, first_id=1):
+    """`size` made-up players with ids first_id, first_id + 1, ..."""
+    rng = random.Random(seed)
+    skill_mix = skill_mix or DEFAULT_SKILL_MIX
+    gender_mix = gender_mix or DEFAULT_GENDER_MIX
+    skills = rng.choices(list(skill_mix), weights=list(skill_mix.values()), k=size)
+    genders = rng.choices(list(gender_mix), weights=list(gender_mix.values()), k=size)
+    return [
+        RosterPlayer(first_id + i, f"Player {first_id + i}", skill, gender,
+                     round(starting_rating(skill) + rng.gauss(0, RATING_SPREAD), 1))
+        for i, (skill, gender) in enumerate(zip(skills, genders))
+    ]
+
+
+def player_rows(roster):
+    # The roster as rows for a bulk INSERT into the player table.
+    return [{'id': p.id, 'name': p.name, 'skill': p.skill, 'gender': p.gender, 'rating': p.rating} for p in roster]
@@ -0,0 +1,30 @@
+"""gunicorn settings for serving the app. From the Project folder:
+
+    pip install gunicorn gevent
+    APP_CONFIG=production SECRET_KEY=... gunicorn -c gunicorn.conf.py run:app
+
+Every open match page keeps a Server-Sent Events stream (/match/<id>/events,
+see app/live.py). With the default sync workers each stream would hold a
+worker for as long as the page is open. gevent workers run every request as
+a greenlet instead, so an idle stream costs a few kilobytes and one worker
+holds thousands of them next to the ordinary requests.
+
+Each worker process has its own live broker. Results recorded by another
+worker reach its viewers within LIVE_SYNC_SECONDS.
+"""
+import os
+
+bind = os.environ.get('BIND', '127.0.0.1:8000')
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_connections = 2000 # Open connections per worker, live streams included.
+
+# "Regenerate best" searches in worker processes (app/candidates.py); waiting for them lets the other greenlets
+# run. Searching inside the web worker would stop all of them for CANDIDATE_TIME_BUDGET, even on one CPU core.
+os.environ.setdefault('DRAFT_CANDIDATE_WORKERS', '2')
+
+
+def post_worker_init(worker):
+    # Start this worker's search processes before it takes requests (see candidates.start_pool).
+    from app.candidates import start_pool
+    start_pool(worker.wsgi)
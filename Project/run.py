@@ -1,5 +1,10 @@
-from app import app
+from app import create_app, init_db
+
+app = create_app()
 
 # init app
 if __name__ == '__main__':
+    # The development server sets up its own database. Deployments run `flask --app app init-db` once instead.
+    with app.app_context():
+        init_db()
     app.run(debug=True)
\ No newline at end of file